@@ -1,19 +1,21 @@
-from typing import TYPE_CHECKING, Dict, Type
+from typing import Dict, Type, Any, List
 import functools
+import argparse
+import shlex
+import copy
 import sys
+import os
 
 from peakrdl.plugins.exporter import ExporterSubcommandPlugin
 from peakrdl.config import schema
 from peakrdl.plugins.entry_points import get_entry_points
+from systemrdl.node import AddrmapNode
 
 from .exporter import RegblockExporter
+from .batch import RegblockBatchExporter, ExportJob, BatchExportError
 from .cpuif import CpuifBase, apb3, apb4, axi4lite, passthrough, avalon, obi, wishbone
 from .udps import ALL_UDPS
 
-if TYPE_CHECKING:
-    import argparse
-    from systemrdl.node import AddrmapNode
-
 class Exporter(ExporterSubcommandPlugin):
     short_desc = "Generate a SystemVerilog control/status register (CSR) block"
 
@@ -24,6 +26,7 @@ class Exporter(ExporterSubcommandPlugin):
         "default_reset": schema.Choice(["rst", "rst_n", "arst", "arst_n"]),
         "err_if_bad_addr": schema.Boolean(),
         "err_if_bad_rw": schema.Boolean(),
+        "template_cache_dir": schema.DirectoryPath(shall_exist=False),
     }
 
     @functools.lru_cache()
@@ -110,6 +113,15 @@ class Exporter(ExporterSubcommandPlugin):
             help="Generate a HWIF report file"
         )
 
+        arg_group.add_argument(
+            "--cost-report",
+            action="store_true",
+            default=False,
+            help="""Generate a JSON report that estimates the address decode,
+            readback and storage cost of the design, and recommends retiming
+            options if needed"""
+        )
+
         arg_group.add_argument(
             "--addr-width",
             type=int,
@@ -126,12 +138,33 @@ class Exporter(ExporterSubcommandPlugin):
             help="""Enable additional read path retiming. Good for register
             blocks with large readback fan-in"""
         )
+        arg_group.add_argument(
+            "--rt-read-fanin-stages",
+            type=int,
+            default=None,
+            help="""Number of retiming stages of the readback reduction tree.
+            Implies --rt-read-fanin. [1]"""
+        )
+        arg_group.add_argument(
+            "--rt-read-fanin-max",
+            type=int,
+            default=None,
+            help="""Target maximum fan-in of each readback reduction stage. The
+            number of stages is chosen to meet it. Implies --rt-read-fanin."""
+        )
         arg_group.add_argument(
             "--rt-read-response",
             action="store_true",
             default=False,
             help="Enable additional retiming stage between readback fan-in and cpu interface"
         )
+        arg_group.add_argument(
+            "--rt-decode",
+            action="store_true",
+            default=False,
+            help="""Enable a retiming stage after the address decoder. Good for
+            register blocks with many registers"""
+        )
         arg_group.add_argument(
             "--rt-external",
             help="""Retime outputs to external components. Specify a
@@ -163,7 +196,163 @@ class Exporter(ExporterSubcommandPlugin):
             performed to a read-only or write-only register."""
         )
 
+        arg_group.add_argument(
+            "--hier-addr-decode",
+            action="store_true",
+            default=False,
+            help="""Decode the base address of each regfile and addrmap once,
+            and only compare the local address bits of the registers within it."""
+        )
+
+        arg_group.add_argument(
+            "--minimize-addr-decode",
+            action="store_true",
+            default=False,
+            help="""Only compare the address bits that distinguish each register
+            from the rest of the map. Unmapped addresses may alias onto registers.
+            Has no effect if --err-if-bad-addr is set."""
+        )
+
+        arg_group.add_argument(
+            "--packed-decode-strobes",
+            action="store_true",
+            default=False,
+            help="""Represent the address decode strobes as a single packed
+            vector rather than a struct. Good for simulation and synthesis
+            runtime of very large register maps."""
+        )
+
+        arg_group.add_argument(
+            "--unique-case-decode",
+            action="store_true",
+            default=False,
+            help="""Decode and read back registers that are not within arrays
+            using a unique case statement, so that synthesis tools can build
+            parallel muxes."""
+        )
+
+        arg_group.add_argument(
+            "--and-or-readback",
+            action="store_true",
+            default=False,
+            help="""Build the readback mux by masking each register's value
+            with its address decode strobe and OR-reducing the results,
+            rather than comparing the read address again."""
+        )
+
+        arg_group.add_argument(
+            "--indexed-array-readback",
+            action="store_true",
+            default=False,
+            help="""Read back register arrays by decoding the element index
+            from the read address, rather than comparing the address of each
+            element."""
+        )
+
+        arg_group.add_argument(
+            "--dual-issue",
+            action="store_true",
+            default=False,
+            help="""Issue reads and writes on independent request channels,
+            each with its own address decoder, so that a read and a write can
+            be accepted in the same cycle. Only supported by the axi4-lite
+            CPU interfaces."""
+        )
+
+        arg_group.add_argument(
+            "--incremental",
+            action="store_true",
+            default=False,
+            help="""Skip generation if the design and options are unchanged
+            since the previous export, and only re-write output files whose
+            contents changed."""
+        )
+
+        arg_group.add_argument(
+            "--profile",
+            choices=["text", "json"],
+            default=None,
+            help="""Measure the time, memory and output size of each stage of
+            the export, and write a report in the chosen format to the output
+            directory."""
+        )
+
+        arg_group.add_argument(
+            "--batch",
+            metavar="FILE",
+            default=None,
+            help="""Export several addrmaps of the design in one run. Each line
+            of FILE lists the hierarchical path of an addrmap, its output
+            directory relative to -o, and optionally any regblock options that
+            differ from the ones given on the command line."""
+        )
+
+        arg_group.add_argument(
+            "--batch-workers",
+            type=int,
+            metavar="N",
+            default=None,
+            help="Maximum number of worker processes used by --batch. Defaults to the number of CPUs."
+        )
+
     def do_export(self, top_node: 'AddrmapNode', options: 'argparse.Namespace') -> None:
+        if options.batch:
+            self.do_batch_export(top_node, options)
+            return
+
+        x = RegblockExporter(template_cache_dir=self.cfg['template_cache_dir'])
+        x.export(
+            top_node,
+            options.output,
+            **self.get_export_kwargs(options)
+        )
+
+    def do_batch_export(self, top_node: 'AddrmapNode', options: 'argparse.Namespace') -> None:
+        """
+        Run all exports listed in the --batch file.
+
+        Each job's options start out as the ones given on the command line.
+        Any options on the job's line override them.
+        """
+        msg = top_node.env.msg
+        job_parser = argparse.ArgumentParser(prog=f"peakrdl regblock --batch {options.batch}", add_help=False)
+        self.add_exporter_arguments(job_parser)
+
+        jobs = [] # type: List[ExportJob]
+        with open(options.batch, "r", encoding="utf-8") as f:
+            for lineno, line in enumerate(f, start=1):
+                args = shlex.split(line, comments=True)
+                if not args:
+                    continue
+                if len(args) < 2:
+                    msg.fatal(f"{options.batch}:{lineno}: Expected an addrmap path and an output directory")
+
+                path, output_dir = args[:2]
+                node = top_node.parent.find_by_path(path)
+                if not isinstance(node, AddrmapNode):
+                    msg.fatal(f"{options.batch}:{lineno}: '{path}' is not an addrmap in the design")
+
+                job_options = job_parser.parse_args(args[2:], namespace=copy.copy(options))
+                jobs.append(ExportJob(
+                    node,
+                    os.path.join(options.output, output_dir),
+                    **self.get_export_kwargs(job_options)
+                ))
+
+        x = RegblockBatchExporter(
+            max_workers=options.batch_workers,
+            template_cache_dir=self.cfg['template_cache_dir'],
+        )
+        try:
+            x.export(jobs)
+        except (BatchExportError, ValueError) as e:
+            print(f"error: {e}", file=sys.stderr)
+            sys.exit(1)
+
+    def get_export_kwargs(self, options: 'argparse.Namespace') -> Dict[str, Any]:
+        """
+        Convert command line options to RegblockExporter.export() arguments
+        """
         cpuifs = self.get_cpuifs()
 
         retime_external_reg = False
@@ -206,25 +395,34 @@ class Exporter(ExporterSubcommandPlugin):
         else:
             raise RuntimeError
 
-
-        x = RegblockExporter()
-        x.export(
-            top_node,
-            options.output,
-            cpuif_cls=cpuifs[options.cpuif],
-            module_name=options.module_name,
-            package_name=options.package_name,
-            reuse_hwif_typedefs=(options.type_style == "lexical"),
-            retime_read_fanin=options.rt_read_fanin,
-            retime_read_response=options.rt_read_response,
-            retime_external_reg=retime_external_reg,
-            retime_external_regfile=retime_external_regfile,
-            retime_external_mem=retime_external_mem,
-            retime_external_addrmap=retime_external_addrmap,
-            generate_hwif_report=options.hwif_report,
-            address_width=options.addr_width,
-            default_reset_activelow=default_reset_activelow,
-            err_if_bad_addr=options.err_if_bad_addr or self.cfg['err_if_bad_addr'],
-            err_if_bad_rw=options.err_if_bad_rw or self.cfg['err_if_bad_rw'],
-            default_reset_async=default_reset_async,
-        )
+        return {
+            "cpuif_cls": cpuifs[options.cpuif],
+            "module_name": options.module_name,
+            "package_name": options.package_name,
+            "reuse_hwif_typedefs": (options.type_style == "lexical"),
+            "retime_read_fanin": options.rt_read_fanin,
+            "read_fanin_stages": options.rt_read_fanin_stages,
+            "max_read_fanin": options.rt_read_fanin_max,
+            "retime_read_response": options.rt_read_response,
+            "retime_decode": options.rt_decode,
+            "retime_external_reg": retime_external_reg,
+            "retime_external_regfile": retime_external_regfile,
+            "retime_external_mem": retime_external_mem,
+            "retime_external_addrmap": retime_external_addrmap,
+            "generate_hwif_report": options.hwif_report,
+            "generate_cost_report": options.cost_report,
+            "address_width": options.addr_width,
+            "default_reset_activelow": default_reset_activelow,
+            "err_if_bad_addr": options.err_if_bad_addr or self.cfg['err_if_bad_addr'],
+            "err_if_bad_rw": options.err_if_bad_rw or self.cfg['err_if_bad_rw'],
+            "default_reset_async": default_reset_async,
+            "hier_addr_decode": options.hier_addr_decode,
+            "minimize_addr_decode": options.minimize_addr_decode,
+            "packed_decode_strobes": options.packed_decode_strobes,
+            "unique_case_decode": options.unique_case_decode,
+            "and_or_readback": options.and_or_readback,
+            "indexed_array_readback": options.indexed_array_readback,
+            "dual_issue": options.dual_issue,
+            "incremental": options.incremental,
+            "profile": options.profile,
+        }
@@ -1,73 +1,189 @@
-from typing import TYPE_CHECKING, Union, List, Optional
+from typing import TYPE_CHECKING, Union, List, Optional, Iterator
 
-from systemrdl.node import FieldNode, RegNode, MemNode
+from systemrdl.node import FieldNode, RegNode, MemNode, RegfileNode, AddrmapNode
 from systemrdl.walker import WalkerAction
 
-from .utils import get_indexed_path
 from .struct_generator import RDLStructGenerator
-from .forloop_generator import RDLForLoopGenerator
+from .forloop_generator import RDLForLoopGenerator, Body, UniqueCaseBody
 from .identifier_filter import kw_filter as kwf
 from .sv_int import SVInt
+from .utils import clog2, is_pow2, get_bit_runs
+from .decode_minimizer import AddressDecodeMinimizer
+from .address_map import AddressRangeTable
+from .strobe_vector import DecodeStrobeVector
 
 if TYPE_CHECKING:
     from .exporter import RegblockExporter
-    from systemrdl.node import AddrmapNode, AddressableNode
-    from systemrdl.node import RegfileNode
+    from .walker import GeneratorPass, GeneratorResult
+    from systemrdl.node import AddressableNode
 
 class AddressDecode:
+    _strobe_struct: 'GeneratorResult'
+    _implementation: 'GeneratorResult'
+
     def __init__(self, exp:'RegblockExporter'):
         self.exp = exp
+        self._range_table = None # type: Optional[AddressRangeTable]
+        self._strobe_vector = None # type: Optional[DecodeStrobeVector]
 
     @property
     def top_node(self) -> 'AddrmapNode':
         return self.exp.ds.top_node
 
-    def get_strobe_struct(self) -> str:
-        struct_gen = DecodeStructGenerator()
-        s = struct_gen.get_struct(self.top_node, "decoded_reg_strb_t")
-        assert s is not None # guaranteed to have at least one reg
-        return s
+    @property
+    def range_table(self) -> AddressRangeTable:
+        """
+        Ranges of valid addresses and access types.
+        Only built if needed to detect bad accesses.
+        """
+        if self._range_table is None:
+            self._range_table = AddressRangeTable(self.top_node, self.exp.ds.addr_width)
+        return self._range_table
+
+    @property
+    def strobe_vector(self) -> DecodeStrobeVector:
+        """
+        Bit positions of the strobes, if they are packed into a single vector
+        """
+        if self._strobe_vector is None:
+            self._strobe_vector = DecodeStrobeVector(self.top_node)
+        return self._strobe_vector
+
+    def add_generators(self, gen_pass: 'GeneratorPass') -> None:
+        if not self.exp.ds.packed_decode_strobes:
+            self._strobe_struct = gen_pass.add_struct(DecodeStructGenerator(), "decoded_reg_strb_t")
+        self._implementation = gen_pass.add_content(DecodeLogicGenerator(self))
+
+    def get_valid_addr_implementation(self) -> str:
+        return self.range_table.get_valid_addr_implementation()
+
+    def get_valid_rw_implementation(self) -> str:
+        return self.range_table.get_valid_rw_implementation()
+
+    def get_strobe_struct(self) -> Iterator[str]:
+        if self.exp.ds.packed_decode_strobes:
+            return iter((self.strobe_vector.get_typedef("decoded_reg_strb_t"),))
+        assert not self._strobe_struct.is_empty # guaranteed to have at least one reg
+        return self._strobe_struct.iter_content()
 
-    def get_implementation(self) -> str:
-        gen = DecodeLogicGenerator(self)
-        s = gen.get_content(self.top_node)
-        assert s is not None
-        return s
+    def get_implementation(self) -> Iterator[str]:
+        assert not self._implementation.is_empty
+        return self._implementation.iter_content()
 
-    def get_access_strobe(self, node: Union[RegNode, FieldNode], reduce_substrobes: bool=True) -> str:
+    def get_access_strobe(self, node: Union[RegNode, FieldNode], reduce_substrobes: bool=True, subword_index: Optional[int]=None, read_channel: bool=False) -> str:
         """
         Returns the Verilog string that represents the register/field's access strobe.
+
+        If ``subword_index`` is set, only the strobe of that subword of a wide
+        register is returned.
+
+        If reads and writes are issued on independent channels, each channel
+        has its own strobes. ``read_channel`` selects the read channel's
+        strobes, otherwise the write channel's are returned.
         """
+        strb_name = self.get_strobe_name(read_channel)
         if isinstance(node, FieldNode):
             field = node
-            path = get_indexed_path(self.top_node, node.parent)
+            reg_node = node.parent
 
-            regwidth = node.parent.get_property('regwidth')
-            accesswidth = node.parent.get_property('accesswidth')
+            reg = self.exp.ds.descriptors.get_reg(node.parent)
+            regwidth = reg.regwidth
+            accesswidth = reg.accesswidth
             if regwidth > accesswidth:
                 # Is wide register.
                 # Determine the substrobe(s) relevant to this field
                 sidx_hi = field.msb // accesswidth
                 sidx_lo = field.lsb // accesswidth
-                if sidx_hi == sidx_lo:
-                    suffix = f"[{sidx_lo}]"
-                else:
-                    suffix = f"[{sidx_hi}:{sidx_lo}]"
-                path += suffix
-
+                strb = self._get_substrobes(strb_name, reg_node, sidx_hi, sidx_lo)
                 if sidx_hi != sidx_lo and reduce_substrobes:
-                    return "|decoded_reg_strb." + path
+                    return "|" + strb
+                return strb
+            return self._get_substrobes(strb_name, reg_node)
 
-        else:
-            path = get_indexed_path(self.top_node, node)
+        if subword_index is not None:
+            return self._get_substrobes(strb_name, node, subword_index, subword_index)
+        return self._get_substrobes(strb_name, node)
+
+    def get_write_strobe(self, node: Union[RegNode, FieldNode], reduce_substrobes: bool=True, subword_index: Optional[int]=None) -> str:
+        """
+        Returns the Verilog string that is asserted when the register/field is
+        written by software
+        """
+        strb = self.get_access_strobe(node, reduce_substrobes, subword_index)
+        if self.exp.ds.dual_issue:
+            # Write channel strobes are only set by writes
+            return strb
+        return f"{strb} && decoded_req_is_wr"
+
+    def get_read_strobe(self, node: Union[RegNode, FieldNode], reduce_substrobes: bool=True, subword_index: Optional[int]=None) -> str:
+        """
+        Returns the Verilog string that is asserted when the register/field is
+        read by software
+        """
+        if self.exp.ds.dual_issue:
+            # Read channel strobes are only set by reads
+            return self.get_access_strobe(node, reduce_substrobes, subword_index, read_channel=True)
+        strb = self.get_access_strobe(node, reduce_substrobes, subword_index)
+        return f"{strb} && !decoded_req_is_wr"
+
+    def get_strobe_name(self, read_channel: bool=False) -> str:
+        """
+        Name of the strobe struct that the field logic and readback use
+        """
+        if not self.exp.ds.dual_issue:
+            return "decoded_reg_strb"
+        if read_channel:
+            return "decoded_rd_strb"
+        return "decoded_wr_strb"
+
+    def _get_substrobes(self, strb_name: str, node: RegNode, sidx_hi: Optional[int]=None, sidx_lo: Optional[int]=None) -> str:
+        """
+        Strobes of the register's subwords sidx_hi down to sidx_lo, or all of
+        them if unspecified
+        """
+        if self.exp.ds.packed_decode_strobes:
+            if sidx_hi is None or sidx_lo is None:
+                sidx_hi = self.strobe_vector.get_entry(node).n_subwords - 1
+                sidx_lo = 0
+            idx = self.strobe_vector.get_index(node, sidx_lo)
+            if sidx_hi == sidx_lo:
+                return f"{strb_name}[{idx}]"
+            return f"{strb_name}[{idx} +: {sidx_hi - sidx_lo + 1}]"
+
+        path = self.exp.ds.indexed_paths.get_indexed_path(node)
+        if sidx_hi is not None and sidx_lo is not None:
+            if sidx_hi == sidx_lo:
+                path += f"[{sidx_lo}]"
+            else:
+                path += f"[{sidx_hi}:{sidx_lo}]"
+        return f"{strb_name}.{path}"
+
+    @property
+    def decode_strobe_name(self) -> str:
+        """
+        Name of the strobe struct that is assigned by the address decoder.
 
-        return "decoded_reg_strb." + path
+        If decode is retimed, this is the input of the retiming stage.
+        If reads and writes are issued on independent channels, the decoder is
+        a function that is called once per channel, and this is its output.
+        """
+        if self.exp.ds.dual_issue:
+            return "decoded_strb"
+        if self.exp.ds.retime_decode:
+            return "decoded_reg_strb_c"
+        return "decoded_reg_strb"
 
-    def get_external_block_access_strobe(self, node: 'AddressableNode') -> str:
+    def get_external_block_access_strobe(self, node: 'AddressableNode', strb_name: str = "decoded_reg_strb") -> str:
+        """
+        Returns the Verilog string that represents the external block's access
+        strobe, within the strobe struct strb_name
+        """
         assert node.external
         assert not isinstance(node, RegNode)
-        path = get_indexed_path(self.top_node, node)
-        return "decoded_reg_strb." + path
+        if self.exp.ds.packed_decode_strobes:
+            return f"{strb_name}[{self.strobe_vector.get_index(node)}]"
+        path = self.exp.ds.indexed_paths.get_indexed_path(node)
+        return f"{strb_name}.{path}"
 
 
 class DecodeStructGenerator(RDLStructGenerator):
@@ -123,6 +239,75 @@ class DecodeStructGenerator(RDLStructGenerator):
         pass
 
 
+class ScopeBody(Body):
+    """
+    Body that is wrapped in a begin/end block so that it can declare its own
+    local variables
+    """
+    def iter_chunks(self, prefix: str = "") -> Iterator[str]:
+        yield f"{prefix}begin\n"
+        yield from super().iter_chunks(prefix + "    ")
+        yield f"\n{prefix}end"
+
+
+class DecodeFrame:
+    """
+    Address space of a block that was decoded into a block-select signal.
+
+    Only the low ``addr_width`` bits of the address need to be compared within
+    the block.
+    """
+    def __init__(self, addr_width: int, base: int, stride_idx: int, select: str) -> None:
+        self.addr_width = addr_width
+
+        # Address of the block, relative to the top node
+        self.base = base
+
+        # Array dimensions from this index onwards are within the block
+        self.stride_idx = stride_idx
+
+        # Signal that is set if the address is within the block
+        self.select = select
+
+
+class ArrayIndexDecode:
+    """
+    Decode of a register array that computes the index of the accessed element
+    from the address, rather than comparing the address of each element.
+    """
+    def __init__(self, n_elements: int, iterator_idx: int, array_dimensions: List[int], stride_bits: int) -> None:
+        self.n_elements = n_elements
+
+        # Loop iterators of the array's dimensions start at this index
+        self.iterator_idx = iterator_idx
+        self.array_dimensions = array_dimensions
+
+        # Low address bits that select a location within an element
+        self.stride_bits = stride_bits
+
+        # Address offsets within an element that were decoded
+        self.subword_offsets = [] # type: List[int]
+
+    def get_element_index(self) -> str:
+        """
+        Flattened index of the current element within the one-hot strobe vector
+        """
+        terms = []
+        weight = self.n_elements
+        for i, dim in enumerate(self.array_dimensions):
+            weight //= dim
+            if weight == 1:
+                terms.append(f"i{self.iterator_idx + i}")
+            else:
+                terms.append(f"i{self.iterator_idx + i}*{weight}")
+        return " + ".join(terms)
+
+    def get_subword_match(self, subword_offset: int) -> Optional[str]:
+        if self.stride_bits == 0:
+            return None
+        return f"(arr_offset[{self.stride_bits-1}:0] == {SVInt(subword_offset, self.stride_bits)})"
+
+
 class DecodeLogicGenerator(RDLForLoopGenerator):
 
     def __init__(self, addr_decode: AddressDecode) -> None:
@@ -132,12 +317,64 @@ class DecodeLogicGenerator(RDLForLoopGenerator):
         # List of address strides for each dimension
         self._array_stride_stack = [] # type: List[int]
 
+        # Stack of blocks that were decoded hierarchically
+        self._frame_stack = [
+            DecodeFrame(self.addr_decode.exp.ds.addr_width, 0, 0, "cpuif_req_masked")
+        ]
+        # Whether each entered addressable node pushed a decode frame
+        self._pushed_frame_stack = [] # type: List[bool]
+
+        # Register array that is currently being decoded by index, if any
+        self._array_decode = None # type: Optional[ArrayIndexDecode]
+
+        # Unmapped addresses are don't-care if they are not flagged as an error
+        ds = self.addr_decode.exp.ds
+        self._minimizer = None # type: Optional[AddressDecodeMinimizer]
+        if ds.minimize_addr_decode and not ds.err_if_bad_addr:
+            self._minimizer = AddressDecodeMinimizer(ds.top_node, ds.addr_width)
+
+        # Number of register address comparator bits, and how many of those
+        # were removed by the minimizer
+        self._n_compare_bits = 0
+        self._n_removed_compare_bits = 0
+
+        # Registers that are not within arrays are decoded by a single case
+        # statement instead
+        self._case = None # type: Optional[UniqueCaseBody]
+        if ds.unique_case_decode:
+            self._case = UniqueCaseBody("cpuif_addr", ds.addr_width)
+
+        # Comparators are recorded if a cost report is generated
+        self._cost = self.addr_decode.exp.cost_report
+
+    @property
+    def current_frame(self) -> DecodeFrame:
+        return self._frame_stack[-1]
+
+    @property
+    def is_top_frame(self) -> bool:
+        return len(self._frame_stack) == 1
+
     def _add_addressablenode_decoding_flags(self, node: 'AddressableNode') -> None:
-        addr_lo = self._get_address_str(node)
-        addr_hi = f"{addr_lo} + {SVInt(node.size - 1, self.addr_decode.exp.ds.addr_width)}"
-        addr_decoding_str = f"cpuif_req_masked & (cpuif_addr >= {addr_lo}) & (cpuif_addr <= {addr_hi})"
+        if self.is_top_frame:
+            addr_lo = self._get_address_str(node)
+            addr_hi = f"{addr_lo} + {SVInt(node.size - 1, self.addr_decode.exp.ds.addr_width)}"
+            addr_decoding_str = f"cpuif_req_masked & (cpuif_addr >= {addr_lo}) & (cpuif_addr <= {addr_hi})"
+            self._add_comparators(self.current_frame.addr_width, 2)
+        else:
+            frame = self.current_frame
+            if node.size == 2 ** frame.addr_width:
+                # Block occupies the entire frame
+                addr_decoding_str = frame.select
+            else:
+                addr = self._get_local_addr_slice()
+                addr_lo = self._get_local_address_str(node)
+                addr_hi = f"{addr_lo} + {SVInt(node.size - 1, frame.addr_width)}"
+                addr_decoding_str = f"{frame.select} & ({addr} >= {addr_lo}) & ({addr} <= {addr_hi})"
+                self._add_comparators(frame.addr_width, 2)
+        if self._cost is not None:
+            self._cost.n_external_blocks += self.n_iterations
         rhs = addr_decoding_str
-        rhs_valid_addr = addr_decoding_str
         if isinstance(node, MemNode):
             readable = node.is_sw_readable
             writable = node.is_sw_writable
@@ -150,21 +387,15 @@ class DecodeLogicGenerator(RDLForLoopGenerator):
             else:
                 raise RuntimeError
         # Add decoding flags
-        self.add_content(f"{self.addr_decode.get_external_block_access_strobe(node)} = {rhs};")
+        self.add_content(f"{self._get_decode_strobe(node)} = {rhs};")
         self.add_content(f"is_external |= {rhs};")
-        # Also assign is_valid_adddr when err_if_bad_rw is set so that it can be used to catch
-        # invalid RW accesses on existing registers only.
-        if self.addr_decode.exp.ds.err_if_bad_addr or self.addr_decode.exp.ds.err_if_bad_rw:
-            self.add_content(f"is_valid_addr |= {rhs_valid_addr};")
-        if isinstance(node, MemNode):
-            if self.addr_decode.exp.ds.err_if_bad_rw:
-                self.add_content(f"is_valid_rw |= {rhs};")
-        else:
-            # For external register blocks, all accesses are valid RW
-            self.add_content(f"is_valid_rw |= {rhs_valid_addr};")
 
 
     def enter_AddressableComponent(self, node: 'AddressableNode') -> Optional[WalkerAction]:
+        if isinstance(node, RegNode) and self._is_index_decodable_array(node):
+            # Needs to be set up before the array's loops are entered
+            self._push_array_index_decode(node)
+
         super().enter_AddressableComponent(node)
 
         if node.array_dimensions:
@@ -180,12 +411,183 @@ class DecodeLogicGenerator(RDLForLoopGenerator):
 
         if node.external and not isinstance(node, RegNode):
             # Is an external block
+            self._pushed_frame_stack.append(False)
             self._add_addressablenode_decoding_flags(node)
             return WalkerAction.SkipDescendants
 
+        if (
+            self.addr_decode.exp.ds.hier_addr_decode
+            and isinstance(node, (RegfileNode, AddrmapNode))
+            and self._is_decodable_block(node)
+        ):
+            self._pushed_frame_stack.append(True)
+            self._push_block_select(node)
+        else:
+            self._pushed_frame_stack.append(False)
+
         return WalkerAction.Continue
 
 
+    def _get_relative_address(self, node: 'AddressableNode') -> int:
+        """
+        Address of the node's first element, relative to the current frame
+        """
+        return (
+            node.raw_absolute_address
+            - self.addr_decode.top_node.raw_absolute_address
+            - self.current_frame.base
+        )
+
+    def _is_decodable_block(self, node: 'AddressableNode') -> bool:
+        """
+        A block can be decoded using only the upper bits of the current frame's
+        address if it is smaller than the frame, and each of its possible
+        locations is aligned to its size.
+        """
+        frame = self.current_frame
+        k = clog2(node.size)
+        if k >= frame.addr_width:
+            return False
+        alignment = 2 ** k
+        if self._get_relative_address(node) % alignment:
+            return False
+        for stride in self._array_stride_stack[frame.stride_idx:]:
+            if stride % alignment:
+                return False
+        return True
+
+    def _push_block_select(self, node: 'AddressableNode') -> None:
+        frame = self.current_frame
+        k = clog2(node.size)
+        width = frame.addr_width - k
+
+        block_addr = str(SVInt(self._get_relative_address(node) >> k, width))
+        for i in range(frame.stride_idx, len(self._array_stride_stack)):
+            stride = self._array_stride_stack[i]
+            block_addr += f" + ({width})'(i{i}) * {SVInt(stride >> k, width)}"
+
+        select = f"blk_sel{len(self._frame_stack)}"
+        self._add_comparators(width)
+        self._stack.append(ScopeBody())
+        self.add_content(f"automatic logic {select};")
+        self.add_content(
+            f"{select} = {frame.select} & (cpuif_addr[{frame.addr_width-1}:{k}] == {block_addr});"
+        )
+        self._frame_stack.append(DecodeFrame(
+            k,
+            node.raw_absolute_address - self.addr_decode.top_node.raw_absolute_address,
+            len(self._array_stride_stack),
+            select,
+        ))
+
+    def _pop_block_select(self) -> None:
+        self._frame_stack.pop()
+        b = self._stack.pop()
+        self.current_loop.children.append(b)
+
+    def _get_local_addr_slice(self) -> str:
+        return f"cpuif_addr[{self.current_frame.addr_width-1}:0]"
+
+    def _get_local_address_str(self, node: 'AddressableNode', subword_offset: int=0) -> str:
+        """
+        Address of the node within the current frame
+        """
+        frame = self.current_frame
+        expr_width = frame.addr_width
+        a = str(SVInt(self._get_relative_address(node) + subword_offset, expr_width))
+        for i in range(frame.stride_idx, len(self._array_stride_stack)):
+            stride = self._array_stride_stack[i]
+            a += f" + ({expr_width})'(i{i}) * {SVInt(stride, expr_width)}"
+        return a
+
+
+    def _is_index_decodable_array(self, node: RegNode) -> bool:
+        if not node.array_dimensions:
+            return False
+        assert node.array_stride is not None
+        if not is_pow2(node.array_stride):
+            return False
+        # Index needs at least one address bit
+        return clog2(node.array_stride) < self.current_frame.addr_width
+
+    def _push_array_index_decode(self, node: RegNode) -> None:
+        assert node.array_dimensions is not None
+        assert node.array_stride is not None
+        frame = self.current_frame
+        width = frame.addr_width
+        stride_bits = clog2(node.array_stride)
+        n_elements = 1
+        for dim in node.array_dimensions:
+            n_elements *= dim
+
+        if self.is_top_frame:
+            addr = "cpuif_addr"
+            base = self._get_address_str(node)
+        else:
+            addr = self._get_local_addr_slice()
+            base = self._get_local_address_str(node)
+        if base == str(SVInt(0, width)):
+            offset = addr
+        elif " " in base:
+            offset = f"{addr} - ({base})"
+        else:
+            offset = f"{addr} - {base}"
+
+        index = f"arr_offset[{width-1}:{stride_bits}]"
+        index_width = width - stride_bits
+        if n_elements < 2 ** index_width:
+            in_range = f" & ({index} < {SVInt(n_elements, index_width)})"
+            self._add_comparators(index_width)
+        else:
+            in_range = ""
+
+        self._stack.append(ScopeBody())
+        self.add_content(f"automatic logic [{width-1}:0] arr_offset;")
+        self.add_content(f"automatic logic [{n_elements-1}:0] arr_strb;")
+        self.add_content(f"arr_offset = {offset};")
+        self.add_content(f"arr_strb = ({n_elements})'({frame.select}{in_range}) << {index};")
+
+        self._array_decode = ArrayIndexDecode(
+            n_elements,
+            len(self._array_stride_stack),
+            node.array_dimensions,
+            stride_bits,
+        )
+
+    def _pop_array_index_decode(self, node: RegNode) -> None:
+        """
+        Add the decoding flags of the whole array, once its loops were exited
+        """
+        assert self._array_decode is not None
+        if node.external:
+            matches = [
+                self._array_decode.get_subword_match(offset)
+                for offset in self._array_decode.subword_offsets
+            ]
+            if matches[0] is None:
+                addr_decoding_str = "|arr_strb"
+            elif len(matches) == 1:
+                addr_decoding_str = f"|arr_strb & {matches[0]}"
+            else:
+                addr_decoding_str = f"|arr_strb & ({' | '.join(str(m) for m in matches)})"
+            rhs = self._get_rw_qualified_decode(node, addr_decoding_str)
+            self.add_content(f"is_external |= {rhs};")
+            if self._cost is not None:
+                self._cost.n_external_regs += self._array_decode.n_elements * self.n_iterations
+
+        self._array_decode = None
+        b = self._stack.pop()
+        self.current_loop.children.append(b)
+
+    def _get_decode_strobe(self, node: 'AddressableNode', subword_index: Optional[int] = None) -> str:
+        if self.addr_decode.exp.ds.packed_decode_strobes:
+            idx = self.addr_decode.strobe_vector.get_index(node, subword_index or 0)
+            return f"{self.addr_decode.decode_strobe_name}[{idx}]"
+        path = self.addr_decode.exp.ds.indexed_paths.get_indexed_path(node)
+        if subword_index is None:
+            return f"{self.addr_decode.decode_strobe_name}.{path}"
+        return f"{self.addr_decode.decode_strobe_name}.{path}[{subword_index}]"
+
     def _get_address_str(self, node: 'AddressableNode', subword_offset: int=0) -> str:
         expr_width = self.addr_decode.exp.ds.addr_width
         a = str(SVInt(
@@ -202,37 +604,166 @@ class DecodeLogicGenerator(RDLForLoopGenerator):
         subword_index: Union[int, None] = None,
         subword_stride: Union[int, None] = None) -> None:
         if subword_index is None or subword_stride is None:
-            addr_decoding_str = f"cpuif_req_masked & (cpuif_addr == {self._get_address_str(node)})"
+            subword_offset = 0
+        else:
+            subword_offset = subword_index * subword_stride
+
+        if self._array_decode is not None:
+            # Element's strobe is selected by its index.
+            # Decoding flags are added for the entire array once it is exited
+            self._array_decode.subword_offsets.append(subword_offset)
+            addr_decoding_str = f"arr_strb[{self._array_decode.get_element_index()}]"
+            match = self._array_decode.get_subword_match(subword_offset)
+            if match is not None:
+                addr_decoding_str += f" & {match}"
+                # Match is shared by all elements of the array
+                if self._cost is not None:
+                    self._cost.decode_comparators.add(
+                        self._array_decode.stride_bits,
+                        self.n_iterations // self._array_decode.n_elements
+                    )
+            rhs = self._get_rw_qualified_decode(node, addr_decoding_str)
+            self.add_content(f"{self._get_decode_strobe(node, subword_index)} = {rhs};")
+            return
+
+        if self._case is not None and self.is_top_frame and not self._array_stride_stack:
+            rhs = self._get_rw_qualified_decode(node, self.current_frame.select)
+            address = self._get_relative_address(node) + subword_offset
+            self._case.add_item_content(address, f"{self._get_decode_strobe(node, subword_index)} = {rhs};")
+            if node.external:
+                self._case.add_item_content(address, f"is_external |= {rhs};")
+                self._count_external_reg(subword_index)
+            return
+
+        if self.current_frame.addr_width == 0:
+            # Block only contains this register
+            addr_decoding_str = self.current_frame.select
+        else:
+            compare = self._get_reg_addr_compare(node, subword_offset)
+            if compare is None:
+                addr_decoding_str = self.current_frame.select
+            else:
+                addr_decoding_str = f"{self.current_frame.select} & {compare}"
+        rhs = self._get_rw_qualified_decode(node, addr_decoding_str)
+        # Add decoding flags
+        self.add_content(f"{self._get_decode_strobe(node, subword_index)} = {rhs};")
+        if node.external:
+            self.add_content(f"is_external |= {rhs};")
+            self._count_external_reg(subword_index)
+
+    def _get_reg_addr_compare(self, node: RegNode, subword_offset: int) -> Optional[str]:
+        """
+        Comparison of the CPU interface address against the register's address
+        within the current frame.
+
+        If the decode is minimized, only the address bits that distinguish the
+        register from other mapped addresses are compared. Returns None if no
+        comparison is needed at all.
+        """
+        frame = self.current_frame
+        width = frame.addr_width
+        if self.is_top_frame:
+            addr = "cpuif_addr"
+            addr_str = self._get_address_str(node, subword_offset=subword_offset)
+        else:
+            addr = self._get_local_addr_slice()
+            addr_str = self._get_local_address_str(node, subword_offset=subword_offset)
+
+        if self._minimizer is None or node.external:
+            # External registers are never minimized. An unmapped address
+            # that aliased onto more than one of them would cause multiple
+            # external requests.
+            self._add_comparators(width)
+            return f"({addr} == {addr_str})"
+
+        full_mask = (1 << width) - 1
+        # Bits above the frame are already decoded by its block select
+        mask = self._minimizer.get_mask(node, subword_offset) & full_mask
+        n_instances = self._minimizer.get_n_instances(node)
+        self._n_compare_bits += width * n_instances
+        self._n_removed_compare_bits += (width - bin(mask).count("1")) * n_instances
+        self._add_comparators(bin(mask).count("1"))
+
+        if mask == full_mask:
+            return f"({addr} == {addr_str})"
+        if mask == 0:
+            # Register is the only thing mapped within the frame
+            return None
+
+        if len(self._array_stride_stack) > frame.stride_idx:
+            # Address depends on the array iterators
+            mask_str = SVInt(mask, width)
+            return f"(({addr} & {mask_str}) == (({addr_str}) & {mask_str}))"
+
+        # Compare only the relevant bit slices of the address
+        value = self._get_relative_address(node) + subword_offset
+        slices = []
+        masked_value = 0
+        masked_width = 0
+        for hi, lo in reversed(get_bit_runs(mask)):
+            if hi == lo:
+                slices.append(f"cpuif_addr[{hi}]")
+            else:
+                slices.append(f"cpuif_addr[{hi}:{lo}]")
+            n_bits = hi - lo + 1
+            masked_value = (masked_value << n_bits) | ((value >> lo) & ((1 << n_bits) - 1))
+            masked_width += n_bits
+        if len(slices) == 1:
+            lhs = slices[0]
         else:
-            addr_decoding_str = f"cpuif_req_masked & (cpuif_addr == {self._get_address_str(node, subword_offset=subword_index*subword_stride)})"
-        rhs_valid_addr = addr_decoding_str
+            lhs = "{" + ", ".join(slices) + "}"
+        return f"({lhs} == {SVInt(masked_value, masked_width)})"
+
+    def _add_comparators(self, width: int, count: int = 1) -> None:
+        """
+        Record address comparators of the current loop body for the cost report
+        """
+        if self._cost is not None:
+            self._cost.decode_comparators.add(width, count * self.n_iterations)
+
+    def _count_external_reg(self, subword_index: Optional[int]) -> None:
+        if self._cost is not None and not subword_index:
+            self._cost.n_external_regs += self.n_iterations
+
+    def detach(self) -> Optional[Body]:
+        if self._case is not None and self._case.items:
+            # Each case item compares the full address
+            if self._cost is not None:
+                self._cost.decode_comparators.add(self._case.width, len(self._case.items))
+
+            # Strobes that are not selected by the case statement are cleared
+            if self.addr_decode.exp.ds.packed_decode_strobes:
+                default = "'0"
+            else:
+                default = "'{default: '0}"
+            self._stack[0].children[0:0] = [
+                f"{self.addr_decode.decode_strobe_name} = {default};",
+                self._case,
+            ]
+        b = super().detach()
+        if b is not None and self._minimizer is not None:
+            b.children.insert(0,
+                f"// Minimized address decode removed {self._n_removed_compare_bits}"
+                f" of {self._n_compare_bits} register address comparator bits"
+            )
+        return b
+
+    def _get_rw_qualified_decode(self, node: RegNode, addr_decoding_str: str) -> str:
         readable = node.has_sw_readable
         writable = node.has_sw_writable
         if readable and writable:
-            rhs = addr_decoding_str
+            return addr_decoding_str
         elif readable and not writable:
-            rhs = f"{addr_decoding_str} & !cpuif_req_is_wr"
+            return f"{addr_decoding_str} & !cpuif_req_is_wr"
         elif not readable and writable:
-            rhs = f"{addr_decoding_str} & cpuif_req_is_wr"
+            return f"{addr_decoding_str} & cpuif_req_is_wr"
         else:
             raise RuntimeError
-        # Add decoding flags
-        if subword_index is None:
-            self.add_content(f"{self.addr_decode.get_access_strobe(node)} = {rhs};")
-        else:
-            self.add_content(f"{self.addr_decode.get_access_strobe(node)}[{subword_index}] = {rhs};")
-        if node.external:
-            self.add_content(f"is_external |= {rhs};")
-        # Also assign is_valid_adddr when err_if_bad_rw is set so that it can be used to catch
-        # invalid RW accesses on existing registers only.
-        if self.addr_decode.exp.ds.err_if_bad_addr or self.addr_decode.exp.ds.err_if_bad_rw:
-            self.add_content(f"is_valid_addr |= {rhs_valid_addr};")
-        if self.addr_decode.exp.ds.err_if_bad_rw:
-            self.add_content(f"is_valid_rw |= {rhs};")
 
     def enter_Reg(self, node: RegNode) -> None:
-        regwidth = node.get_property('regwidth')
-        accesswidth = node.get_property('accesswidth')
+        reg = self.addr_decode.exp.ds.descriptors.get_reg(node)
+        regwidth = reg.regwidth
+        accesswidth = reg.accesswidth
 
         if regwidth == accesswidth:
             self._add_reg_decoding_flags(node)
@@ -244,8 +775,14 @@ class DecodeLogicGenerator(RDLForLoopGenerator):
                 self._add_reg_decoding_flags(node, i, subword_stride)
 
     def exit_AddressableComponent(self, node: 'AddressableNode') -> None:
+        if self._pushed_frame_stack.pop():
+            self._pop_block_select()
+
         super().exit_AddressableComponent(node)
 
+        if isinstance(node, RegNode) and self._array_decode is not None:
+            self._pop_array_index_decode(node)
+
         if not node.array_dimensions:
             return
 
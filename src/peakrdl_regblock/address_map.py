@@ -0,0 +1,188 @@
+from typing import TYPE_CHECKING, List, Optional
+
+from systemrdl.node import RegNode, MemNode, AddressableNode
+
+from .sv_int import SVInt
+from .utils import clog2, is_pow2
+
+if TYPE_CHECKING:
+    from systemrdl.node import AddrmapNode
+
+
+class MappedSpan:
+    """
+    Range of addresses that is decoded to a single register subword or
+    external block.
+
+    Only the addresses within the span that are aligned to ``granule`` are
+    valid. Registers are only accessible at their exact address, whereas all
+    addresses of an external block are valid.
+    """
+    def __init__(self, node: AddressableNode, lo: int, hi: int, granule: int, subword_offset: int = 0) -> None:
+        self.node = node
+        self.lo = lo
+        self.hi = hi
+        self.granule = granule
+        self.subword_offset = subword_offset
+
+        if isinstance(node, RegNode):
+            self.readable = node.has_sw_readable
+            self.writable = node.has_sw_writable
+        elif isinstance(node, MemNode):
+            self.readable = node.is_sw_readable
+            self.writable = node.is_sw_writable
+        else:
+            self.readable = True
+            self.writable = True
+
+
+def get_mapped_spans(top_node: 'AddrmapNode') -> List[MappedSpan]:
+    """
+    Get the spans of all unrolled registers and external blocks, in address
+    order. Addresses are relative to the top node.
+    """
+    spans = [] # type: List[MappedSpan]
+    _scan_spans(top_node, top_node, spans)
+    spans.sort(key=lambda span: span.lo)
+    return spans
+
+def _scan_spans(top_node: 'AddrmapNode', node: AddressableNode, spans: List[MappedSpan]) -> None:
+    for child in node.children(unroll=True):
+        if not isinstance(child, AddressableNode):
+            continue
+
+        address = child.absolute_address - top_node.absolute_address
+        if isinstance(child, RegNode):
+            accesswidth = child.get_property("accesswidth")
+            n_subwords = child.get_property("regwidth") // accesswidth
+            granule = accesswidth // 8
+            for i in range(n_subwords):
+                subword_offset = i * granule
+                lo = address + subword_offset
+                if lo % granule:
+                    # Unaligned. Span only covers the exact address
+                    spans.append(MappedSpan(child, lo, lo, 1, subword_offset))
+                else:
+                    spans.append(MappedSpan(child, lo, lo + granule - 1, granule, subword_offset))
+        elif child.external:
+            spans.append(MappedSpan(child, address, address + child.size - 1, 1))
+        else:
+            _scan_spans(top_node, child, spans)
+
+
+class AddressRange:
+    def __init__(self, lo: int, hi: int, granule: int = 1) -> None:
+        self.lo = lo
+        self.hi = hi
+        self.granule = granule
+
+
+class AddressRangeTable:
+    """
+    Coalesced ranges of valid addresses and access types of the register block.
+
+    This allows bad addresses and bad read/write accesses to be detected with
+    a handful of range checks, rather than repeating the entire address
+    decode.
+    """
+    def __init__(self, top_node: 'AddrmapNode', addr_width: int) -> None:
+        self.addr_width = addr_width
+
+        # Ranges that contain all valid addresses
+        self.valid_ranges = [] # type: List[AddressRange]
+
+        # Ranges of valid addresses that cannot be read or written.
+        # These may extend across unmapped addresses since they only need to
+        # be exact for valid addresses.
+        self.unreadable_ranges = [] # type: List[AddressRange]
+        self.unwritable_ranges = [] # type: List[AddressRange]
+
+        # Read-only and write-only registers may share the same address.
+        # Combine their access types.
+        locations = [] # type: List[MappedSpan]
+        for span in get_mapped_spans(top_node):
+            if locations and locations[-1].lo == span.lo:
+                prev = locations[-1]
+                prev.hi = max(prev.hi, span.hi)
+                prev.readable |= span.readable
+                prev.writable |= span.writable
+            else:
+                locations.append(span)
+
+        for span in locations:
+            prev_range = self.valid_ranges[-1] if self.valid_ranges else None
+            if prev_range is not None and prev_range.granule == span.granule and prev_range.hi + 1 == span.lo:
+                prev_range.hi = span.hi
+            else:
+                self.valid_ranges.append(AddressRange(span.lo, span.hi, span.granule))
+
+        prev_readable = True
+        prev_writable = True
+        for span in locations:
+            if not span.readable:
+                if prev_readable:
+                    self.unreadable_ranges.append(AddressRange(span.lo, span.hi))
+                else:
+                    self.unreadable_ranges[-1].hi = span.hi
+            if not span.writable:
+                if prev_writable:
+                    self.unwritable_ranges.append(AddressRange(span.lo, span.hi))
+                else:
+                    self.unwritable_ranges[-1].hi = span.hi
+            prev_readable = span.readable
+            prev_writable = span.writable
+
+    def get_range_check(self, r: AddressRange) -> Optional[str]:
+        """
+        Expression that checks if cpuif_addr is within the range.
+        Returns None if all addresses are within it.
+        """
+        terms = []
+        size = r.hi - r.lo + 1
+        if size == r.granule:
+            # Single valid address
+            return f"(cpuif_addr == {SVInt(r.lo, self.addr_width)})"
+        if is_pow2(size) and r.lo % size == 0:
+            # Range is an aligned block. Only upper bits need to be compared
+            k = clog2(size)
+            if k < self.addr_width:
+                width = self.addr_width - k
+                terms.append(f"(cpuif_addr[{self.addr_width-1}:{k}] == {SVInt(r.lo >> k, width)})")
+        else:
+            if r.lo != 0:
+                terms.append(f"(cpuif_addr >= {SVInt(r.lo, self.addr_width)})")
+            if r.hi != 2 ** self.addr_width - 1:
+                terms.append(f"(cpuif_addr <= {SVInt(r.hi, self.addr_width)})")
+
+        if r.granule > 1:
+            k = clog2(r.granule)
+            terms.append(f"(cpuif_addr[{k-1}:0] == {SVInt(0, k)})")
+
+        if not terms:
+            return None
+        return " & ".join(terms)
+
+    def get_valid_addr_implementation(self) -> str:
+        lines = ["is_valid_addr = '0;"]
+        for r in self.valid_ranges:
+            check = self.get_range_check(r)
+            if check is None:
+                return "is_valid_addr = '1;"
+            lines.append(f"is_valid_addr |= {check};")
+        return "\n".join(lines)
+
+    def get_valid_rw_implementation(self) -> str:
+        lines = ["is_valid_rw = '1;"]
+        for r in self.unreadable_ranges:
+            check = self.get_range_check(r)
+            if check is None:
+                lines.append("is_valid_rw &= cpuif_req_is_wr;")
+            else:
+                lines.append(f"is_valid_rw &= ~(!cpuif_req_is_wr & {check});")
+        for r in self.unwritable_ranges:
+            check = self.get_range_check(r)
+            if check is None:
+                lines.append("is_valid_rw &= !cpuif_req_is_wr;")
+            else:
+                lines.append(f"is_valid_rw &= ~(cpuif_req_is_wr & {check});")
+        return "\n".join(lines)
@@ -0,0 +1,202 @@
+import os
+import traceback
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Union, Any, List, Optional, Tuple, Dict
+
+from systemrdl.node import RootNode
+from systemrdl.messages import RDLCompileError
+
+from .exporter import RegblockExporter
+from .identifier_filter import kw_filter as kwf
+
+if TYPE_CHECKING:
+    from systemrdl.node import AddrmapNode
+
+
+class ExportJob:
+    """
+    A single regblock export that is part of a batch.
+
+    Parameters
+    ----------
+    node: AddrmapNode
+        Top-level SystemRDL node to export.
+    output_dir: str
+        Path to the output directory where generated SystemVerilog will be written.
+    **kwargs
+        Any other options accepted by :meth:`RegblockExporter.export`.
+    """
+    def __init__(self, node: Union[RootNode, 'AddrmapNode'], output_dir: str, **kwargs: Any) -> None:
+        self.node = node
+        self.output_dir = output_dir
+        self.kwargs = kwargs
+
+    @property
+    def top_node(self) -> 'AddrmapNode':
+        if isinstance(self.node, RootNode):
+            return self.node.top
+        return self.node
+
+    @property
+    def name(self) -> str:
+        return self.top_node.get_path()
+
+    @property
+    def module_name(self) -> str:
+        return self.kwargs.get("module_name", None) or kwf(self.top_node.inst_name)
+
+    @property
+    def package_name(self) -> str:
+        return self.kwargs.get("package_name", None) or (self.module_name + "_pkg")
+
+    @property
+    def module_path(self) -> str:
+        return os.path.normpath(os.path.join(self.output_dir, self.module_name))
+
+    @property
+    def package_path(self) -> str:
+        return os.path.normpath(os.path.join(self.output_dir, self.package_name))
+
+
+class BatchExportError(Exception):
+    """
+    Raised once all jobs of a batch have completed, if any of them failed.
+
+    ``failures`` lists each failed job along with its error message, in the
+    same order that the jobs were given.
+    """
+    def __init__(self, failures: List[Tuple[ExportJob, str]]) -> None:
+        self.failures = failures
+        lines = [f"{len(failures)} regblock export(s) failed:"]
+        for job, err in failures:
+            lines.append(f"  * {job.name} -> {job.output_dir}: {err}")
+        super().__init__("\n".join(lines))
+
+
+# Jobs of the batch that is currently being run.
+# Worker processes are forked, so they inherit the already elaborated design
+# rather than having to pickle it.
+_batch_jobs = [] # type: List[ExportJob]
+_batch_template_cache_dir = None # type: Optional[str]
+
+def _run_job(idx: int) -> Optional[str]:
+    job = _batch_jobs[idx]
+    msg = job.top_node.env.msg
+    had_error = msg.had_error
+    try:
+        exporter = RegblockExporter(template_cache_dir=_batch_template_cache_dir)
+        exporter.export(job.node, job.output_dir, **job.kwargs)
+    except RDLCompileError as e:
+        # Details were already reported by the compiler's message handler
+        return str(e)
+    except Exception: # pylint: disable=broad-except
+        return traceback.format_exc().rstrip()
+    finally:
+        # Errors of this job must not fail the jobs that are run after it in
+        # the same process
+        msg.had_error = had_error
+    return None
+
+
+def _run_jobs_in_pool(idxs: List[int], n_workers: int) -> Tuple[Dict[int, Optional[str]], List[int]]:
+    """
+    Run jobs in a pool of forked worker processes.
+
+    Returns the result of each job that completed, and the jobs that were lost.
+    If a worker process dies, the pool is no longer usable, and all of its
+    jobs that had not completed yet raise BrokenProcessPool.
+    """
+    results = {} # type: Dict[int, Optional[str]]
+    lost = [] # type: List[int]
+    with ProcessPoolExecutor(n_workers, multiprocessing.get_context("fork")) as pool:
+        futures = [(idx, pool.submit(_run_job, idx)) for idx in idxs]
+        for idx, future in futures:
+            try:
+                results[idx] = future.result()
+            except BrokenProcessPool:
+                lost.append(idx)
+            except Exception: # pylint: disable=broad-except
+                results[idx] = traceback.format_exc().rstrip()
+    return results, lost
+
+
+class RegblockBatchExporter:
+    """
+    Runs many regblock exports from a single compiled SystemRDL design.
+
+    The design only needs to be compiled once. Exports are distributed across
+    a pool of worker processes.
+    """
+    def __init__(self, **kwargs: Any) -> None:
+        """
+        Parameters
+        ----------
+        max_workers: int
+            Maximum number of worker processes. Defaults to the number of CPUs.
+            Exports are run sequentially in the current process if this is 1,
+            or if the platform is unable to fork worker processes.
+        template_cache_dir: str
+            If set, compiled Jinja templates are cached in this directory so
+            that they can be re-used across processes.
+        """
+        self.max_workers = kwargs.pop("max_workers", None) or os.cpu_count() or 1 # type: int
+        self.template_cache_dir = kwargs.pop("template_cache_dir", None) # type: Optional[str]
+
+        # Check for stray kwargs
+        if kwargs:
+            raise TypeError(f"got an unexpected keyword argument '{list(kwargs.keys())[0]}'")
+
+
+    def export(self, jobs: List[ExportJob]) -> None:
+        """
+        Run all export jobs.
+
+        Every job is run, even if others fail. Once complete, a
+        :class:`BatchExportError` is raised if any of the jobs failed.
+
+        Parameters
+        ----------
+        jobs: List[ExportJob]
+            Exports to run.
+        """
+        # Jobs that write the same files would clobber each other
+        output_paths = set()
+        for job in jobs:
+            for kind, path in (("module", job.module_path), ("package", job.package_path)):
+                if path in output_paths:
+                    raise ValueError(
+                        f"More than one export job writes {kind} '{path}'"
+                    )
+                output_paths.add(path)
+
+        global _batch_jobs, _batch_template_cache_dir # pylint: disable=global-statement
+        _batch_jobs = list(jobs)
+        _batch_template_cache_dir = self.template_cache_dir
+
+        try:
+            n_workers = min(self.max_workers, len(_batch_jobs))
+            if n_workers > 1 and "fork" in multiprocessing.get_all_start_methods():
+                results, lost = _run_jobs_in_pool(list(range(len(_batch_jobs))), n_workers)
+
+                # Jobs that were lost because a worker process died are re-run
+                # in a process of their own, so that the job that killed its
+                # worker can be told apart from the others.
+                for idx in lost:
+                    retry_results, _ = _run_jobs_in_pool([idx], 1)
+                    results[idx] = retry_results.get(idx, "Worker process terminated abruptly")
+            else:
+                results = {idx: _run_job(idx) for idx in range(len(_batch_jobs))}
+
+            failures = [] # type: List[Tuple[ExportJob, str]]
+            for idx, job in enumerate(_batch_jobs):
+                err = results[idx]
+                if err is not None:
+                    failures.append((job, err))
+        finally:
+            _batch_jobs = []
+            _batch_template_cache_dir = None
+
+        if failures:
+            raise BatchExportError(failures)
@@ -0,0 +1,246 @@
+import json
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, List, Any, Iterable
+
+from .utils import clog2
+
+if TYPE_CHECKING:
+    from .exporter import RegblockExporter
+
+# Readback OR-tree depth, in levels of 2-input gates, above which an
+# additional read fan-in retiming stage is recommended.
+# This corresponds to more than 64 inputs per readback data bit.
+READ_FANIN_DEPTH_LIMIT = 6
+
+# Total logic depth of the readback path, from the address to the read
+# response, above which a read response retiming stage is recommended.
+READ_RESPONSE_DEPTH_LIMIT = 10
+
+
+def get_or_tree_depth(n_inputs: int) -> int:
+    """
+    Levels of 2-input gates needed to reduce n_inputs signals
+    """
+    return clog2(max(n_inputs, 1))
+
+
+class ComparatorStats:
+    """
+    Number of address comparators, by the number of address bits they compare
+    """
+    def __init__(self) -> None:
+        self.by_width = {} # type: Dict[int, int]
+
+    def add(self, width: int, count: int = 1) -> None:
+        if width <= 0 or count <= 0:
+            return
+        self.by_width[width] = self.by_width.get(width, 0) + count
+
+    @property
+    def count(self) -> int:
+        return sum(self.by_width.values())
+
+    @property
+    def n_bits(self) -> int:
+        return sum(width * count for width, count in self.by_width.items())
+
+    @property
+    def max_width(self) -> int:
+        return max(self.by_width.keys(), default=0)
+
+    @property
+    def depth(self) -> int:
+        """
+        Logic depth of the widest comparator: one level of XNOR gates, followed
+        by an AND-tree
+        """
+        if not self.by_width:
+            return 0
+        return 1 + clog2(self.max_width)
+
+    def scaled(self, n: int) -> 'ComparatorStats':
+        """
+        Stats of n copies of the same comparators
+        """
+        stats = ComparatorStats()
+        for width, count in self.by_width.items():
+            stats.add(width, count * n)
+        return stats
+
+    def to_dict(self) -> Dict[str, Any]:
+        return OrderedDict([
+            ("count", self.count),
+            ("total_bits", self.n_bits),
+            ("max_width", self.max_width),
+            ("by_width", OrderedDict(
+                (str(width), self.by_width[width]) for width in sorted(self.by_width.keys())
+            )),
+        ])
+
+
+class CostReport:
+    """
+    Estimate of the logic that the generated register block implies.
+
+    The address decode and readback generators record their comparators and
+    readback mux inputs while the design is traversed. Flop counts are taken
+    from the storage structs once generation is complete.
+    """
+    def __init__(self, exp: 'RegblockExporter') -> None:
+        self.exp = exp
+
+        self.decode_comparators = ComparatorStats()
+        self.readback_comparators = ComparatorStats()
+
+        # Readback data bits that are driven from each readable address.
+        # Each address is a separate input to the readback mux.
+        self.readback_masks = {} # type: Dict[int, int]
+
+        self.n_external_regs = 0
+        self.n_external_blocks = 0
+
+    def add_readback_input(self, addresses: Iterable[int], high: int, low: int) -> None:
+        mask = ((1 << (high + 1)) - 1) & ~((1 << low) - 1)
+        for address in addresses:
+            self.readback_masks[address] = self.readback_masks.get(address, 0) | mask
+
+    #---------------------------------------------------------------------------
+    def _get_inputs_per_bit(self, masks: Iterable[int]) -> List[int]:
+        counts = [0] * self.exp.cpuif.data_width
+        for mask in masks:
+            bit = 0
+            while mask:
+                if mask & 1:
+                    counts[bit] += 1
+                mask >>= 1
+                bit += 1
+        return counts
+
+    def _get_readback_stats(self) -> Dict[str, Any]:
+        ds = self.exp.ds
+        inputs_per_bit = self._get_inputs_per_bit(self.readback_masks.values())
+        max_inputs = max(inputs_per_bit, default=0)
+
+        stages = []
+        if ds.retime_read_fanin:
+            # First stage reduces each bin of addresses that share the same high
+            # address bits.
+            groups = self.exp.readback.get_address_groups()
+            bins = {} # type: Dict[int, List[int]]
+            for address, mask in self.readback_masks.items():
+                bins.setdefault(address >> groups[0], []).append(mask)
+            max_bin_inputs = 0
+            for masks in bins.values():
+                max_bin_inputs = max(max_bin_inputs, *self._get_inputs_per_bit(masks))
+            stages.append(OrderedDict([
+                ("name", "fanin"),
+                ("max_inputs_per_bit", max_bin_inputs),
+                ("depth", self.readback_comparators.depth + get_or_tree_depth(max_bin_inputs)),
+            ]))
+            # Each subsequent stage selects between the non-empty bins using
+            # the next group of address bits
+            partition = self.exp.readback.partition
+            lsb = groups[0]
+            for i, width in enumerate(groups[1:], start=1):
+                n_inputs = partition.get_fanin(lsb, width)
+                stages.append(OrderedDict([
+                    ("name", "bin_select" if i == len(groups) - 1 else "bin_reduce"),
+                    ("max_inputs_per_bit", n_inputs),
+                    ("depth", get_or_tree_depth(n_inputs)),
+                ]))
+                lsb += width
+        else:
+            stages.append(OrderedDict([
+                ("name", "fanin"),
+                ("max_inputs_per_bit", max_inputs),
+                ("depth", self.readback_comparators.depth + get_or_tree_depth(max_inputs)),
+            ]))
+
+        return OrderedDict([
+            ("n_inputs", len(self.readback_masks)),
+            ("max_inputs_per_bit", max_inputs),
+            ("inputs_per_bit", inputs_per_bit),
+            ("or_tree_depth", get_or_tree_depth(max_inputs)),
+            ("comparators", self.readback_comparators.to_dict()),
+            ("stages", stages),
+        ])
+
+    def _get_flop_counts(self) -> Dict[str, int]:
+        ds = self.exp.ds
+        flops = OrderedDict() # type: OrderedDict[str, int]
+        flops["field_storage"] = self.exp.field_logic.get_storage_n_bits()
+        if ds.has_buffered_write_regs:
+            flops["wbuf_storage"] = self.exp.write_buffering.get_storage_n_bits()
+        else:
+            flops["wbuf_storage"] = 0
+        if ds.has_buffered_read_regs:
+            flops["rbuf_storage"] = self.exp.read_buffering.get_storage_n_bits()
+        else:
+            flops["rbuf_storage"] = 0
+        flops["total"] = sum(flops.values())
+        return flops
+
+    def _get_recommendations(self, readback: Dict[str, Any]) -> List[Dict[str, str]]:
+        ds = self.exp.ds
+        recommendations = [] # type: List[Dict[str, str]]
+        stages = readback["stages"] # type: List[Dict[str, Any]]
+
+        fanin_depth = get_or_tree_depth(stages[0]["max_inputs_per_bit"])
+        if not ds.retime_read_fanin and fanin_depth > READ_FANIN_DEPTH_LIMIT:
+            recommendations.append(OrderedDict([
+                ("option", "retime_read_fanin"),
+                ("reason",
+                    f"Readback has up to {stages[0]['max_inputs_per_bit']} inputs per data bit,"
+                    f" which is an OR-tree depth of {fanin_depth}"
+                    f" (limit: {READ_FANIN_DEPTH_LIMIT})"
+                ),
+            ]))
+
+        path_depth = stages[-1]["depth"]
+        if not ds.retime_read_response and path_depth > READ_RESPONSE_DEPTH_LIMIT:
+            recommendations.append(OrderedDict([
+                ("option", "retime_read_response"),
+                ("reason",
+                    f"Last readback stage has an estimated logic depth of {path_depth}"
+                    f" (limit: {READ_RESPONSE_DEPTH_LIMIT})"
+                ),
+            ]))
+        return recommendations
+
+    def to_dict(self) -> Dict[str, Any]:
+        ds = self.exp.ds
+        readback = self._get_readback_stats()
+
+        options = OrderedDict() # type: OrderedDict[str, Any]
+        for name in (
+            "retime_read_fanin", "read_fanin_stages", "retime_read_response", "retime_decode",
+            "hier_addr_decode", "minimize_addr_decode", "packed_decode_strobes",
+            "unique_case_decode", "and_or_readback",
+            "indexed_array_readback", "dual_issue", "err_if_bad_addr", "err_if_bad_rw",
+        ):
+            options[name] = getattr(ds, name)
+
+        decode_comparators = self.decode_comparators
+        if ds.dual_issue:
+            # Read and write channels each have their own address decoder
+            decode_comparators = decode_comparators.scaled(2)
+
+        return OrderedDict([
+            ("module_name", ds.module_name),
+            ("addr_width", ds.addr_width),
+            ("data_width", self.exp.cpuif.data_width),
+            ("options", options),
+            ("decode", OrderedDict([
+                ("n_strobes", self.exp.address_decode.strobe_vector.width),
+                ("comparators", decode_comparators.to_dict()),
+                ("depth", decode_comparators.depth),
+            ])),
+            ("readback", readback),
+            ("flops", self._get_flop_counts()),
+            ("external_regs", self.n_external_regs),
+            ("external_blocks", self.n_external_blocks),
+            ("recommendations", self._get_recommendations(readback)),
+        ])
+
+    def get_json_report(self) -> str:
+        return json.dumps(self.to_dict(), indent=4) + "\n"
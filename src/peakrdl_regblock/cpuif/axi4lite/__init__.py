@@ -3,6 +3,7 @@ from ..base import CpuifBase
 class AXI4Lite_Cpuif(CpuifBase):
     template_path = "axi4lite_tmpl.sv"
     is_interface = True
+    supports_dual_issue = True
 
     @property
     def port_declaration(self) -> str:
@@ -33,6 +34,26 @@ class AXI4Lite_Cpuif(CpuifBase):
         """
         return self.max_outstanding
 
+    @property
+    def max_outstanding_rd(self) -> int:
+        """
+        If reads and writes are dispatched independently, each channel's
+        max outstanding transactions only depends on its own latency.
+        """
+        return self.exp.ds.min_read_latency + 2
+
+    @property
+    def max_outstanding_wr(self) -> int:
+        return self.exp.ds.min_write_latency + 2
+
+    @property
+    def rd_resp_buffer_size(self) -> int:
+        return self.max_outstanding_rd
+
+    @property
+    def wr_resp_buffer_size(self) -> int:
+        return self.max_outstanding_wr
+
 
 class AXI4Lite_Cpuif_flattened(AXI4Lite_Cpuif):
     is_interface = False
@@ -0,0 +1,195 @@
+{%- macro advance_ptr(ptr, size) -%}
+{%- if is_pow2(size) -%}
+{{ptr}} <= {{ptr}} + 1'b1;
+{%- else -%}
+if({{ptr}}[{{clog2(size)-1}}:0] == {{size-1}}) begin
+    {{ptr}}[{{clog2(size)-1}}:0] <= '0;
+    {{ptr}}[{{clog2(size)}}] <= ~{{ptr}}[{{clog2(size)}}];
+end else begin
+    {{ptr}}[{{clog2(size)-1}}:0] <= {{ptr}}[{{clog2(size)-1}}:0] + 1'b1;
+end
+{%- endif -%}
+{%- endmacro -%}
+
+// Reads and writes are dispatched on independent request channels
+// Max Outstanding Reads: {{cpuif.max_outstanding_rd}}
+// Max Outstanding Writes: {{cpuif.max_outstanding_wr}}
+logic [{{clog2(cpuif.max_outstanding_rd+1)-1}}:0] axil_n_rd_in_flight;
+logic [{{clog2(cpuif.max_outstanding_wr+1)-1}}:0] axil_n_wr_in_flight;
+logic axil_prev_was_rd;
+logic axil_arvalid;
+logic [{{cpuif.addr_width-1}}:0] axil_araddr;
+logic axil_ar_accept;
+logic axil_awvalid;
+logic [{{cpuif.addr_width-1}}:0] axil_awaddr;
+logic axil_wvalid;
+logic [{{cpuif.data_width-1}}:0] axil_wdata;
+logic [{{cpuif.data_width_bytes-1}}:0] axil_wstrb;
+logic axil_aw_accept;
+logic axil_rd_resp_acked;
+logic axil_wr_resp_acked;
+
+// Transaction request acceptance
+always_ff {{get_always_ff_event(cpuif.reset)}} begin
+    if({{get_resetsignal(cpuif.reset)}}) begin
+        axil_prev_was_rd <= '0;
+        axil_arvalid <= '0;
+        axil_araddr <= '0;
+        axil_awvalid <= '0;
+        axil_awaddr <= '0;
+        axil_wvalid <= '0;
+        axil_wdata <= '0;
+        axil_wstrb <= '0;
+        axil_n_rd_in_flight <= '0;
+        axil_n_wr_in_flight <= '0;
+    end else begin
+        // AR* acceptance register
+        if(axil_ar_accept) begin
+            axil_arvalid <= '0;
+        end
+        if({{cpuif.signal("arvalid")}} && {{cpuif.signal("arready")}}) begin
+            axil_arvalid <= '1;
+            axil_araddr <= {{cpuif.signal("araddr")}};
+        end
+
+        // AW* & W* acceptance registers
+        if(axil_aw_accept) begin
+            axil_awvalid <= '0;
+            axil_wvalid <= '0;
+        end
+        if({{cpuif.signal("awvalid")}} && {{cpuif.signal("awready")}}) begin
+            axil_awvalid <= '1;
+            axil_awaddr <= {{cpuif.signal("awaddr")}};
+        end
+        if({{cpuif.signal("wvalid")}} && {{cpuif.signal("wready")}}) begin
+            axil_wvalid <= '1;
+            axil_wdata <= {{cpuif.signal("wdata")}};
+            axil_wstrb <= {{cpuif.signal("wstrb")}};
+        end
+
+        // Reads and writes to the same address take turns
+        if(axil_ar_accept && !axil_aw_accept) begin
+            axil_prev_was_rd <= '1;
+        end else if(axil_aw_accept && !axil_ar_accept) begin
+            axil_prev_was_rd <= '0;
+        end
+
+        // Keep track of in-flight transactions of each channel
+        if(axil_ar_accept && !axil_rd_resp_acked) begin
+            axil_n_rd_in_flight <= axil_n_rd_in_flight + 1'b1;
+        end else if(!axil_ar_accept && axil_rd_resp_acked) begin
+            axil_n_rd_in_flight <= axil_n_rd_in_flight - 1'b1;
+        end
+        if(axil_aw_accept && !axil_wr_resp_acked) begin
+            axil_n_wr_in_flight <= axil_n_wr_in_flight + 1'b1;
+        end else if(!axil_aw_accept && axil_wr_resp_acked) begin
+            axil_n_wr_in_flight <= axil_n_wr_in_flight - 1'b1;
+        end
+    end
+end
+
+always_comb begin
+    {{cpuif.signal("arready")}} = (!axil_arvalid || axil_ar_accept);
+    {{cpuif.signal("awready")}} = (!axil_awvalid || axil_aw_accept);
+    {{cpuif.signal("wready")}} = (!axil_wvalid || axil_aw_accept);
+end
+
+// Request dispatch
+always_comb begin
+    cpuif_wr_data = axil_wdata;
+    for(int i=0; i<{{cpuif.data_width_bytes}}; i++) begin
+        cpuif_wr_biten[i*8 +: 8] = {8{axil_wstrb[i]}};
+    end
+    {%- if cpuif.data_width_bytes == 1 %}
+    cpuif_rd_addr = axil_araddr;
+    cpuif_wr_addr = axil_awaddr;
+    {%- else %}
+    cpuif_rd_addr = {axil_araddr[{{cpuif.addr_width-1}}:{{clog2(cpuif.data_width_bytes)}}], {{clog2(cpuif.data_width_bytes)}}'b0};
+    cpuif_wr_addr = {axil_awaddr[{{cpuif.addr_width-1}}:{{clog2(cpuif.data_width_bytes)}}], {{clog2(cpuif.data_width_bytes)}}'b0};
+    {%- endif %}
+
+    // Can safely issue more transactions without overwhelming each channel's
+    // response buffer
+    cpuif_rd_req = axil_arvalid && (axil_n_rd_in_flight < {{clog2(cpuif.max_outstanding_rd+1)}}'d{{cpuif.max_outstanding_rd}});
+    cpuif_wr_req = axil_awvalid && axil_wvalid && (axil_n_wr_in_flight < {{clog2(cpuif.max_outstanding_wr+1)}}'d{{cpuif.max_outstanding_wr}});
+    if(cpuif_rd_req && cpuif_wr_req && (cpuif_rd_addr == cpuif_wr_addr)) begin
+        // Only one of a read and a write to the same address is issued
+        if(axil_prev_was_rd) cpuif_rd_req = '0;
+        else cpuif_wr_req = '0;
+    end
+    axil_ar_accept = cpuif_rd_req && !cpuif_req_stall_rd;
+    axil_aw_accept = cpuif_wr_req && !cpuif_req_stall_wr;
+end
+
+
+// AXI4-Lite Response Logic
+// Each channel has its own response buffer, so that read and write responses
+// are returned independently
+logic axil_rd_resp_buffer_err[{{roundup_pow2(cpuif.rd_resp_buffer_size)}}];
+logic [{{cpuif.data_width-1}}:0] axil_rd_resp_buffer_rdata[{{roundup_pow2(cpuif.rd_resp_buffer_size)}}];
+logic axil_wr_resp_buffer_err[{{roundup_pow2(cpuif.wr_resp_buffer_size)}}];
+{%- if not is_pow2(cpuif.rd_resp_buffer_size) or not is_pow2(cpuif.wr_resp_buffer_size) %}
+// Response buffers are intentionally padded to the next power of two despite
+// only requiring {{cpuif.rd_resp_buffer_size}} and {{cpuif.wr_resp_buffer_size}} entries.
+// This is to avoid quirks in some tools that cannot handle indexing into a non-power-of-2 array.
+// Unused entries are expected to be optimized away
+{%- endif %}
+
+logic [{{clog2(cpuif.rd_resp_buffer_size)}}:0] axil_rd_resp_wptr;
+logic [{{clog2(cpuif.rd_resp_buffer_size)}}:0] axil_rd_resp_rptr;
+logic [{{clog2(cpuif.wr_resp_buffer_size)}}:0] axil_wr_resp_wptr;
+logic [{{clog2(cpuif.wr_resp_buffer_size)}}:0] axil_wr_resp_rptr;
+
+always_ff {{get_always_ff_event(cpuif.reset)}} begin
+    if({{get_resetsignal(cpuif.reset)}}) begin
+        for(int i=0; i<{{cpuif.rd_resp_buffer_size}}; i++) begin
+            axil_rd_resp_buffer_err[i] <= '0;
+            axil_rd_resp_buffer_rdata[i] <= '0;
+        end
+        for(int i=0; i<{{cpuif.wr_resp_buffer_size}}; i++) begin
+            axil_wr_resp_buffer_err[i] <= '0;
+        end
+        axil_rd_resp_wptr <= '0;
+        axil_rd_resp_rptr <= '0;
+        axil_wr_resp_wptr <= '0;
+        axil_wr_resp_rptr <= '0;
+    end else begin
+        // Store responses in buffers until AXI response channels accept them
+        if(cpuif_rd_ack) begin
+            axil_rd_resp_buffer_err[axil_rd_resp_wptr[{{clog2(cpuif.rd_resp_buffer_size)-1}}:0]] <= cpuif_rd_err;
+            axil_rd_resp_buffer_rdata[axil_rd_resp_wptr[{{clog2(cpuif.rd_resp_buffer_size)-1}}:0]] <= cpuif_rd_data;
+            {{advance_ptr("axil_rd_resp_wptr", cpuif.rd_resp_buffer_size)|indent(12)}}
+        end
+        if(cpuif_wr_ack) begin
+            axil_wr_resp_buffer_err[axil_wr_resp_wptr[{{clog2(cpuif.wr_resp_buffer_size)-1}}:0]] <= cpuif_wr_err;
+            {{advance_ptr("axil_wr_resp_wptr", cpuif.wr_resp_buffer_size)|indent(12)}}
+        end
+
+        // Advance read pointers when acknowledged
+        if(axil_rd_resp_acked) begin
+            {{advance_ptr("axil_rd_resp_rptr", cpuif.rd_resp_buffer_size)|indent(12)}}
+        end
+        if(axil_wr_resp_acked) begin
+            {{advance_ptr("axil_wr_resp_rptr", cpuif.wr_resp_buffer_size)|indent(12)}}
+        end
+    end
+end
+
+always_comb begin
+    {{cpuif.signal("rvalid")}} = (axil_rd_resp_rptr != axil_rd_resp_wptr);
+    axil_rd_resp_acked = {{cpuif.signal("rvalid")}} && {{cpuif.signal("rready")}};
+    {{cpuif.signal("rdata")}} = axil_rd_resp_buffer_rdata[axil_rd_resp_rptr[{{clog2(cpuif.rd_resp_buffer_size)-1}}:0]];
+    if(axil_rd_resp_buffer_err[axil_rd_resp_rptr[{{clog2(cpuif.rd_resp_buffer_size)-1}}:0]]) begin
+        {{cpuif.signal("rresp")}} = 2'b10;
+    end else begin
+        {{cpuif.signal("rresp")}} = 2'b00;
+    end
+
+    {{cpuif.signal("bvalid")}} = (axil_wr_resp_rptr != axil_wr_resp_wptr);
+    axil_wr_resp_acked = {{cpuif.signal("bvalid")}} && {{cpuif.signal("bready")}};
+    if(axil_wr_resp_buffer_err[axil_wr_resp_rptr[{{clog2(cpuif.wr_resp_buffer_size)-1}}:0]]) begin
+        {{cpuif.signal("bresp")}} = 2'b10;
+    end else begin
+        {{cpuif.signal("bresp")}} = 2'b00;
+    end
+end
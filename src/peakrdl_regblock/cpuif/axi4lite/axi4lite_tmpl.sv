@@ -9,6 +9,9 @@
 `endif
 
 {% endif -%}
+{% if ds.dual_issue -%}
+{% include "axi4lite_dual_issue_tmpl.sv" %}
+{%- else -%}
 
 // Max Outstanding Transactions: {{cpuif.max_outstanding}}
 logic [{{clog2(cpuif.max_outstanding+1)-1}}:0] axil_n_in_flight;
@@ -250,3 +253,4 @@ always_comb begin
     end
 end
 {%- endif %}
+{%- endif %}
@@ -1,10 +1,10 @@
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 import inspect
 import os
 
-import jinja2 as jj
-
 from ..utils import clog2, is_pow2, roundup_pow2
+from ..template_registry import get_jinja_env
+from ..incremental import get_template_digest
 
 if TYPE_CHECKING:
     from ..exporter import RegblockExporter
@@ -14,6 +14,10 @@ class CpuifBase:
     # Path is relative to the location of the class that assigns this variable
     template_path = ""
 
+    # Whether the CPU interface can issue reads and writes on independent
+    # request channels when the dual_issue option is set
+    supports_dual_issue = False
+
     def __init__(self, exp:'RegblockExporter'):
         self.exp = exp
         self.reset = exp.ds.top_node.cpuif_reset
@@ -42,25 +46,31 @@ class CpuifBase:
         """
         return []
 
-    def _get_template_path_class_dir(self) -> str:
+    @classmethod
+    def _get_template_path_class_dir(cls) -> str:
         """
         Traverse up the MRO and find the first class that explicitly assigns
         template_path. Returns the directory that contains the class definition.
         """
-        for cls in inspect.getmro(self.__class__):
-            if "template_path" in cls.__dict__:
-                class_dir = os.path.dirname(inspect.getfile(cls))
+        for base_cls in inspect.getmro(cls):
+            if "template_path" in base_cls.__dict__:
+                class_dir = os.path.dirname(inspect.getfile(base_cls))
                 return class_dir
         raise RuntimeError
 
+    @classmethod
+    def get_template_digest(cls, template_cache_dir: Optional[str] = None) -> str:
+        """
+        Hash of the implementation template, and of any templates that it
+        references. Used to detect changes to user-supplied templates.
+        """
+        jj_env = get_jinja_env(cls._get_template_path_class_dir(), template_cache_dir)
+        return get_template_digest(jj_env, cls.template_path)
+
 
     def get_implementation(self) -> str:
         class_dir = self._get_template_path_class_dir()
-        loader = jj.FileSystemLoader(class_dir)
-        jj_env = jj.Environment(
-            loader=loader,
-            undefined=jj.StrictUndefined,
-        )
+        jj_env = get_jinja_env(class_dir, self.exp.template_cache_dir)
 
         context = {
             "cpuif": self,
@@ -0,0 +1,150 @@
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple
+
+from systemrdl.node import RegNode
+
+from .address_map import get_mapped_spans
+
+if TYPE_CHECKING:
+    from systemrdl.node import AddrmapNode
+
+
+class AddressDecodeMinimizer:
+    """
+    Finds the address bits that are needed to tell each register apart from
+    every other register and external block in the map.
+
+    Addresses that do not map to anything are treated as don't-care, so a
+    register only needs to compare the bits that differ from all other mapped
+    addresses. This is only valid if accesses to unmapped addresses do not
+    need to be detected.
+
+    All mapped addresses are stored as the occupied nodes of a binary trie
+    over the address bits. A node at ``level`` with ``prefix`` holds all
+    addresses whose bits ``[addr_width-1:level]`` are equal to ``prefix``.
+    """
+    def __init__(self, top_node: 'AddrmapNode', addr_width: int) -> None:
+        self.top_node = top_node
+        self.addr_width = addr_width
+
+        # Trie nodes that contain at least one mapped address
+        self._occupied = set() # type: Set[Tuple[int, int]]
+
+        # Trie nodes whose addresses are all mapped to an external block
+        self._full = set() # type: Set[Tuple[int, int]]
+
+        # Addresses of each internal register's subword, for all of its
+        # unrolled instances.
+        # Keyed by the register's path without array indexes, and subword offset
+        self._reg_addresses = {} # type: Dict[Tuple[str, int], List[int]]
+
+        # Masks that were already computed
+        self._masks = {} # type: Dict[Tuple[str, int], int]
+
+        for span in get_mapped_spans(top_node):
+            if isinstance(span.node, RegNode):
+                # Registers are only mapped at their exact address
+                self._add_range(span.lo, span.lo)
+                if not span.node.external:
+                    key = (span.node.get_path(array_suffix="[]"), span.subword_offset)
+                    self._reg_addresses.setdefault(key, []).append(span.lo)
+            else:
+                self._add_range(span.lo, span.hi)
+
+    def _add_range(self, lo: int, hi: int) -> None:
+        """
+        Mark the address range as occupied, by splitting it into blocks that
+        are aligned to their size
+        """
+        while lo <= hi:
+            level = 0
+            while (
+                level < self.addr_width
+                and not lo & (1 << level)
+                and lo + (2 << level) - 1 <= hi
+            ):
+                level += 1
+
+            if level:
+                self._full.add((level, lo >> level))
+            for l in range(level, self.addr_width + 1):
+                self._occupied.add((l, lo >> l))
+            lo += 1 << level
+
+    def _is_mapped(self, address: int) -> bool:
+        if (0, address) in self._occupied:
+            return True
+        for level in range(1, self.addr_width + 1):
+            if (level, address >> level) in self._full:
+                return True
+        return False
+
+    def _has_other_match(self, address: int, mask: int) -> bool:
+        """
+        Check if any mapped address, other than ``address`` itself, is equal
+        to it in all bits of ``mask``
+        """
+        stack = [(self.addr_width, 0)]
+        while stack:
+            level, prefix = stack.pop()
+            if level == 0:
+                if prefix != address:
+                    return True
+                continue
+            if (level, prefix) in self._full:
+                # Any combination of the remaining bits is mapped
+                return True
+
+            b = level - 1
+            if mask & (1 << b):
+                bits = [(address >> b) & 1]
+            else:
+                bits = [0, 1]
+            for bit in bits:
+                child = (b, (prefix << 1) | bit)
+                if child in self._occupied:
+                    stack.append(child)
+        return False
+
+    def _get_address_mask(self, address: int) -> int:
+        # Walk down the trie along the address. Any bit whose other branch
+        # contains a mapped address is needed to distinguish it.
+        mask = 0
+        for b in range(self.addr_width):
+            if (b, (address >> b) ^ 1) in self._occupied:
+                mask |= 1 << b
+
+        # The above may have picked bits near the top of the trie that later
+        # bits already distinguish. Drop any that are redundant.
+        for b in reversed(range(self.addr_width)):
+            if not mask & (1 << b):
+                continue
+            if self._is_mapped(address ^ (1 << b)):
+                # Quick check: Address that only differs in this bit is mapped
+                continue
+            trial_mask = mask & ~(1 << b)
+            if not self._has_other_match(address, trial_mask):
+                mask = trial_mask
+        return mask
+
+    def get_mask(self, node: RegNode, subword_offset: int = 0) -> int:
+        """
+        Get the mask of address bits that need to be compared to decode the
+        register's subword.
+
+        If the register is within arrays, the mask applies to all of its
+        elements.
+        """
+        assert not node.external
+        key = (node.get_path(), subword_offset)
+        if key not in self._masks:
+            mask = 0
+            for address in self._reg_addresses[key]:
+                mask |= self._get_address_mask(address)
+            self._masks[key] = mask
+        return self._masks[key]
+
+    def get_n_instances(self, node: RegNode) -> int:
+        """
+        Number of unrolled instances of the register
+        """
+        return len(self._reg_addresses[(node.get_path(), 0)])
@@ -208,11 +208,23 @@ class Dereferencer:
         raise NotImplementedError
 
 
-    def get_access_strobe(self, obj: Union[RegNode, FieldNode], reduce_substrobes: bool=True) -> str:
+    def get_access_strobe(self, obj: Union[RegNode, FieldNode], reduce_substrobes: bool=True, subword_index: Optional[int]=None, read_channel: bool=False) -> str:
         """
         Returns the Verilog string that represents the register's access strobe
         """
-        return self.address_decode.get_access_strobe(obj, reduce_substrobes)
+        return self.address_decode.get_access_strobe(obj, reduce_substrobes, subword_index, read_channel)
+
+    def get_write_strobe(self, obj: Union[RegNode, FieldNode], reduce_substrobes: bool=True, subword_index: Optional[int]=None) -> str:
+        """
+        Returns the Verilog string that is asserted when the register is written
+        """
+        return self.address_decode.get_write_strobe(obj, reduce_substrobes, subword_index)
+
+    def get_read_strobe(self, obj: Union[RegNode, FieldNode], reduce_substrobes: bool=True, subword_index: Optional[int]=None) -> str:
+        """
+        Returns the Verilog string that is asserted when the register is read
+        """
+        return self.address_decode.get_read_strobe(obj, reduce_substrobes, subword_index)
 
     def get_external_block_access_strobe(self, obj: 'AddressableNode') -> str:
         """
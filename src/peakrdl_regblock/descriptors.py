@@ -0,0 +1,135 @@
+from typing import TYPE_CHECKING, Dict, Optional, List, Any
+
+from systemrdl.rdltypes import InterruptType
+
+if TYPE_CHECKING:
+    from systemrdl.node import FieldNode, RegNode
+    from .field_logic.bases import NextStateConditional
+
+
+class RegDescriptor:
+    """
+    Snapshot of register properties that are frequently looked up by the
+    exporter
+    """
+    __slots__ = (
+        "regwidth",
+        "accesswidth",
+        "buffer_writes",
+        "buffer_reads",
+        "has_sw_writable",
+        "has_sw_readable",
+    )
+
+    def __init__(self, node: 'RegNode') -> None:
+        self.regwidth = node.get_property('regwidth') # type: int
+        self.accesswidth = node.get_property('accesswidth') # type: int
+        self.buffer_writes = bool(node.get_property('buffer_writes'))
+        self.buffer_reads = bool(node.get_property('buffer_reads'))
+        self.has_sw_writable = node.has_sw_writable
+        self.has_sw_readable = node.has_sw_readable
+
+
+class FieldDescriptor:
+    """
+    Snapshot of field properties that are frequently looked up by the
+    exporter.
+
+    Only plain values are captured. Properties that can be assigned a reference
+    are reduced to whether they are set, since a reference resolves differently
+    depending on the array index of the node it is looked up from.
+    """
+    __slots__ = (
+        "reg",
+        "implements_storage",
+        "is_sw_writable",
+        "is_sw_readable",
+        "is_hw_writable",
+        "is_hw_readable",
+        "is_up_counter",
+        "is_down_counter",
+        "paritycheck",
+        "intr",
+        "halt",
+        "has_next_q",
+        "anded",
+        "ored",
+        "xored",
+        "swmod",
+        "swacc",
+        "rd_swacc",
+        "wr_swacc",
+        "incrthreshold",
+        "decrthreshold",
+        "incrsaturates",
+        "decrsaturates",
+        "overflow",
+        "underflow",
+        "conditionals",
+    )
+
+    def __init__(self, node: 'FieldNode', reg: RegDescriptor) -> None:
+        self.reg = reg
+
+        self.implements_storage = node.implements_storage
+        self.is_sw_writable = node.is_sw_writable
+        self.is_sw_readable = node.is_sw_readable
+        self.is_hw_writable = node.is_hw_writable
+        self.is_hw_readable = node.is_hw_readable
+        self.is_up_counter = node.is_up_counter
+        self.is_down_counter = node.is_down_counter
+
+        self.paritycheck = bool(node.get_property('paritycheck'))
+        self.intr = bool(node.get_property('intr'))
+        self.halt = bool(node.get_property('haltenable') or node.get_property('haltmask'))
+        self.has_next_q = node.get_property('intr type') in {
+            InterruptType.posedge,
+            InterruptType.negedge,
+            InterruptType.bothedge
+        }
+
+        # Inferred outputs
+        self.anded = bool(node.get_property('anded'))
+        self.ored = bool(node.get_property('ored'))
+        self.xored = bool(node.get_property('xored'))
+        self.swmod = bool(node.get_property('swmod'))
+        self.swacc = bool(node.get_property('swacc'))
+        self.rd_swacc = bool(node.get_property('rd_swacc'))
+        self.wr_swacc = bool(node.get_property('wr_swacc'))
+
+        # Counter properties (explicitly not False. Not 0)
+        self.incrthreshold = node.get_property('incrthreshold') is not False
+        self.decrthreshold = node.get_property('decrthreshold') is not False
+        self.incrsaturates = node.get_property('incrsaturate') is not False
+        self.decrsaturates = node.get_property('decrsaturate') is not False
+        self.overflow = bool(node.get_property('overflow'))
+        self.underflow = bool(node.get_property('underflow'))
+
+        # Matching next-state conditionals. Filled in by FieldLogic
+        self.conditionals = None # type: Optional[List[NextStateConditional]]
+
+
+class DescriptorTable:
+    """
+    Per-export table of register and field descriptors.
+
+    All elements of an array share the same component instance, so descriptors
+    are keyed by instance and built once on first lookup.
+    """
+    def __init__(self) -> None:
+        self._regs = {} # type: Dict[Any, RegDescriptor]
+        self._fields = {} # type: Dict[Any, FieldDescriptor]
+
+    def get_reg(self, node: 'RegNode') -> RegDescriptor:
+        desc = self._regs.get(node.inst)
+        if desc is None:
+            desc = RegDescriptor(node)
+            self._regs[node.inst] = desc
+        return desc
+
+    def get_field(self, node: 'FieldNode') -> FieldDescriptor:
+        desc = self._fields.get(node.inst)
+        if desc is None:
+            desc = FieldDescriptor(node, self.get_reg(node.parent))
+            self._fields[node.inst] = desc
+        return desc
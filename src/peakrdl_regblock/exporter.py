@@ -2,7 +2,6 @@ import os
 from typing import TYPE_CHECKING, Union, Any, Type, Optional, Set, List
 from collections import OrderedDict
 
-import jinja2 as jj
 from systemrdl.node import AddrmapNode, RootNode
 
 from .addr_decode import AddressDecode
@@ -10,7 +9,8 @@ from .field_logic import FieldLogic
 from .dereferencer import Dereferencer
 from .readback import Readback
 from .identifier_filter import kw_filter as kwf
-from .utils import clog2
+from .utils import clog2, IndexedPathCache, indent_chunks
+from .descriptors import DescriptorTable
 from .scan_design import DesignScanner
 from .validate_design import DesignValidator
 from .cpuif import CpuifBase
@@ -21,6 +21,11 @@ from .read_buffering import ReadBuffering
 from .external_acks import ExternalWriteAckGenerator, ExternalReadAckGenerator
 from .parity import ParityErrorReduceGenerator
 from .sv_int import SVInt
+from .walker import GeneratorPass
+from .template_registry import get_jinja_env
+from .profiler import ExportProfiler, profile_stage
+from .incremental import get_fingerprint, is_up_to_date, write_fingerprint, get_tmp_path, replace_if_changed
+from .cost_report import CostReport
 
 if TYPE_CHECKING:
     from systemrdl.node import SignalNode
@@ -35,25 +40,24 @@ class RegblockExporter:
     write_buffering: WriteBuffering
     read_buffering: ReadBuffering
     dereferencer: Dereferencer
+    cost_report: Optional[CostReport]
     ds: 'DesignState'
 
     def __init__(self, **kwargs: Any) -> None:
+        """
+        Parameters
+        ----------
+        template_cache_dir: str
+            If set, compiled Jinja templates are cached in this directory so
+            that they can be re-used across processes.
+        """
+        self.template_cache_dir = kwargs.pop("template_cache_dir", None) # type: Optional[str]
+
         # Check for stray kwargs
         if kwargs:
             raise TypeError(f"got an unexpected keyword argument '{list(kwargs.keys())[0]}'")
 
-
-        loader = jj.ChoiceLoader([
-            jj.FileSystemLoader(os.path.dirname(__file__)),
-            jj.PrefixLoader({
-                'base': jj.FileSystemLoader(os.path.dirname(__file__)),
-            }, delimiter=":")
-        ])
-
-        self.jj_env = jj.Environment(
-            loader=loader,
-            undefined=jj.StrictUndefined,
-        )
+        self.jj_env = get_jinja_env(os.path.dirname(__file__), self.template_cache_dir)
 
 
     def export(self, node: Union[RootNode, AddrmapNode], output_dir:str, **kwargs: Any) -> None:
@@ -91,6 +95,16 @@ class RegblockExporter:
             readback path so that logic-levels and fanin are minimized.
 
             Enabling this option will increase read transfer latency by 1 clock cycle.
+        read_fanin_stages: int
+            Number of retiming stages of the readback reduction tree. Each stage
+            reduces the readback bins by another group of address bits.
+            Implies ``retime_read_fanin``, and increases read transfer latency
+            by 1 clock cycle per stage. Defaults to 1.
+        max_read_fanin: int
+            Alternatively, the target maximum fan-in of each readback reduction
+            stage. The number of stages is chosen so that no stage selects
+            between more than this many addresses or bins.
+            Implies ``retime_read_fanin``. Mutually exclusive with ``read_fanin_stages``.
         retime_read_response: bool
             Set this to ``True`` to enable an additional retiming flop stage between
             the readback mux and the CPU interface response logic.
@@ -102,6 +116,15 @@ class RegblockExporter:
             response path sequentially may not result in any meaningful timing improvement.
 
             Enabling this option will increase read transfer latency by 1 clock cycle.
+        retime_decode: bool
+            Set this to ``True`` to register the outputs of the address decoder.
+            The decoded strobes, request, and write data are retimed before
+            they are used by the field logic, external blocks and readback.
+            For large register blocks, this removes the address decode from the
+            timing paths into each field's next-state logic.
+
+            Enabling this option will increase both read and write transfer
+            latency by 1 clock cycle.
         retime_external_reg: bool
             Retime outputs to external ``reg`` components.
         retime_external_regfile: bool
@@ -113,6 +136,11 @@ class RegblockExporter:
         generate_hwif_report: bool
             If set, generates a hwif report that can help designers understand
             the contents of the ``hwif_in`` and ``hwif_out`` structures.
+        generate_cost_report: bool
+            If set, writes a JSON report that estimates the address decode
+            comparators, readback mux fan-in, logic depth and flop counts of
+            the generated design. Retiming options are recommended if the
+            estimated readback logic depth is excessive.
         address_width: int
             Override the CPU interface's address width. By default, address width
             is sized to the contents of the regblock.
@@ -127,6 +155,67 @@ class RegblockExporter:
             If overriden to True: If an illegal access is performed to a read-only or write-only
             register, the CPUIF response signal shows an error. For example: APB.PSLVERR = 1'b1,
             AXI4LITE.*RESP = 2'b10.
+        hier_addr_decode: bool
+            Set this to ``True`` to decode addresses hierarchically.
+            Each regfile and addrmap whose address range is aligned to its size
+            decodes its base address once into a block-select signal. Registers
+            within the block only compare the address bits that are local to the
+            block, rather than the full address.
+        minimize_addr_decode: bool
+            Set this to ``True`` to only compare the address bits that are needed
+            to distinguish each register from all other registers and external
+            blocks in the map. Accesses to unmapped addresses may alias onto a
+            register, so this has no effect if ``err_if_bad_addr`` is set.
+            The number of address comparator bits that were removed is noted in
+            the generated address decoder.
+        packed_decode_strobes: bool
+            Set this to ``True`` to represent the address decoder's strobes as a
+            single packed vector, rather than as an unpacked struct that mirrors
+            the register hierarchy. This can improve simulation and synthesis
+            runtime of very large register maps. The bit position of each
+            register's strobes is listed in the generated RTL.
+        unique_case_decode: bool
+            Set this to ``True`` to decode and read back registers that are not
+            within arrays using a ``unique0 case`` statement of the address,
+            rather than a sequence of independent ``if`` statements. This lets
+            synthesis tools recognize that they are mutually exclusive.
+            Register arrays, external blocks, and registers within hierarchically
+            decoded blocks are still decoded by address comparisons.
+        and_or_readback: bool
+            Set this to ``True`` to build the readback mux from the address
+            decode strobes. Each register's value is masked by its decode
+            strobe, and all contributions are OR-reduced, rather than comparing
+            the read address again for every register.
+            External registers and blocks are still read back by comparing the
+            address, since they respond after their decode strobe.
+        indexed_array_readback: bool
+            Set this to ``True`` to read back register arrays by decoding the
+            element index from the read address, and selecting the element
+            with a single indexed mux. Otherwise, the address of each element
+            is compared separately.
+            This requires the array stride to be a power of 2, and the array to
+            be aligned to its size. Other arrays fall back to comparing the
+            address of each element.
+            Not supported if ``retime_read_fanin`` or ``and_or_readback`` is
+            set.
+        dual_issue: bool
+            Set this to ``True`` to issue reads and writes on independent
+            request channels. Each channel has its own address decoder, so a
+            read and a write can be accepted in the same clock cycle. Reads
+            drive the readback mux and read side-effects, and writes drive the
+            field write logic.
+            Requires a CPU interface that supports it, such as AXI4-Lite.
+            Not supported if the design contains external components.
+        incremental: bool
+            If set, a fingerprint of the design, export options and exporter
+            version is saved alongside the generated outputs. If a subsequent
+            export has the same fingerprint, and its outputs still exist,
+            generation is skipped entirely. Otherwise, only output files whose
+            contents changed are re-written.
+        profile: str
+            If set to ``"text"`` or ``"json"``, the time, memory and output size
+            of each stage of the export is measured and written to a
+            ``<module_name>_profile.txt`` or ``.json`` report alongside the outputs.
         """
         # If it is the root node, skip to top addrmap
         if isinstance(node, RootNode):
@@ -134,23 +223,74 @@ class RegblockExporter:
         else:
             top_node = node
 
-        self.ds = DesignState(top_node, kwargs)
+        incremental = kwargs.pop("incremental", False) # type: bool
+        profile = kwargs.pop("profile", None) # type: Optional[str]
+        if profile not in (None, "text", "json"):
+            raise ValueError(f"Invalid profile report format '{profile}'. Expected 'text' or 'json'")
+
+        profiler = None # type: Optional[ExportProfiler]
+        if profile:
+            profiler = ExportProfiler()
+            profiler.start()
+            profiler.count_nodes(top_node)
+
+        if incremental:
+            with profile_stage(profiler, "fingerprint"):
+                cpuif_template_digest = (
+                    kwargs.get("cpuif_cls", None) or APB4_Cpuif
+                ).get_template_digest(self.template_cache_dir)
+                fingerprint = get_fingerprint(top_node, kwargs, cpuif_template_digest)
+
+        with profile_stage(profiler, "DesignState"):
+            self.ds = DesignState(top_node, kwargs)
 
         cpuif_cls = kwargs.pop("cpuif_cls", None) or APB4_Cpuif # type: Type[CpuifBase]
         generate_hwif_report = kwargs.pop("generate_hwif_report", False) # type: bool
+        generate_cost_report = kwargs.pop("generate_cost_report", False) # type: bool
 
         # Check for stray kwargs
         if kwargs:
             raise TypeError(f"got an unexpected keyword argument '{list(kwargs.keys())[0]}'")
 
+        package_file_path = os.path.join(output_dir, self.ds.package_name + ".sv")
+        module_file_path = os.path.join(output_dir, self.ds.module_name + ".sv")
+        output_paths = [package_file_path, module_file_path]
+        if generate_hwif_report:
+            hwif_report_path = os.path.join(output_dir, f"{self.ds.module_name}_hwif.rpt")
+            output_paths.append(hwif_report_path)
+        if generate_cost_report:
+            cost_report_path = os.path.join(output_dir, f"{self.ds.module_name}_cost.json")
+            output_paths.append(cost_report_path)
+
+        if incremental:
+            fingerprint_path = os.path.join(output_dir, f"{self.ds.module_name}.fingerprint")
+            if is_up_to_date(fingerprint_path, fingerprint, output_paths):
+                if profiler is not None:
+                    self._write_profile_report(profiler, profile, output_dir)
+                return
+
+            # Outputs are first written to temporary files, which only replace
+            # the existing files if their contents changed
+            write_paths = [get_tmp_path(path) for path in output_paths]
+        else:
+            write_paths = output_paths
+
+        os.makedirs(output_dir, exist_ok=True)
         if generate_hwif_report:
-            path = os.path.join(output_dir, f"{self.ds.module_name}_hwif.rpt")
-            hwif_report_file = open(path, "w", encoding='utf-8') # pylint: disable=consider-using-with
+            hwif_report_file = open(write_paths[2], "w", encoding='utf-8') # pylint: disable=consider-using-with
         else:
             hwif_report_file = None
 
         # Construct exporter components
+        if generate_cost_report:
+            self.cost_report = CostReport(self)
+        else:
+            self.cost_report = None
         self.cpuif = cpuif_cls(self)
+        if self.ds.dual_issue and not self.cpuif.supports_dual_issue:
+            self.ds.top_node.env.msg.fatal(
+                f"CPU interface '{cpuif_cls.__name__}' does not support dual_issue."
+            )
         self.hwif = Hwif(self, hwif_report_file=hwif_report_file)
         self.readback = Readback(self)
         self.address_decode = AddressDecode(self)
@@ -163,7 +303,29 @@ class RegblockExporter:
         parity = ParityErrorReduceGenerator(self)
 
         # Validate that there are no unsupported constructs
-        DesignValidator(self).do_validate()
+        with profile_stage(profiler, "DesignValidator"):
+            DesignValidator(self).do_validate()
+
+        # Run all content generators using a single traversal of the design
+        gen_pass = GeneratorPass(self.ds.top_node, profiler)
+        self.hwif.add_generators(gen_pass)
+        self.address_decode.add_generators(gen_pass)
+        self.field_logic.add_generators(gen_pass)
+        if self.ds.has_buffered_write_regs:
+            self.write_buffering.add_generators(gen_pass)
+        if self.ds.has_buffered_read_regs:
+            self.read_buffering.add_generators(gen_pass)
+        if self.ds.has_paritycheck:
+            parity.add_generators(gen_pass)
+        if self.ds.has_external_addressable:
+            ext_write_acks.add_generators(gen_pass)
+            ext_read_acks.add_generators(gen_pass)
+        self.readback.add_generators(gen_pass)
+        with profile_stage(profiler, "generators"):
+            gen_pass.run()
+
+        with profile_stage(profiler, "readback"):
+            readback_implementation = self.readback.get_implementation()
 
         # Build Jinja template context
         context = {
@@ -178,7 +340,7 @@ class RegblockExporter:
             "default_resetsignal_name": self.dereferencer.default_resetsignal_name,
             "address_decode": self.address_decode,
             "field_logic": self.field_logic,
-            "readback_implementation": self.readback.get_implementation(),
+            "readback_implementation": readback_implementation,
             "ext_write_acks": ext_write_acks,
             "ext_read_acks": ext_read_acks,
             "parity": parity,
@@ -186,23 +348,47 @@ class RegblockExporter:
             "ds": self.ds,
             "kwf": kwf,
             "SVInt" : SVInt,
+            "indent_chunks": indent_chunks,
         }
 
         # Write out design
-        os.makedirs(output_dir, exist_ok=True)
-        package_file_path = os.path.join(output_dir, self.ds.package_name + ".sv")
-        template = self.jj_env.get_template("package_tmpl.sv")
-        stream = template.stream(context)
-        stream.dump(package_file_path)
+        with profile_stage(profiler, "render package"):
+            template = self.jj_env.get_template("package_tmpl.sv")
+            stream = template.stream(context)
+            stream.dump(write_paths[0])
 
-        module_file_path = os.path.join(output_dir, self.ds.module_name + ".sv")
-        template = self.jj_env.get_template("module_tmpl.sv")
-        stream = template.stream(context)
-        stream.dump(module_file_path)
+        with profile_stage(profiler, "render module"):
+            template = self.jj_env.get_template("module_tmpl.sv")
+            stream = template.stream(context)
+            stream.dump(write_paths[1])
 
         if hwif_report_file:
             hwif_report_file.close()
 
+        if self.cost_report is not None:
+            with profile_stage(profiler, "cost report"):
+                with open(write_paths[-1], "w", encoding='utf-8') as f:
+                    f.write(self.cost_report.get_json_report())
+
+        if incremental:
+            for path in output_paths:
+                replace_if_changed(path)
+            write_fingerprint(fingerprint_path, fingerprint, output_paths)
+
+        if profiler is not None:
+            self._write_profile_report(profiler, profile, output_dir)
+
+    def _write_profile_report(self, profiler: ExportProfiler, profile: Optional[str], output_dir: str) -> None:
+        profiler.stop()
+        if profile == "text":
+            path = os.path.join(output_dir, f"{self.ds.module_name}_profile.txt")
+            report = profiler.get_text_report()
+        else:
+            path = os.path.join(output_dir, f"{self.ds.module_name}_profile.json")
+            report = profiler.get_json_report()
+        with open(path, "w", encoding='utf-8') as f:
+            f.write(report)
+
     def module_has_parameters(self) -> bool:
         return bool(self.cpuif.parameters)
 
@@ -255,6 +441,12 @@ class DesignState:
         self.top_node = top_node
         msg = top_node.env.msg
 
+        # Shared lookup of each node's indexed hierarchical path
+        self.indexed_paths = IndexedPathCache(top_node)
+
+        # Shared snapshot of frequently used register and field properties
+        self.descriptors = DescriptorTable()
+
         #------------------------
         # Extract compiler args
         #------------------------
@@ -265,12 +457,29 @@ class DesignState:
 
         # Pipelining options
         self.retime_read_fanin = kwargs.pop("retime_read_fanin", False) # type: bool
+        user_read_fanin_stages = kwargs.pop("read_fanin_stages", None) # type: Optional[int]
+        self.max_read_fanin = kwargs.pop("max_read_fanin", None) # type: Optional[int]
         self.retime_read_response = kwargs.pop("retime_read_response", False) # type: bool
+        self.retime_decode = kwargs.pop("retime_decode", False) # type: bool
         self.retime_external_reg = kwargs.pop("retime_external_reg", False) # type: bool
         self.retime_external_regfile = kwargs.pop("retime_external_regfile", False) # type: bool
         self.retime_external_mem = kwargs.pop("retime_external_mem", False) # type: bool
         self.retime_external_addrmap = kwargs.pop("retime_external_addrmap", False) # type: bool
 
+        if user_read_fanin_stages is not None and self.max_read_fanin is not None:
+            msg.fatal("Options read_fanin_stages and max_read_fanin are mutually exclusive.")
+        if user_read_fanin_stages is not None:
+            if user_read_fanin_stages < 1:
+                msg.fatal("Number of read fanin stages shall be at least 1.")
+            self.retime_read_fanin = True
+        if self.max_read_fanin is not None:
+            if self.max_read_fanin < 2:
+                msg.fatal("Maximum read fanin shall be at least 2.")
+            self.retime_read_fanin = True
+
+        # Number of retiming stages of the readback reduction tree
+        self.read_fanin_stages = 0
+
         # Default reset type
         self.default_reset_activelow = kwargs.pop("default_reset_activelow", False) # type: bool
         self.default_reset_async = kwargs.pop("default_reset_async", False) # type: bool
@@ -279,6 +488,19 @@ class DesignState:
         self.err_if_bad_addr = kwargs.pop("err_if_bad_addr", False) # type: bool
         self.err_if_bad_rw = kwargs.pop("err_if_bad_rw", False) # type: bool
 
+        # Address decode options
+        self.hier_addr_decode = kwargs.pop("hier_addr_decode", False) # type: bool
+        self.minimize_addr_decode = kwargs.pop("minimize_addr_decode", False) # type: bool
+        self.packed_decode_strobes = kwargs.pop("packed_decode_strobes", False) # type: bool
+        self.unique_case_decode = kwargs.pop("unique_case_decode", False) # type: bool
+
+        # Readback options
+        self.and_or_readback = kwargs.pop("and_or_readback", False) # type: bool
+        self.indexed_array_readback = kwargs.pop("indexed_array_readback", False) # type: bool
+
+        # Issue reads and writes on independent request channels
+        self.dual_issue = kwargs.pop("dual_issue", False) # type: bool
+
         #------------------------
         # Info about the design
         #------------------------
@@ -317,6 +539,10 @@ class DesignState:
             # it has little benefit anyways
             self.retime_read_fanin = False
 
+        if self.dual_issue and self.has_external_addressable:
+            # External components only have a single request interface
+            msg.fatal("Option dual_issue is not supported in designs that contain external components.")
+
         #------------------------
         # Min address width encloses the total size AND at least 1 useful address bit
         self.addr_width = max(clog2(self.top_node.size), clog2(self.cpuif_data_width//8) + 1)
@@ -334,12 +560,39 @@ class DesignState:
             if relevant_addr_width < 2:
                 # Unable to partition the address space. Disable retiming
                 self.retime_read_fanin = False
+            elif self.max_read_fanin is not None:
+                # Each stage, including the first, selects using a group of
+                # address bits no wider than the fanin allows
+                group_width = self.max_read_fanin.bit_length() - 1
+                n_groups = -(-relevant_addr_width // group_width)
+                self.read_fanin_stages = min(max(n_groups - 1, 1), relevant_addr_width - 1)
+            elif user_read_fanin_stages is not None:
+                # Every stage needs at least one address bit to select with
+                self.read_fanin_stages = min(user_read_fanin_stages, relevant_addr_width - 1)
+                if self.read_fanin_stages < user_read_fanin_stages:
+                    msg.warning(
+                        f"Address space is too small for {user_read_fanin_stages} read fanin stages."
+                        f" Using {self.read_fanin_stages} instead.",
+                        self.top_node.def_src_ref
+                    )
+            else:
+                self.read_fanin_stages = 1
+
+        if self.indexed_array_readback and (self.retime_read_fanin or self.and_or_readback):
+            # Neither readback variant selects elements with an indexed mux
+            other = "retime_read_fanin" if self.retime_read_fanin else "and_or_readback"
+            msg.warning(
+                f"Option indexed_array_readback has no effect when combined with {other}.",
+                self.top_node.def_src_ref
+            )
 
     @property
     def min_read_latency(self) -> int:
         n = 0
-        if self.retime_read_fanin:
+        if self.retime_decode:
             n += 1
+        if self.retime_read_fanin:
+            n += self.read_fanin_stages
         if self.retime_read_response:
             n += 1
         return n
@@ -347,4 +600,6 @@ class DesignState:
     @property
     def min_write_latency(self) -> int:
         n = 0
+        if self.retime_decode:
+            n += 1
         return n
@@ -1,6 +1,6 @@
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Union, Iterator
 
-from systemrdl.rdltypes import PrecedenceType, InterruptType
+from systemrdl.rdltypes import PrecedenceType
 
 from .bases import AssignmentPrecedence, NextStateConditional
 from . import sw_onread
@@ -11,7 +11,6 @@ from . import hw_set_clr
 from . import hw_interrupts
 from . import hw_interrupts_with_write
 
-from ..utils import get_indexed_path
 from ..sv_int import SVInt
 
 from .generators import CombinationalStructGenerator, FieldStorageStructGenerator, FieldLogicGenerator
@@ -20,8 +19,13 @@ if TYPE_CHECKING:
     from typing import Dict, List
     from systemrdl.node import AddrmapNode, FieldNode
     from ..exporter import RegblockExporter, DesignState
+    from ..walker import GeneratorPass, GeneratorResult
 
 class FieldLogic:
+    _storage_struct: 'GeneratorResult'
+    _combo_struct: 'GeneratorResult'
+    _implementation: 'GeneratorResult'
+
     def __init__(self, exp:'RegblockExporter'):
         self.exp = exp
 
@@ -38,32 +42,33 @@ class FieldLogic:
     def top_node(self) -> 'AddrmapNode':
         return self.exp.ds.top_node
 
-    def get_storage_struct(self) -> str:
-        struct_gen = FieldStorageStructGenerator(self)
-        s = struct_gen.get_struct(self.top_node, "field_storage_t")
+    def add_generators(self, gen_pass: 'GeneratorPass') -> None:
+        self._storage_struct = gen_pass.add_struct(FieldStorageStructGenerator(self), "field_storage_t")
+        self._combo_struct = gen_pass.add_struct(CombinationalStructGenerator(self), "field_combo_t")
+        self._implementation = gen_pass.add_content(FieldLogicGenerator(self))
 
+    def get_storage_struct(self) -> Iterator[str]:
         # Only declare the storage struct if it exists
-        if s is None:
-            return ""
-
-        return s + "\nfield_storage_t field_storage;"
+        if self._storage_struct.is_empty:
+            return
+        yield from self._storage_struct.iter_content()
+        yield "\nfield_storage_t field_storage;"
 
-    def get_combo_struct(self) -> str:
-        struct_gen = CombinationalStructGenerator(self)
-        s = struct_gen.get_struct(self.top_node, "field_combo_t")
+    def get_storage_n_bits(self) -> int:
+        """
+        Number of flops of the storage struct
+        """
+        return self._storage_struct.n_bits
 
+    def get_combo_struct(self) -> Iterator[str]:
         # Only declare the storage struct if it exists
-        if s is None:
-            return ""
+        if self._combo_struct.is_empty:
+            return
+        yield from self._combo_struct.iter_content()
+        yield "\nfield_combo_t field_combo;"
 
-        return s + "\nfield_combo_t field_combo;"
-
-    def get_implementation(self) -> str:
-        gen = FieldLogicGenerator(self)
-        s = gen.get_content(self.top_node)
-        if s is None:
-            return ""
-        return s
+    def get_implementation(self) -> Iterator[str]:
+        return self._implementation.iter_content()
 
     #---------------------------------------------------------------------------
     # Field utility functions
@@ -74,7 +79,7 @@ class FieldLogic:
         for the referenced field
         """
         assert field.implements_storage
-        path = get_indexed_path(self.top_node, field)
+        path = self.ds.indexed_paths.get_indexed_path(field)
         return f"field_storage.{path}.value"
 
     def get_next_q_identifier(self, field: 'FieldNode') -> str:
@@ -83,7 +88,7 @@ class FieldLogic:
         for the delayed 'next' input value
         """
         assert field.implements_storage
-        path = get_indexed_path(self.top_node, field)
+        path = self.ds.indexed_paths.get_indexed_path(field)
         return f"field_storage.{path}.next_q"
 
     def get_field_combo_identifier(self, field: 'FieldNode', name: str) -> str:
@@ -92,7 +97,7 @@ class FieldLogic:
         signal.
         """
         assert field.implements_storage
-        path = get_indexed_path(self.top_node, field)
+        path = self.ds.indexed_paths.get_indexed_path(field)
         return f"field_combo.{path}.{name}"
 
     def get_counter_incr_strobe(self, field: 'FieldNode') -> str:
@@ -127,7 +132,7 @@ class FieldLogic:
         """
         Returns True if the counter saturates
         """
-        return field.get_property('incrsaturate') is not False
+        return self.ds.descriptors.get_field(field).incrsaturates
 
     def get_counter_incrthreshold_value(self, field: 'FieldNode') -> Union[SVInt, str]:
         prop_value = field.get_property('incrthreshold')
@@ -168,7 +173,7 @@ class FieldLogic:
         """
         Returns True if the counter saturates
         """
-        return field.get_property('decrsaturate') is not False
+        return self.ds.descriptors.get_field(field).decrsaturates
 
     def get_counter_decrthreshold_value(self, field: 'FieldNode') -> Union[SVInt, str]:
         prop_value = field.get_property('decrthreshold')
@@ -181,20 +186,26 @@ class FieldLogic:
         """
         Asserted when field is software accessed (read or write)
         """
-        buffer_reads = field.parent.get_property('buffer_reads')
-        buffer_writes = field.parent.get_property('buffer_writes')
+        reg = self.ds.descriptors.get_reg(field.parent)
+        buffer_reads = reg.buffer_reads
+        buffer_writes = reg.buffer_writes
         if buffer_reads and buffer_writes:
             rstrb = self.exp.read_buffering.get_trigger(field.parent)
             wstrb = self.exp.write_buffering.get_write_strobe(field)
             return f"{rstrb} || {wstrb}"
         elif buffer_reads and not buffer_writes:
-            strb = self.exp.dereferencer.get_access_strobe(field)
+            strb = self.exp.dereferencer.get_write_strobe(field)
             rstrb = self.exp.read_buffering.get_trigger(field.parent)
-            return f"{rstrb} || ({strb} && decoded_req_is_wr)"
+            return f"{rstrb} || ({strb})"
         elif not buffer_reads and buffer_writes:
-            strb = self.exp.dereferencer.get_access_strobe(field)
+            strb = self.exp.dereferencer.get_read_strobe(field)
             wstrb = self.exp.write_buffering.get_write_strobe(field)
-            return f"{wstrb} || ({strb} && !decoded_req_is_wr)"
+            return f"{wstrb} || ({strb})"
+        elif self.ds.dual_issue:
+            # Reads and writes have separate strobes
+            wstrb = self.exp.dereferencer.get_write_strobe(field)
+            rstrb = self.exp.dereferencer.get_read_strobe(field)
+            return f"{wstrb} || {rstrb}"
         else:
             strb = self.exp.dereferencer.get_access_strobe(field)
             return strb
@@ -203,53 +214,49 @@ class FieldLogic:
         """
         Asserted when field is software accessed (read)
         """
-        buffer_reads = field.parent.get_property('buffer_reads')
+        buffer_reads = self.ds.descriptors.get_reg(field.parent).buffer_reads
         if buffer_reads:
             rstrb = self.exp.read_buffering.get_trigger(field.parent)
             return rstrb
         else:
-            strb = self.exp.dereferencer.get_access_strobe(field)
-            return f"{strb} && !decoded_req_is_wr"
+            return self.exp.dereferencer.get_read_strobe(field)
 
     def get_wr_swacc_identifier(self, field: 'FieldNode') -> str:
         """
         Asserted when field is software accessed (write)
         """
-        buffer_writes = field.parent.get_property('buffer_writes')
+        buffer_writes = self.ds.descriptors.get_reg(field.parent).buffer_writes
         if buffer_writes:
             wstrb = self.exp.write_buffering.get_write_strobe(field)
             return wstrb
         else:
-            strb = self.exp.dereferencer.get_access_strobe(field)
-            return f"{strb} && decoded_req_is_wr"
+            return self.exp.dereferencer.get_write_strobe(field)
 
     def get_swmod_identifier(self, field: 'FieldNode') -> str:
         """
         Asserted when field is modified by software (written or read with a
         set or clear side effect).
         """
+        reg = self.ds.descriptors.get_reg(field.parent)
         w_modifiable = field.is_sw_writable
         r_modifiable = field.get_property('onread') is not None
-        buffer_writes = field.parent.get_property('buffer_writes')
-        buffer_reads = field.parent.get_property('buffer_reads')
-        accesswidth = field.parent.get_property("accesswidth")
-
-
-        astrb = self.exp.dereferencer.get_access_strobe(field)
+        buffer_writes = reg.buffer_writes
+        buffer_reads = reg.buffer_reads
+        accesswidth = reg.accesswidth
 
         conditions = []
         if r_modifiable:
             if buffer_reads:
                 rstrb = self.exp.read_buffering.get_trigger(field.parent)
             else:
-                rstrb = f"{astrb} && !decoded_req_is_wr"
+                rstrb = self.exp.dereferencer.get_read_strobe(field)
             conditions.append(rstrb)
 
         if w_modifiable:
             if buffer_writes:
                 wstrb = self.exp.write_buffering.get_write_strobe(field)
             else:
-                wstrb = f"{astrb} && decoded_req_is_wr"
+                wstrb = self.exp.dereferencer.get_write_strobe(field)
 
             # Due to 10.6.1-f, it is impossible for a field that is sw-writable to
             # be split across subwords.
@@ -272,14 +279,14 @@ class FieldLogic:
         """
         Returns the identifier for the stored 'golden' parity value of the field
         """
-        path = get_indexed_path(self.top_node, field)
+        path = self.ds.indexed_paths.get_indexed_path(field)
         return f"field_storage.{path}.parity"
 
     def get_parity_error_identifier(self, field: 'FieldNode') -> str:
         """
         Returns the identifier for whether the field currently has a parity error
         """
-        path = get_indexed_path(self.top_node, field)
+        path = self.ds.indexed_paths.get_indexed_path(field)
         return f"field_combo.{path}.parity_error"
 
     def has_next_q(self, field: 'FieldNode') -> bool:
@@ -289,21 +296,15 @@ class FieldLogic:
 
         Returns True if this is the case.
         """
-        if field.get_property('intr type') in {
-            InterruptType.posedge,
-            InterruptType.negedge,
-            InterruptType.bothedge
-        }:
-            return True
-
-        return False
+        return self.ds.descriptors.get_field(field).has_next_q
 
     def get_wbus_bitslice(self, field: 'FieldNode', subword_idx: int = 0) -> str:
         """
         Get the bitslice range string of the internal cpuif's data/biten bus
         that corresponds to this field
         """
-        if field.parent.get_property('buffer_writes'):
+        reg = self.ds.descriptors.get_reg(field.parent)
+        if reg.buffer_writes:
             # register is buffered.
             # write buffer is the full width of the register. no need to deal with subwords
             high = field.high
@@ -311,7 +312,7 @@ class FieldLogic:
             if field.msb < field.lsb:
                 # slice is for an msb0 field.
                 # mirror it
-                regwidth = field.parent.get_property('regwidth')
+                regwidth = reg.regwidth
                 low = regwidth - 1 - low
                 high = regwidth - 1 - high
                 low, high = high, low
@@ -321,7 +322,7 @@ class FieldLogic:
             # values unchanged.
             # For fields within a wide register (accesswidth < regwidth), low/high
             # may be shifted down and clamped depending on which sub-word is being accessed
-            accesswidth = field.parent.get_property('accesswidth')
+            accesswidth = reg.accesswidth
 
             # Shift based on subword
             high = field.high - (subword_idx * accesswidth)
@@ -345,7 +346,7 @@ class FieldLogic:
         """
         Get the bit-enable slice that corresponds to this field
         """
-        if field.parent.get_property('buffer_writes'):
+        if self.ds.descriptors.get_reg(field.parent).buffer_writes:
             # Is buffered. Use value from write buffer
             # No need to check msb0 ordering. Bus is pre-swapped, and bitslice
             # accounts for it
@@ -367,7 +368,7 @@ class FieldLogic:
         """
         Get the write data slice that corresponds to this field
         """
-        if field.parent.get_property('buffer_writes'):
+        if self.ds.descriptors.get_reg(field.parent).buffer_writes:
             # Is buffered. Use value from write buffer
             # No need to check msb0 ordering. Bus is pre-swapped, and bitslice
             # accounts for it
@@ -487,6 +488,13 @@ class FieldLogic:
         The returned list is sorted in priority order - the conditional with highest
         precedence is first in the list.
         """
+        desc = self.ds.descriptors.get_field(field)
+        if desc.conditionals is None:
+            desc.conditionals = self._match_conditionals(field)
+        return desc.conditionals
+
+
+    def _match_conditionals(self, field: 'FieldNode') -> 'List[NextStateConditional]':
         sw_precedence = field.get_property('precedence') == PrecedenceType.sw
         result = []
 
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, Union
 
 from collections import OrderedDict
 
@@ -7,14 +7,15 @@ from systemrdl.node import RegNode, RegfileNode, MemNode, AddrmapNode
 
 from ..struct_generator import RDLStructGenerator
 from ..forloop_generator import RDLForLoopGenerator
-from ..utils import get_indexed_path, clog2
+from ..utils import clog2
+from ..sv_int import SVInt
 from ..identifier_filter import kw_filter as kwf
 from .bases import NextStateUnconditional
 
 if TYPE_CHECKING:
     from . import FieldLogic
-    from systemrdl.node import FieldNode, AddressableNode
-    from .bases import SVLogic
+    from systemrdl.node import FieldNode, AddressableNode, SignalNode
+    from .bases import SVLogic, NextStateConditional
 
 class CombinationalStructGenerator(RDLStructGenerator):
 
@@ -30,8 +31,10 @@ class CombinationalStructGenerator(RDLStructGenerator):
         return WalkerAction.Continue
 
     def enter_Field(self, node: 'FieldNode') -> None:
+        desc = self.field_logic.ds.descriptors.get_field(node)
+
         # If a field doesn't implement storage, it is not relevant here
-        if not node.implements_storage:
+        if not desc.implements_storage:
             return
 
         # collect any extra combo signals that this field requires
@@ -50,11 +53,11 @@ class CombinationalStructGenerator(RDLStructGenerator):
         self.add_member("load_next")
         for signal in extra_combo_signals.values():
             self.add_member(signal.name, signal.width)
-        if node.is_up_counter:
+        if desc.is_up_counter:
             self.add_up_counter_members(node)
-        if node.is_down_counter:
+        if desc.is_down_counter:
             self.add_down_counter_members(node)
-        if node.get_property('paritycheck'):
+        if desc.paritycheck:
             self.add_member("parity_error")
         self.pop_struct()
 
@@ -87,21 +90,37 @@ class FieldStorageStructGenerator(RDLStructGenerator):
         return WalkerAction.Continue
 
     def enter_Field(self, node: 'FieldNode') -> None:
+        desc = self.field_logic.ds.descriptors.get_field(node)
         self.push_struct(kwf(node.inst_name))
 
-        if node.implements_storage:
+        if desc.implements_storage:
             self.add_member("value", node.width)
-            if node.get_property('paritycheck'):
+            if desc.paritycheck:
                 self.add_member("parity")
 
-        if self.field_logic.has_next_q(node):
+        if desc.has_next_q:
             self.add_member("next_q", node.width)
 
         self.pop_struct()
 
 
+def _indent(s: str) -> str:
+    """
+    Equivalent of Jinja's ``indent`` filter using its default arguments
+    """
+    lines = (s + "\n").splitlines()
+    return "\n".join(
+        [lines[0]] + [("    " + line) if line else line for line in lines[1:]]
+    )
+
+
 class FieldLogicGenerator(RDLForLoopGenerator):
     i_type = "genvar"
+
+    # Emit simple field storage logic directly rather than rendering
+    # field_storage.sv. Both produce identical output.
+    use_fast_path = True
+
     def __init__(self, field_logic: 'FieldLogic') -> None:
         super().__init__()
         self.field_logic = field_logic
@@ -146,14 +165,15 @@ class FieldLogicGenerator(RDLForLoopGenerator):
 
 
     def enter_Field(self, node: 'FieldNode') -> None:
-        if node.implements_storage:
+        desc = self.ds.descriptors.get_field(node)
+        if desc.implements_storage:
             self.generate_field_storage(node)
 
         self.assign_field_outputs(node)
 
-        if node.get_property('intr'):
+        if desc.intr:
             self.intr_fields.append(node)
-            if node.get_property('haltenable') or node.get_property('haltmask'):
+            if desc.halt:
                 self.halt_fields.append(node)
 
 
@@ -244,6 +264,14 @@ class FieldLogicGenerator(RDLForLoopGenerator):
             reset_value_str = None
             resetsignal = None
 
+        if self.use_fast_path and not extra_combo_signals:
+            desc = self.ds.descriptors.get_field(node)
+            if not (desc.is_up_counter or desc.is_down_counter):
+                self.add_content(self.emit_field_storage(
+                    node, conditionals, unconditional, reset_value_str, resetsignal
+                ))
+                return
+
         context = {
             'node': node,
             'reset': reset_value_str,
@@ -261,7 +289,109 @@ class FieldLogicGenerator(RDLForLoopGenerator):
         self.add_content(self.field_storage_template.render(context))
 
 
+    def emit_field_storage(
+        self,
+        node: 'FieldNode',
+        conditionals: 'List[NextStateConditional]',
+        unconditional: Optional[NextStateUnconditional],
+        reset_value_str: Optional[Union[SVInt, str]],
+        resetsignal: Optional['SignalNode'],
+    ) -> str:
+        """
+        Produces the same output as field_storage.sv without going through Jinja.
+
+        Only handles fields that are not counters, and do not require any extra
+        combinational signals.
+        """
+        fl = self.field_logic
+        desc = self.ds.descriptors.get_field(node)
+        storage = fl.get_storage_identifier(node)
+        next_id = fl.get_field_combo_identifier(node, "next")
+        load_next = fl.get_field_combo_identifier(node, "load_next")
+
+        s = [
+            f"// Field: {node.get_path()}\n"
+            "always_comb begin\n"
+            f"    automatic logic [{node.width-1}:0] next_c;\n"
+            "    automatic logic load_next_c;\n"
+            f"    next_c = {storage};\n"
+            "    load_next_c = '0;\n"
+            "    "
+        ]
+
+        for i, conditional in enumerate(conditionals):
+            if i:
+                s.append(" else ")
+            s.append(f"if({conditional.get_predicate(node)}) begin // {conditional.comment}")
+            for assignment in conditional.get_assignments(node):
+                s.append("\n        " + _indent(assignment))
+            s.append("\n    end")
+
+        if unconditional:
+            if conditionals:
+                s.append(f" else begin // {unconditional.comment}")
+                for assignment in unconditional.get_assignments(node):
+                    s.append("\n        " + _indent(assignment))
+                s.append("\n    end")
+            else:
+                s.append(f"\n    // {unconditional.comment}")
+                for assignment in unconditional.get_assignments(node):
+                    s.append("\n    " + _indent(assignment))
+
+        s.append(f"\n    {next_id} = next_c;\n    {load_next} = load_next_c;")
+        if desc.paritycheck:
+            s.append(
+                f"\n    {fl.get_parity_error_identifier(node)} = "
+                f"({fl.get_parity_identifier(node)} != ^{storage});"
+            )
+        s.append("\nend")
+
+        if reset_value_str is not None:
+            s.append(
+                f"\nalways_ff {self.exp.dereferencer.get_always_ff_event(resetsignal)} begin"
+                f"\n    if({self.exp.dereferencer.get_resetsignal(resetsignal)}) begin"
+                f"\n        {storage} <= {reset_value_str};"
+            )
+            if desc.paritycheck:
+                s.append(f"\n        {fl.get_parity_identifier(node)} <= ^{reset_value_str};")
+            if desc.has_next_q:
+                s.append(f"\n        {fl.get_next_q_identifier(node)} <= {reset_value_str};")
+            s.append(
+                "\n    end else begin"
+                f"\n        if({load_next}) begin"
+                f"\n            {storage} <= {next_id};"
+            )
+            if desc.paritycheck:
+                s.append(f"\n            {fl.get_parity_identifier(node)} <= ^{next_id};")
+            s.append("\n        end")
+            if desc.has_next_q:
+                s.append(
+                    f"\n        {fl.get_next_q_identifier(node)} <= "
+                    f"{self.exp.hwif.get_input_identifier(node)};"
+                )
+            s.append("\n    end\nend")
+        else:
+            s.append(
+                "\nalways_ff @(posedge clk) begin"
+                f"\n    if({load_next}) begin"
+                f"\n        {storage} <= {next_id};"
+            )
+            if desc.paritycheck:
+                s.append(f"\n        {fl.get_parity_identifier(node)} <= ^{next_id};")
+            s.append("\n    end")
+            if desc.has_next_q:
+                s.append(
+                    f"\n    {fl.get_next_q_identifier(node)} <= "
+                    f"{self.exp.hwif.get_input_identifier(node)};"
+                )
+            s.append("\nend")
+
+        return "".join(s)
+
+
     def assign_field_outputs(self, node: 'FieldNode') -> None:
+        desc = self.ds.descriptors.get_field(node)
+
         # Field value output
         if self.exp.hwif.has_value_output(node):
             output_identifier = self.exp.hwif.get_output_identifier(node)
@@ -271,19 +401,19 @@ class FieldLogicGenerator(RDLForLoopGenerator):
             )
 
         # Inferred logical reduction outputs
-        if node.get_property('anded'):
+        if desc.anded:
             output_identifier = self.exp.hwif.get_implied_prop_output_identifier(node, "anded")
             value = self.exp.dereferencer.get_field_propref_value(node, "anded")
             self.add_content(
                 f"assign {output_identifier} = {value};"
             )
-        if node.get_property('ored'):
+        if desc.ored:
             output_identifier = self.exp.hwif.get_implied_prop_output_identifier(node, "ored")
             value = self.exp.dereferencer.get_field_propref_value(node, "ored")
             self.add_content(
                 f"assign {output_identifier} = {value};"
             )
-        if node.get_property('xored'):
+        if desc.xored:
             output_identifier = self.exp.hwif.get_implied_prop_output_identifier(node, "xored")
             value = self.exp.dereferencer.get_field_propref_value(node, "xored")
             self.add_content(
@@ -291,25 +421,25 @@ class FieldLogicGenerator(RDLForLoopGenerator):
             )
 
         # Software access strobes
-        if node.get_property('swmod'):
+        if desc.swmod:
             output_identifier = self.exp.hwif.get_implied_prop_output_identifier(node, "swmod")
             value = self.field_logic.get_swmod_identifier(node)
             self.add_content(
                 f"assign {output_identifier} = {value};"
             )
-        if node.get_property('swacc'):
+        if desc.swacc:
             output_identifier = self.exp.hwif.get_implied_prop_output_identifier(node, "swacc")
             value = self.field_logic.get_swacc_identifier(node)
             self.add_content(
                 f"assign {output_identifier} = {value};"
             )
-        if node.get_property('rd_swacc'):
+        if desc.rd_swacc:
             output_identifier = self.exp.hwif.get_implied_prop_output_identifier(node, "rd_swacc")
             value = self.field_logic.get_rd_swacc_identifier(node)
             self.add_content(
                 f"assign {output_identifier} = {value};"
             )
-        if node.get_property('wr_swacc'):
+        if desc.wr_swacc:
             output_identifier = self.exp.hwif.get_implied_prop_output_identifier(node, "wr_swacc")
             value = self.field_logic.get_wr_swacc_identifier(node)
             self.add_content(
@@ -317,13 +447,13 @@ class FieldLogicGenerator(RDLForLoopGenerator):
             )
 
         # Counter thresholds
-        if node.get_property('incrthreshold') is not False: # (explicitly not False. Not 0)
+        if desc.incrthreshold:
             output_identifier = self.exp.hwif.get_implied_prop_output_identifier(node, "incrthreshold")
             value = self.field_logic.get_field_combo_identifier(node, 'incrthreshold')
             self.add_content(
                 f"assign {output_identifier} = {value};"
             )
-        if node.get_property('decrthreshold') is not False: # (explicitly not False. Not 0)
+        if desc.decrthreshold:
             output_identifier = self.exp.hwif.get_implied_prop_output_identifier(node, "decrthreshold")
             value = self.field_logic.get_field_combo_identifier(node, 'decrthreshold')
             self.add_content(
@@ -331,13 +461,13 @@ class FieldLogicGenerator(RDLForLoopGenerator):
             )
 
         # Counter events
-        if node.get_property('overflow'):
+        if desc.overflow:
             output_identifier = self.exp.hwif.get_implied_prop_output_identifier(node, "overflow")
             value = self.field_logic.get_field_combo_identifier(node, 'overflow')
             self.add_content(
                 f"assign {output_identifier} = {value};"
             )
-        if node.get_property('underflow'):
+        if desc.underflow:
             output_identifier = self.exp.hwif.get_implied_prop_output_identifier(node, "underflow")
             value = self.field_logic.get_field_combo_identifier(node, 'underflow')
             self.add_content(
@@ -346,10 +476,10 @@ class FieldLogicGenerator(RDLForLoopGenerator):
 
 
     def assign_external_reg_outputs(self, node: 'RegNode') -> None:
-        prefix = "hwif_out." + get_indexed_path(self.exp.ds.top_node, node)
+        prefix = "hwif_out." + self.exp.ds.indexed_paths.get_indexed_path(node)
         strb = self.exp.dereferencer.get_access_strobe(node)
 
-        width = min(self.exp.cpuif.data_width, node.get_property('regwidth'))
+        width = min(self.exp.cpuif.data_width, self.ds.descriptors.get_reg(node).regwidth)
         if width != self.exp.cpuif.data_width:
             bslice = f"[{width - 1}:0]"
         else:
@@ -370,7 +500,7 @@ class FieldLogicGenerator(RDLForLoopGenerator):
         self.add_content(self.external_reg_template.render(context))
 
     def assign_external_block_outputs(self, node: 'AddressableNode') -> None:
-        prefix = "hwif_out." + get_indexed_path(self.exp.ds.top_node, node)
+        prefix = "hwif_out." + self.exp.ds.indexed_paths.get_indexed_path(node)
         strb = self.exp.dereferencer.get_external_block_access_strobe(node)
         addr_width = clog2(node.size)
 
@@ -15,7 +15,7 @@ class _OnWrite(NextStateConditional):
         return field.is_sw_writable and field.get_property('onwrite') == self.onwritetype
 
     def get_predicate(self, field: 'FieldNode') -> str:
-        if field.parent.get_property('buffer_writes'):
+        if self.exp.ds.descriptors.get_reg(field.parent).buffer_writes:
             # Is buffered write. Use alternate strobe
             wstrb = self.exp.write_buffering.get_write_strobe(field)
 
@@ -27,17 +27,17 @@ class _OnWrite(NextStateConditional):
             return wstrb
         else:
             # is regular register
-            strb = self.exp.dereferencer.get_access_strobe(field)
+            strb = self.exp.dereferencer.get_write_strobe(field)
 
             if field.get_property('swwe') or field.get_property('swwel'):
                 # dereferencer will wrap swwel complement if necessary
                 qualifier = self.exp.dereferencer.get_field_propref_value(field, 'swwe')
-                return f"{strb} && decoded_req_is_wr && {qualifier}"
+                return f"{strb} && {qualifier}"
 
-            return f"{strb} && decoded_req_is_wr"
+            return strb
 
     def get_assignments(self, field: 'FieldNode') -> List[str]:
-        accesswidth = field.parent.get_property("accesswidth")
+        accesswidth = self.exp.ds.descriptors.get_reg(field.parent).accesswidth
 
         # Due to 10.6.1-f, it is impossible for a field with an onwrite action to
         # be split across subwords.
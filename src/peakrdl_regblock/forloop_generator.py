@@ -1,8 +1,10 @@
-from typing import TYPE_CHECKING, Optional, List, Union
+from typing import TYPE_CHECKING, Optional, List, Union, Dict, Iterator
 import textwrap
 
 from systemrdl.walker import RDLListener, RDLWalker, WalkerAction
 
+from .sv_int import SVInt
+
 if TYPE_CHECKING:
     from systemrdl.node import AddressableNode, Node
 
@@ -11,9 +13,25 @@ class Body:
     def __init__(self) -> None:
         self.children = [] # type: List[Union[str, Body]]
 
+    def iter_chunks(self, prefix: str = "") -> Iterator[str]:
+        """
+        Yield the body's text in chunks, with all lines indented by ``prefix``.
+
+        Indentation is applied once per leaf string rather than re-indenting
+        the text at each level of nesting.
+        """
+        for i, child in enumerate(self.children):
+            if i:
+                yield "\n"
+            if isinstance(child, Body):
+                yield from child.iter_chunks(prefix)
+            elif prefix:
+                yield textwrap.indent(child, prefix)
+            else:
+                yield child
+
     def __str__(self) -> str:
-        s = '\n'.join((str(x) for x in self.children))
-        return s
+        return "".join(self.iter_chunks())
 
 class LoopBody(Body):
     def __init__(self, dim: int, iterator: str, i_type: str) -> None:
@@ -22,13 +40,43 @@ class LoopBody(Body):
         self.iterator = iterator
         self.i_type = i_type
 
-    def __str__(self) -> str:
-        s = super().__str__()
-        return (
-            f"for({self.i_type} {self.iterator}=0; {self.iterator}<{self.dim}; {self.iterator}++) begin\n"
-            + textwrap.indent(s, "    ")
-            + "\nend"
-        )
+    def iter_chunks(self, prefix: str = "") -> Iterator[str]:
+        yield f"{prefix}for({self.i_type} {self.iterator}=0; {self.iterator}<{self.dim}; {self.iterator}++) begin\n"
+        yield from super().iter_chunks(prefix + "    ")
+        yield f"\n{prefix}end"
+
+
+class UniqueCaseBody(Body):
+    """
+    ``unique0 case`` statement that selects a group of statements by the
+    value of an expression.
+
+    Items are written in order of their value, so that tools can see that all
+    of them are mutually exclusive.
+    """
+    def __init__(self, expr: str, width: int) -> None:
+        super().__init__()
+        self.expr = expr
+        self.width = width
+        self.items = {} # type: Dict[int, List[str]]
+
+    def add_item_content(self, value: int, s: str) -> None:
+        self.items.setdefault(value, []).append(s)
+
+    def iter_chunks(self, prefix: str = "") -> Iterator[str]:
+        yield f"{prefix}unique0 case({self.expr})"
+        item_prefix = prefix + "    "
+        for value in sorted(self.items.keys()):
+            label = SVInt(value, self.width)
+            statements = self.items[value]
+            if len(statements) == 1 and "\n" not in statements[0]:
+                yield f"\n{item_prefix}{label}: {statements[0]}"
+                continue
+            yield f"\n{item_prefix}{label}: begin"
+            for statement in statements:
+                yield "\n" + textwrap.indent(statement, item_prefix + "    ")
+            yield f"\n{item_prefix}end"
+        yield f"\n{prefix}endcase"
 
 
 class ForLoopGenerator:
@@ -43,6 +91,17 @@ class ForLoopGenerator:
     def current_loop(self) -> Body:
         return self._stack[-1]
 
+    @property
+    def n_iterations(self) -> int:
+        """
+        Number of times that the current loop body is repeated
+        """
+        n = 1
+        for b in self._stack:
+            if isinstance(b, LoopBody):
+                n *= b.dim
+        return n
+
     def push_loop(self, dim: int) -> None:
         i = f"i{self._loop_level}"
         b = self.loop_body_cls(dim, i, self.i_type)
@@ -65,12 +124,21 @@ class ForLoopGenerator:
         b = Body()
         self._stack.append(b)
 
-    def finish(self) -> Optional[str]:
+    def detach(self) -> Optional[Body]:
+        """
+        Complete the generator's content without rendering it to a string
+        """
         b = self._stack.pop()
         assert not self._stack
 
         if not b.children:
             return None
+        return b
+
+    def finish(self) -> Optional[str]:
+        b = self.detach()
+        if b is None:
+            return None
         return str(b)
 
 class RDLForLoopGenerator(ForLoopGenerator, RDLListener):
@@ -3,7 +3,6 @@ from typing import TYPE_CHECKING, Union, Optional, TextIO
 from systemrdl.node import AddrmapNode, SignalNode, FieldNode, RegNode, AddressableNode
 from systemrdl.rdltypes import PropertyReference
 
-from ..utils import get_indexed_path
 from ..identifier_filter import kw_filter as kwf
 from ..sv_int import SVInt
 
@@ -13,6 +12,7 @@ from .generators import EnumGenerator
 
 if TYPE_CHECKING:
     from ..exporter import RegblockExporter, DesignState
+    from ..walker import GeneratorPass, GeneratorResult
 
 class Hwif:
     """
@@ -21,6 +21,10 @@ class Hwif:
     - Field inputs
     - Signal inputs (except those that are promoted to the top)
     """
+    _gen_in: InputStructGenerator_Hier
+    _gen_out: OutputStructGenerator_Hier
+    _structs_in: 'GeneratorResult'
+    _structs_out: 'GeneratorResult'
 
     def __init__(
         self, exp: 'RegblockExporter',
@@ -64,28 +68,38 @@ class Hwif:
         return "\n".join(lines)
 
 
+    def add_generators(self, gen_pass: 'GeneratorPass') -> None:
+        self._gen_in = self._gen_in_cls(self)
+        self._structs_in = gen_pass.add_struct(
+            self._gen_in,
+            f"{self.top_node.inst_name}__in_t"
+        )
+
+        self._gen_out = self._gen_out_cls(self)
+        self._structs_out = gen_pass.add_struct(
+            self._gen_out,
+            f"{self.top_node.inst_name}__out_t"
+        )
+
+
     def get_package_contents(self) -> str:
         """
         If this hwif requires a package, generate the string
         """
         lines = [""]
 
-        gen_in = self._gen_in_cls(self)
-        structs_in = gen_in.get_struct(
-            self.top_node,
-            f"{self.top_node.inst_name}__in_t"
-        )
+        if self.hwif_report_file:
+            self.hwif_report_file.writelines(self._gen_in.hwif_report_lines)
+            self.hwif_report_file.writelines(self._gen_out.hwif_report_lines)
+
+        structs_in = self._structs_in.content
         if structs_in is not None:
             self.has_input_struct = True
             lines.append(structs_in)
         else:
             self.has_input_struct = False
 
-        gen_out = self._gen_out_cls(self)
-        structs_out = gen_out.get_struct(
-            self.top_node,
-            f"{self.top_node.inst_name}__out_t"
-        )
+        structs_out = self._structs_out.content
         if structs_out is not None:
             self.has_output_struct = True
             lines.append(structs_out)
@@ -161,12 +175,12 @@ class Hwif:
                 # 'next' property replaces the inferred input signal
                 return self.exp.dereferencer.get_value(next_value, width)
             # Otherwise, use inferred
-            path = get_indexed_path(self.top_node, obj)
+            path = self.ds.indexed_paths.get_indexed_path(obj)
             return "hwif_in." + path + ".next"
         elif isinstance(obj, SignalNode):
             if obj.get_path() in self.ds.out_of_hier_signals:
                 return kwf(obj.inst_name)
-            path = get_indexed_path(self.top_node, obj)
+            path = self.ds.indexed_paths.get_indexed_path(obj)
             return "hwif_in." + path
         elif isinstance(obj, PropertyReference):
             assert isinstance(obj.node, FieldNode)
@@ -178,21 +192,21 @@ class Hwif:
         """
         Returns the identifier string for an external component's rd_data signal
         """
-        path = get_indexed_path(self.top_node, node)
+        path = self.ds.indexed_paths.get_indexed_path(node)
         return "hwif_in." + path + ".rd_data"
 
     def get_external_rd_ack(self, node: AddressableNode) -> str:
         """
         Returns the identifier string for an external component's rd_ack signal
         """
-        path = get_indexed_path(self.top_node, node)
+        path = self.ds.indexed_paths.get_indexed_path(node)
         return "hwif_in." + path + ".rd_ack"
 
     def get_external_wr_ack(self, node: AddressableNode) -> str:
         """
         Returns the identifier string for an external component's wr_ack signal
         """
-        path = get_indexed_path(self.top_node, node)
+        path = self.ds.indexed_paths.get_indexed_path(node)
         return "hwif_in." + path + ".wr_ack"
 
     def get_implied_prop_input_identifier(self, field: FieldNode, prop: str) -> str:
@@ -200,7 +214,7 @@ class Hwif:
             'hwclr', 'hwset', 'swwe', 'swwel', 'we', 'wel',
             'incr', 'decr', 'incrvalue', 'decrvalue'
         }
-        path = get_indexed_path(self.top_node, field)
+        path = self.ds.indexed_paths.get_indexed_path(field)
         return "hwif_in." + path + "." + prop
 
 
@@ -215,7 +229,7 @@ class Hwif:
         raises an exception if obj is invalid
         """
         if isinstance(obj, FieldNode):
-            path = get_indexed_path(self.top_node, obj)
+            path = self.ds.indexed_paths.get_indexed_path(obj)
             return "hwif_out." + path + ".value"
         elif isinstance(obj, PropertyReference):
             # TODO: this might be dead code.
@@ -239,5 +253,5 @@ class Hwif:
             assert prop in {
                 "intr", "halt",
             }
-        path = get_indexed_path(self.top_node, node)
+        path = self.ds.indexed_paths.get_indexed_path(node)
         return "hwif_out." + path + "." + prop
@@ -20,6 +20,7 @@ class HWIFStructGenerator(RDLFlatStructGenerator):
         self.top_node = hwif.top_node
 
         self.hwif_report_stack = [hwif_name]
+        self.hwif_report_lines = [] # type: List[str]
 
     def push_struct(self, type_name: str, inst_name: str, array_dimensions: Optional[List[int]] = None, packed: bool = False) -> None: # type: ignore
         super().push_struct(type_name, inst_name, array_dimensions, packed)
@@ -45,7 +46,7 @@ class HWIFStructGenerator(RDLFlatStructGenerator):
 
         path = ".".join(self.hwif_report_stack)
         if self.hwif.hwif_report_file:
-            self.hwif.hwif_report_file.write(f"{path}.{name}{suffix}\n")
+            self.hwif_report_lines.append(f"{path}.{name}{suffix}\n")
 
 #-------------------------------------------------------------------------------
 
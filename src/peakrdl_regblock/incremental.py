@@ -0,0 +1,160 @@
+import os
+import json
+import filecmp
+import hashlib
+from typing import TYPE_CHECKING, Any, Dict, List, Set
+
+import jinja2 as jj
+from jinja2 import meta as jj_meta
+from systemrdl.node import Node, AddressableNode, FieldNode, SignalNode
+from systemrdl.rdltypes import PropertyReference, UserEnum, UserStruct
+
+from .__about__ import __version__
+
+if TYPE_CHECKING:
+    from systemrdl.node import AddrmapNode
+
+
+def _serialize_value(value: Any) -> str:
+    """
+    Get a stable text representation of a property value
+    """
+    if isinstance(value, SignalNode):
+        # Signal may be declared outside of the exported hierarchy, in which
+        # case its properties are not otherwise captured.
+        return f"node:{value.get_path()}{_serialize_properties(value)}"
+    if isinstance(value, Node):
+        return f"node:{value.get_path()}"
+    if isinstance(value, PropertyReference):
+        return f"ref:{value.node.get_path()}->{value.name}"
+    if isinstance(value, type) and issubclass(value, UserEnum):
+        members = ",".join(f"{m.name}={m.value}" for m in value)
+        return f"enum:{value.get_scope_path('__')}::{value.type_name}{{{members}}}"
+    if isinstance(value, UserEnum):
+        return f"enum_member:{_serialize_value(type(value))}.{value.name}"
+    if isinstance(value, UserStruct):
+        members = ",".join(f"{k}={_serialize_value(v)}" for k, v in value.members.items())
+        return f"struct:{type(value).__name__}{{{members}}}"
+    if isinstance(value, list):
+        return "[" + ",".join(_serialize_value(v) for v in value) + "]"
+    return repr(value)
+
+
+def _serialize_properties(node: Node) -> str:
+    props = [
+        f"{name}={_serialize_value(node.get_property(name))}"
+        for name in node.list_properties()
+    ]
+    return "{" + ";".join(props) + "}"
+
+
+def _serialize_node(node: Node) -> str:
+    parts = [
+        type(node).__name__,
+        node.get_path(),
+        str(node.type_name),
+        str(node.get_global_type_name("__")),
+        str(node.external),
+    ]
+    if isinstance(node, AddressableNode):
+        parts.append(str(node.raw_address_offset))
+        parts.append(str(node.array_dimensions))
+        parts.append(str(node.array_stride))
+        parts.append(str(node.size))
+    elif isinstance(node, FieldNode):
+        parts.append(f"[{node.msb}:{node.lsb}]")
+    parts.append(_serialize_properties(node))
+    return "|".join(parts)
+
+
+def _serialize_option(value: Any) -> str:
+    if isinstance(value, type):
+        # ie: cpuif_cls
+        return f"{value.__module__}.{value.__qualname__}"
+    return repr(value)
+
+
+def get_template_digest(jj_env: jj.Environment, name: str) -> str:
+    """
+    Hash the source of a template, and of all templates that it includes,
+    imports or extends.
+    """
+    h = hashlib.sha256()
+    pending = [name]
+    visited = set() # type: Set[str]
+    while pending:
+        name = pending.pop()
+        if name in visited:
+            continue
+        visited.add(name)
+        assert jj_env.loader is not None
+        source, _, _ = jj_env.loader.get_source(jj_env, name)
+        h.update(f"template:{name}\n".encode("utf-8"))
+        h.update(source.encode("utf-8"))
+        for ref in jj_meta.find_referenced_templates(jj_env.parse(source)):
+            if ref is not None:
+                pending.append(ref)
+    return h.hexdigest()
+
+
+def get_fingerprint(top_node: 'AddrmapNode', options: Dict[str, Any], cpuif_template_digest: str) -> str:
+    """
+    Compute a hash that identifies the output of an export.
+
+    This covers the elaborated design, the export options, the CPU interface's
+    templates, and the version of the exporter.
+    """
+    h = hashlib.sha256()
+    h.update(f"peakrdl-regblock {__version__}\n".encode("utf-8"))
+    h.update(f"cpuif_template:{cpuif_template_digest}\n".encode("utf-8"))
+
+    for name in sorted(options.keys()):
+        h.update(f"option:{name}={_serialize_option(options[name])}\n".encode("utf-8"))
+
+    h.update((_serialize_node(top_node) + "\n").encode("utf-8"))
+    for node in top_node.descendants():
+        h.update((_serialize_node(node) + "\n").encode("utf-8"))
+
+    return h.hexdigest()
+
+
+def is_up_to_date(fingerprint_path: str, fingerprint: str, output_paths: List[str]) -> bool:
+    """
+    Check whether outputs were previously generated from the same fingerprint
+    """
+    try:
+        with open(fingerprint_path, "r", encoding="utf-8") as f:
+            prev = json.load(f)
+    except (OSError, ValueError):
+        return False
+
+    if not isinstance(prev, dict) or prev.get("fingerprint") != fingerprint:
+        return False
+
+    return all(os.path.exists(path) for path in output_paths)
+
+
+def write_fingerprint(fingerprint_path: str, fingerprint: str, output_paths: List[str]) -> None:
+    with open(fingerprint_path, "w", encoding="utf-8") as f:
+        json.dump({
+            "fingerprint": fingerprint,
+            "files": [os.path.basename(path) for path in output_paths],
+        }, f, indent=4)
+        f.write("\n")
+
+
+def get_tmp_path(path: str) -> str:
+    return path + ".tmp"
+
+
+def replace_if_changed(path: str) -> None:
+    """
+    Move the temporary file for ``path`` into place, but only if its contents
+    differ from the existing file. This preserves the file's modification time
+    if nothing changed.
+    """
+    tmp_path = get_tmp_path(path)
+    if os.path.exists(path) and filecmp.cmp(tmp_path, path, shallow=False):
+        os.remove(tmp_path)
+    else:
+        os.replace(tmp_path, path)
@@ -11,9 +11,16 @@ module {{ds.module_name}}
     //--------------------------------------------------------------------------
     // CPU Bus interface logic
     //--------------------------------------------------------------------------
+{%- if ds.dual_issue %}
+    logic cpuif_wr_req;
+    logic [{{cpuif.addr_width-1}}:0] cpuif_wr_addr;
+    logic cpuif_rd_req;
+    logic [{{cpuif.addr_width-1}}:0] cpuif_rd_addr;
+{%- else %}
     logic cpuif_req;
     logic cpuif_req_is_wr;
     logic [{{cpuif.addr_width-1}}:0] cpuif_addr;
+{%- endif %}
     logic [{{cpuif.data_width-1}}:0] cpuif_wr_data;
     logic [{{cpuif.data_width-1}}:0] cpuif_wr_biten;
     logic cpuif_req_stall_wr;
@@ -27,17 +34,29 @@ module {{ds.module_name}}
     logic cpuif_wr_err;
 
     {{cpuif.get_implementation()|indent}}
-
+{% if ds.dual_issue %}
+    // Reads and writes are issued on independent channels, and each channel
+    // responds in order. Stalls not required
+    assign cpuif_req_stall_rd = '0;
+    assign cpuif_req_stall_wr = '0;
+{%- else %}
     logic cpuif_req_masked;
 {%- if ds.has_external_addressable %}
     logic external_pending;
+    {%- if ds.retime_decode %}
+    logic decoded_req_is_external;
+    logic external_stall;
+    // Also stall while an external request is in the decode retiming stage
+    assign external_stall = external_pending | decoded_req_is_external;
+    {%- endif %}
 {%- endif %}
+{%- set external_stall = "external_stall" if ds.retime_decode else "external_pending" %}
 {% if ds.min_read_latency == ds.min_write_latency %}
     // Read & write latencies are balanced. Stalls not required
     {%- if ds.has_external_addressable %}
     // except if external
-    assign cpuif_req_stall_rd = external_pending;
-    assign cpuif_req_stall_wr = external_pending;
+    assign cpuif_req_stall_rd = {{external_stall}};
+    assign cpuif_req_stall_wr = {{external_stall}};
     {%- else %}
     assign cpuif_req_stall_rd = '0;
     assign cpuif_req_stall_wr = '0;
@@ -55,8 +74,8 @@ module {{ds.module_name}}
         end
     end
     {%- if ds.has_external_addressable %}
-    assign cpuif_req_stall_rd = external_pending;
-    assign cpuif_req_stall_wr = cpuif_req_stall_sr[0] | external_pending;
+    assign cpuif_req_stall_rd = {{external_stall}};
+    assign cpuif_req_stall_wr = cpuif_req_stall_sr[0] | {{external_stall}};
     {%- else %}
     assign cpuif_req_stall_rd = '0;
     assign cpuif_req_stall_wr = cpuif_req_stall_sr[0];
@@ -74,8 +93,8 @@ module {{ds.module_name}}
         end
     end
     {%- if ds.has_external_addressable %}
-    assign cpuif_req_stall_rd = cpuif_req_stall_sr[0] | external_pending;
-    assign cpuif_req_stall_wr = external_pending;
+    assign cpuif_req_stall_rd = cpuif_req_stall_sr[0] | {{external_stall}};
+    assign cpuif_req_stall_wr = {{external_stall}};
     {%- else %}
     assign cpuif_req_stall_rd = cpuif_req_stall_sr[0];
     assign cpuif_req_stall_wr = '0;
@@ -84,14 +103,114 @@ module {{ds.module_name}}
     assign cpuif_req_masked = cpuif_req
                             & !(!cpuif_req_is_wr & cpuif_req_stall_rd)
                             & !(cpuif_req_is_wr & cpuif_req_stall_wr);
+{%- endif %}
 
     //--------------------------------------------------------------------------
     // Address Decode
     //--------------------------------------------------------------------------
-    {{address_decode.get_strobe_struct()|indent}}
+    {% for chunk in indent_chunks(address_decode.get_strobe_struct()) %}{{chunk}}{% endfor %}
+{%- if ds.dual_issue %}
+    decoded_reg_strb_t decoded_wr_strb;
+    logic decoded_wr_err;
+    logic decoded_wr_req;
+    logic [{{cpuif.data_width-1}}:0] decoded_wr_data;
+    logic [{{cpuif.data_width-1}}:0] decoded_wr_biten;
+    decoded_reg_strb_t decoded_rd_strb;
+    logic decoded_rd_err;
+    logic decoded_rd_req;
+    logic [{{cpuif.addr_width-1}}:0] decoded_rd_addr;
+    {%- if ds.retime_decode %}
+    decoded_reg_strb_t decoded_wr_strb_c;
+    logic decoded_wr_err_c;
+    decoded_reg_strb_t decoded_rd_strb_c;
+    logic decoded_rd_err_c;
+    {%- endif %}
+    {%- set decode_sfx = "_c" if ds.retime_decode else "" %}
+
+    // Each request channel has its own instance of the address decoder
+    function automatic void decode_req(
+        input logic cpuif_req_masked,
+        input logic cpuif_req_is_wr,
+        input logic [{{cpuif.addr_width-1}}:0] cpuif_addr,
+        output decoded_reg_strb_t {{address_decode.decode_strobe_name}},
+        output logic decoded_err
+    );
+        logic is_valid_addr;
+        logic is_valid_rw;
+    {%- if ds.err_if_bad_addr or ds.err_if_bad_rw %}
+        {{address_decode.get_valid_addr_implementation()|indent(8)}}
+    {%- else %}
+        is_valid_addr = '1; // No valid address check
+    {%- endif %}
+    {%- if ds.err_if_bad_rw %}
+        {{address_decode.get_valid_rw_implementation()|indent(8)}}
+    {%- else %}
+        is_valid_rw = '1; // No valid RW check
+    {%- endif %}
+        {% for chunk in indent_chunks(address_decode.get_implementation(), 8) %}{{chunk}}{% endfor %}
+    {%- if ds.err_if_bad_addr and ds.err_if_bad_rw %}
+        decoded_err = (~is_valid_addr | (is_valid_addr & ~is_valid_rw)) & cpuif_req_masked;
+    {%- elif ds.err_if_bad_addr %}
+        decoded_err = ~is_valid_addr & cpuif_req_masked;
+    {%- elif ds.err_if_bad_rw %}
+        decoded_err = (is_valid_addr & ~is_valid_rw) & cpuif_req_masked;
+    {%- else %}
+        decoded_err = '0;
+    {%- endif %}
+    endfunction
+
+    always_comb begin
+        decode_req(cpuif_wr_req, 1'b1, cpuif_wr_addr, decoded_wr_strb{{decode_sfx}}, decoded_wr_err{{decode_sfx}});
+    end
+
+    always_comb begin
+        decode_req(cpuif_rd_req, 1'b0, cpuif_rd_addr, decoded_rd_strb{{decode_sfx}}, decoded_rd_err{{decode_sfx}});
+    end
+
+    {%- if ds.retime_decode %}
+
+    // Retime decoded signals before passing them down to next stage
+    always_ff {{get_always_ff_event(cpuif.reset)}} begin
+        if({{get_resetsignal(cpuif.reset)}}) begin
+        {%- if ds.packed_decode_strobes %}
+            decoded_wr_strb <= '0;
+            decoded_rd_strb <= '0;
+        {%- else %}
+            decoded_wr_strb <= '{default: '0};
+            decoded_rd_strb <= '{default: '0};
+        {%- endif %}
+            decoded_wr_err <= '0;
+            decoded_wr_req <= '0;
+            decoded_wr_data <= '0;
+            decoded_wr_biten <= '0;
+            decoded_rd_err <= '0;
+            decoded_rd_req <= '0;
+            decoded_rd_addr <= '0;
+        end else begin
+            decoded_wr_strb <= decoded_wr_strb_c;
+            decoded_wr_err <= decoded_wr_err_c;
+            decoded_wr_req <= cpuif_wr_req;
+            decoded_wr_data <= cpuif_wr_data;
+            decoded_wr_biten <= cpuif_wr_biten;
+            decoded_rd_strb <= decoded_rd_strb_c;
+            decoded_rd_err <= decoded_rd_err_c;
+            decoded_rd_req <= cpuif_rd_req;
+            decoded_rd_addr <= cpuif_rd_addr;
+        end
+    end
+    {%- else %}
+
+    // Pass down signals to next stage
+    assign decoded_wr_req = cpuif_wr_req;
+    assign decoded_wr_data = cpuif_wr_data;
+    assign decoded_wr_biten = cpuif_wr_biten;
+    assign decoded_rd_req = cpuif_rd_req;
+    assign decoded_rd_addr = cpuif_rd_addr;
+    {%- endif %}
+{%- else %}
     decoded_reg_strb_t decoded_reg_strb;
     logic decoded_err;
-{%- if ds.has_external_addressable %}
+{%- if ds.has_external_addressable and not ds.retime_decode %}
     logic decoded_req_is_external;
 {% endif %}
     logic [{{cpuif.addr_width-1}}:0] decoded_addr;
@@ -99,6 +218,15 @@ module {{ds.module_name}}
     logic decoded_req_is_wr;
     logic [{{cpuif.data_width-1}}:0] decoded_wr_data;
     logic [{{cpuif.data_width-1}}:0] decoded_wr_biten;
+{%- if ds.retime_decode %}
+    decoded_reg_strb_t decoded_reg_strb_c;
+    logic decoded_err_c;
+    {%- if ds.has_external_addressable %}
+    logic decoded_req_is_external_c;
+    {%- endif %}
+{%- endif %}
+{%- set decode_sfx = "_c" if ds.retime_decode else "" %}
+{%- set decode_req = "cpuif_req_masked" if ds.retime_decode else "decoded_req" %}
 
     always_comb begin
         automatic logic is_valid_addr;
@@ -108,27 +236,27 @@ module {{ds.module_name}}
         is_external = '0;
     {%- endif %}
     {%- if ds.err_if_bad_addr or ds.err_if_bad_rw %}
-        is_valid_addr = '0;
+        {{address_decode.get_valid_addr_implementation()|indent(8)}}
     {%- else %}
         is_valid_addr = '1; // No valid address check
     {%- endif %}
     {%- if ds.err_if_bad_rw %}
-        is_valid_rw = '0;
+        {{address_decode.get_valid_rw_implementation()|indent(8)}}
     {%- else %}
         is_valid_rw = '1; // No valid RW check
     {%- endif %}
-        {{address_decode.get_implementation()|indent(8)}}
+        {% for chunk in indent_chunks(address_decode.get_implementation(), 8) %}{{chunk}}{% endfor %}
     {%- if ds.err_if_bad_addr and ds.err_if_bad_rw %}
-        decoded_err = (~is_valid_addr | (is_valid_addr & ~is_valid_rw)) & decoded_req;
+        decoded_err{{decode_sfx}} = (~is_valid_addr | (is_valid_addr & ~is_valid_rw)) & {{decode_req}};
     {%- elif ds.err_if_bad_addr %}
-        decoded_err = ~is_valid_addr & decoded_req;
+        decoded_err{{decode_sfx}} = ~is_valid_addr & {{decode_req}};
     {%- elif ds.err_if_bad_rw %}
-        decoded_err = (is_valid_addr & ~is_valid_rw) & decoded_req;
+        decoded_err{{decode_sfx}} = (is_valid_addr & ~is_valid_rw) & {{decode_req}};
     {%- else %}
-        decoded_err = '0;
+        decoded_err{{decode_sfx}} = '0;
     {%- endif %}
     {%- if ds.has_external_addressable %}
-        decoded_req_is_external = is_external;
+        decoded_req_is_external{{decode_sfx}} = is_external;
     {%- endif %}
     end
 
@@ -151,12 +279,48 @@ module {{ds.module_name}}
     end
 {%- endif %}
 
+{%- if ds.retime_decode %}
+
+    // Retime decoded signals before passing them down to next stage
+    always_ff {{get_always_ff_event(cpuif.reset)}} begin
+        if({{get_resetsignal(cpuif.reset)}}) begin
+        {%- if ds.packed_decode_strobes %}
+            decoded_reg_strb <= '0;
+        {%- else %}
+            decoded_reg_strb <= '{default: '0};
+        {%- endif %}
+            decoded_err <= '0;
+        {%- if ds.has_external_addressable %}
+            decoded_req_is_external <= '0;
+        {%- endif %}
+            decoded_addr <= '0;
+            decoded_req <= '0;
+            decoded_req_is_wr <= '0;
+            decoded_wr_data <= '0;
+            decoded_wr_biten <= '0;
+        end else begin
+            decoded_reg_strb <= decoded_reg_strb_c;
+            decoded_err <= decoded_err_c;
+        {%- if ds.has_external_addressable %}
+            decoded_req_is_external <= decoded_req_is_external_c;
+        {%- endif %}
+            decoded_addr <= cpuif_addr;
+            decoded_req <= cpuif_req_masked;
+            decoded_req_is_wr <= cpuif_req_is_wr;
+            decoded_wr_data <= cpuif_wr_data;
+            decoded_wr_biten <= cpuif_wr_biten;
+        end
+    end
+{%- else %}
+
     // Pass down signals to next stage
     assign decoded_addr = cpuif_addr;
     assign decoded_req = cpuif_req_masked;
     assign decoded_req_is_wr = cpuif_req_is_wr;
     assign decoded_wr_data = cpuif_wr_data;
     assign decoded_wr_biten = cpuif_wr_biten;
+{%- endif %}
+{%- endif %}
 {% if ds.has_writable_msb0_fields %}
     // bitswap for use by fields with msb0 ordering
     logic [{{cpuif.data_width-1}}:0] decoded_wr_data_bswap;
@@ -170,18 +334,18 @@ module {{ds.module_name}}
     //--------------------------------------------------------------------------
     // Write double-buffers
     //--------------------------------------------------------------------------
-    {{write_buffering.get_storage_struct()|indent}}
+    {% for chunk in indent_chunks(write_buffering.get_storage_struct()) %}{{chunk}}{% endfor %}
 
-    {{write_buffering.get_implementation()|indent}}
+    {% for chunk in indent_chunks(write_buffering.get_implementation()) %}{{chunk}}{% endfor %}
 {%- endif %}
     //--------------------------------------------------------------------------
     // Field logic
     //--------------------------------------------------------------------------
-    {{field_logic.get_combo_struct()|indent}}
+    {% for chunk in indent_chunks(field_logic.get_combo_struct()) %}{{chunk}}{% endfor %}
 
-    {{field_logic.get_storage_struct()|indent}}
+    {% for chunk in indent_chunks(field_logic.get_storage_struct()) %}{{chunk}}{% endfor %}
 
-    {{field_logic.get_implementation()|indent}}
+    {% for chunk in indent_chunks(field_logic.get_implementation()) %}{{chunk}}{% endfor %}
 
 {%- if ds.has_paritycheck %}
 
@@ -194,7 +358,7 @@ module {{ds.module_name}}
         end else begin
             automatic logic err;
             err = '0;
-            {{parity.get_implementation()|indent(12)}}
+            {% for chunk in indent_chunks(parity.get_implementation(), 12) %}{{chunk}}{% endfor %}
             parity_error <= err;
         end
     end
@@ -205,9 +369,9 @@ module {{ds.module_name}}
     //--------------------------------------------------------------------------
     // Read double-buffers
     //--------------------------------------------------------------------------
-    {{read_buffering.get_storage_struct()|indent}}
+    {% for chunk in indent_chunks(read_buffering.get_storage_struct()) %}{{chunk}}{% endfor %}
 
-    {{read_buffering.get_implementation()|indent}}
+    {% for chunk in indent_chunks(read_buffering.get_implementation()) %}{{chunk}}{% endfor %}
 {%- endif %}
 
     //--------------------------------------------------------------------------
@@ -217,16 +381,18 @@ module {{ds.module_name}}
     always_comb begin
         automatic logic wr_ack;
         wr_ack = '0;
-        {{ext_write_acks.get_implementation()|indent(8)}}
+        {% for chunk in indent_chunks(ext_write_acks.get_implementation(), 8) %}{{chunk}}{% endfor %}
         external_wr_ack = wr_ack;
     end
     assign cpuif_wr_ack = external_wr_ack | (decoded_req & decoded_req_is_wr & ~decoded_req_is_external);
+{%- elif ds.dual_issue %}
+    assign cpuif_wr_ack = decoded_wr_req;
 {%- else %}
     assign cpuif_wr_ack = decoded_req & decoded_req_is_wr;
 {%- endif %}
     // Writes are always granted with no error response
     {%- if ds.err_if_bad_addr or ds.err_if_bad_rw %}
-    assign cpuif_wr_err = decoded_err;
+    assign cpuif_wr_err = {{"decoded_wr_err" if ds.dual_issue else "decoded_err"}};
     {%- else %}
     assign cpuif_wr_err = '0;
     {%- endif %}
@@ -239,12 +405,23 @@ module {{ds.module_name}}
     always_comb begin
         automatic logic rd_ack;
         rd_ack = '0;
-        {{ext_read_acks.get_implementation()|indent(8)}}
+        {% for chunk in indent_chunks(ext_read_acks.get_implementation(), 8) %}{{chunk}}{% endfor %}
         readback_external_rd_ack_c = rd_ack;
     end
 
     logic readback_external_rd_ack;
-    {%- if ds.retime_read_fanin %}
+    {%- if ds.read_fanin_stages > 1 %}
+    // External acks are delayed to match the readback reduction tree
+    logic [{{ds.read_fanin_stages-1}}:0] readback_external_rd_ack_sr;
+    always_ff {{get_always_ff_event(cpuif.reset)}} begin
+        if({{get_resetsignal(cpuif.reset)}}) begin
+            readback_external_rd_ack_sr <= '0;
+        end else begin
+            readback_external_rd_ack_sr <= {readback_external_rd_ack_sr[{{ds.read_fanin_stages-2}}:0], readback_external_rd_ack_c};
+        end
+    end
+    assign readback_external_rd_ack = readback_external_rd_ack_sr[{{ds.read_fanin_stages-1}}];
+    {%- elif ds.retime_read_fanin %}
     always_ff {{get_always_ff_event(cpuif.reset)}} begin
         if({{get_resetsignal(cpuif.reset)}}) begin
             readback_external_rd_ack <= '0;
@@ -271,6 +448,8 @@ module {{ds.module_name}}
         end
     end
     assign rd_mux_addr = decoded_req ? decoded_addr : pending_rd_addr;
+{%- elif ds.dual_issue %}
+    assign rd_mux_addr = decoded_rd_addr;
 {%- else %}
     assign rd_mux_addr = decoded_addr;
 {%- endif %}
@@ -278,7 +457,7 @@ module {{ds.module_name}}
     logic readback_err;
     logic readback_done;
     logic [{{cpuif.data_width-1}}:0] readback_data;
-    {{readback_implementation|indent}}
+    {% for chunk in indent_chunks(readback_implementation) %}{{chunk}}{% endfor %}
 {% if ds.retime_read_response %}
     always_ff {{get_always_ff_event(cpuif.reset)}} begin
         if({{get_resetsignal(cpuif.reset)}}) begin
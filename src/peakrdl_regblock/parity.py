@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Iterator
 
 from systemrdl.walker import WalkerAction
 
@@ -7,19 +7,22 @@ from .forloop_generator import RDLForLoopGenerator
 
 if TYPE_CHECKING:
     from .exporter import RegblockExporter
+    from .walker import GeneratorPass, GeneratorResult
     from systemrdl.node import FieldNode, AddressableNode
 
 
 class ParityErrorReduceGenerator(RDLForLoopGenerator):
+    _result: 'GeneratorResult'
+
     def __init__(self, exp: 'RegblockExporter') -> None:
         super().__init__()
         self.exp = exp
 
-    def get_implementation(self) -> str:
-        content = self.get_content(self.exp.ds.top_node)
-        if content is None:
-            return ""
-        return content
+    def add_generators(self, gen_pass: 'GeneratorPass') -> None:
+        self._result = gen_pass.add_content(self)
+
+    def get_implementation(self) -> Iterator[str]:
+        return self._result.iter_content()
 
     def enter_AddressableComponent(self, node: 'AddressableNode') -> WalkerAction:
         super().enter_AddressableComponent(node)
@@ -0,0 +1,253 @@
+import sys
+import json
+import time
+import tracemalloc
+import contextlib
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Iterator, ContextManager
+
+from systemrdl.node import AddrmapNode, RegfileNode, MemNode, RegNode, FieldNode, SignalNode
+
+if TYPE_CHECKING:
+    from systemrdl.node import Node
+    from systemrdl.walker import RDLListener
+
+
+def get_peak_rss() -> Optional[int]:
+    """
+    Peak resident set size of this process in bytes, if known
+    """
+    try:
+        import resource # pylint: disable=import-outside-toplevel
+    except ImportError:
+        # Not available on Windows
+        return None
+
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        # Reported in bytes
+        return rss
+    # Reported in kilobytes
+    return rss * 1024
+
+
+class StageStats:
+    def __init__(self, name: str, depth: int) -> None:
+        self.name = name
+        self.depth = depth
+        self.wall_time = 0.0
+        self.allocated = 0
+        self.peak_allocated = None # type: Optional[int]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "depth": self.depth,
+            "wall_time": self.wall_time,
+            "allocated": self.allocated,
+            "peak_allocated": self.peak_allocated,
+        }
+
+
+class SectionStats:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.render_time = 0.0
+        self.lines = 0
+        self.bytes = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "render_time": self.render_time,
+            "lines": self.lines,
+            "bytes": self.bytes,
+        }
+
+
+class _TimedListener:
+    """
+    Wraps a walker listener and accumulates the time spent in its callbacks
+    """
+    def __init__(self, listener: 'RDLListener', profiler: 'ExportProfiler', name: str) -> None:
+        self._listener = listener
+        self._profiler = profiler
+        self._name = name
+
+    def __getattr__(self, attr_name: str) -> Any:
+        attr = getattr(self._listener, attr_name)
+        if not attr_name.startswith(("enter_", "exit_")):
+            return attr
+
+        def timed(node: 'Node') -> Any:
+            t_start = time.perf_counter()
+            try:
+                return attr(node)
+            finally:
+                self._profiler.listener_times[self._name] += time.perf_counter() - t_start
+        return timed
+
+
+class ExportProfiler:
+    """
+    Collects timing, memory and size metrics of a single export
+    """
+    def __init__(self) -> None:
+        self.stages = [] # type: List[StageStats]
+        self.sections = OrderedDict() # type: OrderedDict[str, SectionStats]
+        self.listener_times = OrderedDict() # type: OrderedDict[str, float]
+        self.node_counts = OrderedDict() # type: OrderedDict[str, int]
+        self.peak_rss = None # type: Optional[int]
+        self._depth = 0
+        self._started_tracemalloc = False
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self) -> None:
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+        self.peak_rss = get_peak_rss()
+
+    @contextlib.contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Measure the wall time and memory allocated within this context
+        """
+        stats = StageStats(name, self._depth)
+        self.stages.append(stats)
+        self._depth += 1
+
+        if self._depth == 1 and hasattr(tracemalloc, "reset_peak"):
+            # Peak is only tracked for top-level stages since nested stages
+            # would disturb the peak of their parent
+            tracemalloc.reset_peak()
+            track_peak = True
+        else:
+            track_peak = False
+        mem_start = tracemalloc.get_traced_memory()[0]
+        t_start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stats.wall_time = time.perf_counter() - t_start
+            mem_current, mem_peak = tracemalloc.get_traced_memory()
+            stats.allocated = mem_current - mem_start
+            if track_peak:
+                stats.peak_allocated = mem_peak - mem_start
+            self._depth -= 1
+
+    def wrap_listener(self, listener: 'RDLListener', name: str) -> 'RDLListener':
+        self.listener_times[name] = 0.0
+        return _TimedListener(listener, self, name) # type: ignore
+
+    def record_section(self, name: str, chunks: Iterator[str]) -> Iterator[str]:
+        """
+        Pass through the chunks of a section of generated content as it is
+        rendered, and record its size
+        """
+        stats = self.sections.get(name)
+        if stats is None:
+            stats = SectionStats(name)
+            self.sections[name] = stats
+
+        n_newlines = 0
+        n_bytes = 0
+        while True:
+            t_start = time.perf_counter()
+            chunk = next(chunks, None)
+            stats.render_time += time.perf_counter() - t_start
+            if chunk is None:
+                break
+            n_newlines += chunk.count("\n")
+            n_bytes += len(chunk.encode("utf-8"))
+            yield chunk
+
+        if n_bytes:
+            stats.lines = n_newlines + 1
+            stats.bytes = n_bytes
+
+    def count_nodes(self, top_node: AddrmapNode) -> None:
+        for label, unroll in (("", False), ("unrolled ", True)):
+            counts = OrderedDict([
+                (AddrmapNode, 1),
+                (RegfileNode, 0),
+                (MemNode, 0),
+                (RegNode, 0),
+                (FieldNode, 0),
+                (SignalNode, 0),
+            ])
+            for node in top_node.descendants(unroll=unroll):
+                node_cls = type(node)
+                if node_cls in counts:
+                    counts[node_cls] += 1
+            for node_cls, count in counts.items():
+                self.node_counts[label + node_cls.__name__] = count
+
+    #---------------------------------------------------------------------------
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "stages": [stage.to_dict() for stage in self.stages],
+            "generators": dict(self.listener_times),
+            "sections": [section.to_dict() for section in self.sections.values()],
+            "node_counts": dict(self.node_counts),
+            "peak_rss": self.peak_rss,
+        }
+
+    def get_json_report(self) -> str:
+        return json.dumps(self.to_dict(), indent=4) + "\n"
+
+    def get_text_report(self) -> str:
+        lines = []
+
+        lines.append("Stages:")
+        lines.append(f"    {'Stage':<40} {'Time (ms)':>10} {'Alloc (KiB)':>12} {'Peak (KiB)':>12}")
+        for stage in self.stages:
+            name = "  " * stage.depth + stage.name
+            if stage.peak_allocated is None:
+                peak = "-"
+            else:
+                peak = f"{stage.peak_allocated / 1024:.1f}"
+            lines.append(
+                f"    {name:<40} {stage.wall_time * 1000:>10.2f}"
+                f" {stage.allocated / 1024:>12.1f} {peak:>12}"
+            )
+
+        lines.append("")
+        lines.append("Generators (time spent in walker callbacks):")
+        for name, t in self.listener_times.items():
+            lines.append(f"    {name:<40} {t * 1000:>10.2f} ms")
+
+        lines.append("")
+        lines.append("Sections:")
+        lines.append(f"    {'Section':<40} {'Time (ms)':>10} {'Lines':>10} {'Bytes':>12}")
+        for section in self.sections.values():
+            lines.append(
+                f"    {section.name:<40} {section.render_time * 1000:>10.2f}"
+                f" {section.lines:>10} {section.bytes:>12}"
+            )
+
+        lines.append("")
+        lines.append("Node counts:")
+        for name, count in self.node_counts.items():
+            lines.append(f"    {name:<40} {count:>10}")
+
+        lines.append("")
+        if self.peak_rss is None:
+            lines.append("Peak RSS: unknown")
+        else:
+            lines.append(f"Peak RSS: {self.peak_rss / (1024 * 1024):.1f} MiB")
+
+        return "\n".join(lines) + "\n"
+
+
+def profile_stage(profiler: Optional[ExportProfiler], name: str) -> ContextManager[None]:
+    """
+    Measure a stage of the export, if profiling is enabled
+    """
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.stage(name)
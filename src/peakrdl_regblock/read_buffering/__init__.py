@@ -1,17 +1,20 @@
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Union, Iterator
 
 from systemrdl.node import AddrmapNode, RegNode, SignalNode
 
 from .storage_generator import RBufStorageStructGenerator
 from .implementation_generator import RBufLogicGenerator
-from ..utils import get_indexed_path
 from ..sv_int import SVInt
 
 if TYPE_CHECKING:
     from ..exporter import RegblockExporter
+    from ..walker import GeneratorPass, GeneratorResult
 
 
 class ReadBuffering:
+    _storage_struct: 'GeneratorResult'
+    _implementation: 'GeneratorResult'
+
     def __init__(self, exp:'RegblockExporter'):
         self.exp = exp
 
@@ -19,17 +22,24 @@ class ReadBuffering:
     def top_node(self) -> 'AddrmapNode':
         return self.exp.ds.top_node
 
-    def get_storage_struct(self) -> str:
-        struct_gen = RBufStorageStructGenerator()
-        s = struct_gen.get_struct(self.top_node, "rbuf_storage_t")
-        assert s is not None
-        return s + "\nrbuf_storage_t rbuf_storage;"
+    def add_generators(self, gen_pass: 'GeneratorPass') -> None:
+        self._storage_struct = gen_pass.add_struct(RBufStorageStructGenerator(), "rbuf_storage_t")
+        self._implementation = gen_pass.add_content(RBufLogicGenerator(self))
+
+    def get_storage_struct(self) -> Iterator[str]:
+        assert not self._storage_struct.is_empty
+        yield from self._storage_struct.iter_content()
+        yield "\nrbuf_storage_t rbuf_storage;"
+
+    def get_storage_n_bits(self) -> int:
+        """
+        Number of flops of the storage struct
+        """
+        return self._storage_struct.n_bits
 
-    def get_implementation(self) -> str:
-        gen = RBufLogicGenerator(self)
-        s = gen.get_content(self.top_node)
-        assert s is not None
-        return s
+    def get_implementation(self) -> Iterator[str]:
+        assert not self._implementation.is_empty
+        return self._implementation.iter_content()
 
     def get_trigger(self, node: RegNode) -> str:
         trigger = node.get_property('rbuffer_trigger')
@@ -39,12 +49,9 @@ class ReadBuffering:
             # trigger when lowermost address of the register is written
             regwidth = trigger.get_property('regwidth')
             accesswidth = trigger.get_property('accesswidth')
-            strb_prefix = self.exp.dereferencer.get_access_strobe(trigger, reduce_substrobes=False)
-
             if accesswidth < regwidth:
-                return f"{strb_prefix}[0] && !decoded_req_is_wr"
-            else:
-                return f"{strb_prefix} && !decoded_req_is_wr"
+                return self.exp.dereferencer.get_read_strobe(trigger, subword_index=0)
+            return self.exp.dereferencer.get_read_strobe(trigger)
         elif isinstance(trigger, SignalNode):
             s = self.exp.dereferencer.get_value(trigger)
             if trigger.get_property('activehigh'):
@@ -56,4 +63,4 @@ class ReadBuffering:
             return str(self.exp.dereferencer.get_value(trigger))
 
     def get_rbuf_data(self, node: RegNode) -> str:
-        return "rbuf_storage." + get_indexed_path(self.top_node, node) + ".data"
+        return "rbuf_storage." + self.exp.ds.indexed_paths.get_indexed_path(node) + ".data"
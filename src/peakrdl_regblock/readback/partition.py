@@ -0,0 +1,167 @@
+from collections import Counter
+from typing import Dict, List, Optional, Tuple, Iterable
+
+from ..utils import clog2
+
+
+class ReadbackPartition:
+    """
+    Partitioning of the address bits into one group per stage of the retimed
+    readback reduction tree, chosen from the population of readable addresses.
+
+    The first stage reduces each bin of addresses that share the same bits
+    above the first group. Each subsequent stage selects between the bins of
+    the previous stage using the next group of address bits.
+
+    Groups are chosen to minimize the deepest stage of the tree. The first
+    stage is assumed to cost an additional level of logic for its address
+    comparison. Ties are broken by the number of retiming flop bins, and then
+    by how close the groups are to an even split.
+
+    If max_fanin is set, no stage may select between more than that many
+    addresses or bins.
+    """
+    def __init__(self, addresses: Iterable[int], addr_width: int, unused_low_addr_bits: int, n_stages: int,
+                 max_fanin: Optional[int] = None) -> None:
+        self.addr_width = addr_width
+        self.unused_low_addr_bits = unused_low_addr_bits
+        self.n_stages = n_stages
+        self.max_fanin = max_fanin
+        self.addresses = sorted(set(addresses))
+
+        # Distinct values of the addresses shifted right by each amount
+        self._shifted = {} # type: Dict[int, List[int]]
+
+        # Max fan-in of each (lsb, width) group
+        self._fanin = {} # type: Dict[Tuple[int, int], int]
+
+        self.groups = self._choose_groups()
+
+    def get_even_groups(self) -> List[int]:
+        """
+        Split the relevant address bits evenly. Higher groups get any remaining
+        bits.
+        """
+        relevant_addr_width = self.addr_width - self.unused_low_addr_bits
+        n_groups = self.n_stages + 1
+        groups = [relevant_addr_width // n_groups] * n_groups
+        for i in range(relevant_addr_width % n_groups):
+            groups[-1 - i] += 1
+        groups[0] += self.unused_low_addr_bits
+        return groups
+
+    def get_bins(self, lsb: int) -> List[int]:
+        """
+        Sorted values of all non-empty bins, indexed by the address bits above
+        lsb
+        """
+        if lsb not in self._shifted:
+            self._shifted[lsb] = sorted({a >> lsb for a in self.addresses})
+        return self._shifted[lsb]
+
+    def is_dense(self, lsb: int) -> bool:
+        """
+        Whether none of the bins indexed by the address bits above lsb are empty
+        """
+        return len(self.get_bins(lsb)) == 2 ** (self.addr_width - lsb)
+
+    def get_fanin(self, lsb: int, width: int) -> int:
+        """
+        Max number of non-empty bins above lsb that are selected between using
+        the group of address bits [lsb+width-1:lsb]
+        """
+        key = (lsb, width)
+        if key not in self._fanin:
+            counts = Counter(b >> width for b in self.get_bins(lsb))
+            self._fanin[key] = max(counts.values(), default=0)
+        return self._fanin[key]
+
+    def _is_allowed(self, lsb: int, width: int, max_depth: int) -> bool:
+        if self.max_fanin is not None and self.get_fanin(lsb, width) > self.max_fanin:
+            return False
+        return self.get_stage_depth(lsb, width) <= max_depth
+
+    def get_stage_depth(self, lsb: int, width: int) -> int:
+        depth = clog2(max(self.get_fanin(lsb, width), 1))
+        if lsb == 0:
+            # First stage also compares the address
+            depth += 1
+        return depth
+
+    def _choose_groups(self) -> List[int]:
+        even_groups = self.get_even_groups()
+        if not self.addresses:
+            return even_groups
+
+        # Each group has at least one relevant address bit. The first group
+        # also includes the unused low address bits.
+        relevant_addr_width = self.addr_width - self.unused_low_addr_bits
+        max_width = relevant_addr_width - self.n_stages
+
+        depths = set()
+        for pos in range(relevant_addr_width):
+            for width in range(1, min(max_width, relevant_addr_width - pos) + 1):
+                depths.add(self.get_stage_depth(*self._get_group_lsb_width(pos, width)))
+
+        # Find the smallest depth for which a partition exists. For that depth,
+        # find the partition with the fewest flops.
+        for max_depth in sorted(depths):
+            groups = self._find_groups(max_depth, even_groups)
+            if groups is not None:
+                return groups
+        return even_groups
+
+    def _get_group_lsb_width(self, pos: int, width: int) -> Tuple[int, int]:
+        """
+        Convert a group of relevant address bits to address bits
+        """
+        if pos == 0:
+            return 0, width + self.unused_low_addr_bits
+        return pos + self.unused_low_addr_bits, width
+
+    def _find_groups(self, max_depth: int, even_groups: List[int]) -> Optional[List[int]]:
+        relevant_addr_width = self.addr_width - self.unused_low_addr_bits
+        n_groups = self.n_stages + 1
+
+        # best[(pos, n)] is the (flops, deviation, widths) of the best way to
+        # split the relevant address bits at or above pos into n groups
+        best = {} # type: Dict[Tuple[int, int], Optional[Tuple[int, int, List[int]]]]
+
+        def solve(pos: int, n: int) -> Optional[Tuple[int, int, List[int]]]:
+            key = (pos, n)
+            if key in best:
+                return best[key]
+            result = None # type: Optional[Tuple[int, int, List[int]]]
+            remaining = relevant_addr_width - pos
+            group_idx = n_groups - n
+            even_width = even_groups[group_idx]
+            if group_idx == 0:
+                even_width -= self.unused_low_addr_bits
+            if n == 1:
+                lsb, width = self._get_group_lsb_width(pos, remaining)
+                if self._is_allowed(lsb, width, max_depth):
+                    result = (0, abs(remaining - even_width), [remaining])
+            else:
+                candidates = []
+                for w in range(1, remaining - (n - 1) + 1):
+                    lsb, width = self._get_group_lsb_width(pos, w)
+                    if not self._is_allowed(lsb, width, max_depth):
+                        continue
+                    sub = solve(pos + w, n - 1)
+                    if sub is None:
+                        continue
+                    # Bins that remain after this stage are retimed
+                    flops = len(self.get_bins(lsb + width)) + sub[0]
+                    deviation = abs(w - even_width) + sub[1]
+                    candidates.append((flops, deviation, [w] + sub[2]))
+                if candidates:
+                    result = min(candidates, key=lambda c: c[:2])
+            best[key] = result
+            return result
+
+        solution = solve(0, n_groups)
+        if solution is None:
+            return None
+        groups = solution[2]
+        groups[0] += self.unused_low_addr_bits
+        return groups
@@ -1,20 +1,42 @@
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Tuple, List, Dict, Any, Optional, Iterator
 
-from .readback_mux_generator import ReadbackMuxGenerator, RetimedReadbackMuxGenerator, RetimedExtBlockReadbackMuxGenerator
-from ..utils import clog2
+from systemrdl.node import RegNode
+
+from .readback_mux_generator import ReadbackMuxGenerator, RetimedReadbackMuxGenerator, RetimedExtBlockReadbackMuxGenerator, ExtBlockStrobeGenerator
+from .partition import ReadbackPartition
+from ..address_map import get_mapped_spans
+from ..strobe_vector import DecodeStrobeVector
+from ..sv_int import SVInt
+from ..utils import clog2, indent_chunks
 
 if TYPE_CHECKING:
     from ..exporter import RegblockExporter, DesignState
+    from ..walker import GeneratorPass, GeneratorResult
 
 class Readback:
+    _mux_impl: 'GeneratorResult'
+    _ext_mux_impl: 'GeneratorResult'
+    _ext_strb_impl: 'GeneratorResult'
+
     def __init__(self, exp:'RegblockExporter'):
         self.exp = exp
+        self._partition = None # type: Optional[ReadbackPartition]
+        self._ext_block_strobe_vector = None # type: Optional[DecodeStrobeVector]
 
     @property
     def ds(self) -> 'DesignState':
         return self.exp.ds
 
-    def get_implementation(self) -> str:
+    def add_generators(self, gen_pass: 'GeneratorPass') -> None:
+        if self.ds.retime_read_fanin:
+            self._mux_impl = gen_pass.add_content(RetimedReadbackMuxGenerator(self.exp))
+            if self.ds.has_external_block:
+                self._ext_mux_impl = gen_pass.add_content(RetimedExtBlockReadbackMuxGenerator(self.exp))
+                self._ext_strb_impl = gen_pass.add_content(ExtBlockStrobeGenerator(self.exp))
+        else:
+            self._mux_impl = gen_pass.add_content(ReadbackMuxGenerator(self.exp))
+
+    def get_implementation(self) -> Iterator[str]:
         if self.ds.retime_read_fanin:
             return self.get_2stage_implementation()
         else:
@@ -22,7 +44,7 @@ class Readback:
             return self.get_1stage_implementation()
 
 
-    def get_empty_implementation(self) -> str:
+    def get_empty_implementation(self) -> Iterator[str]:
         """
         Readback implementation when there are no readable registers
         """
@@ -32,22 +54,20 @@ class Readback:
         template = self.exp.jj_env.get_template(
             "readback/templates/empty_readback.sv"
         )
-        return template.render(context)
+        return template.generate(context)
 
 
-    def get_1stage_implementation(self) -> str:
+    def get_1stage_implementation(self) -> Iterator[str]:
         """
         Implements readback without any retiming
         """
-        gen = ReadbackMuxGenerator(self.exp)
-        mux_impl = gen.get_content(self.ds.top_node)
-
-        if not mux_impl:
+        if self._mux_impl.is_empty:
             # Design has no readable registers.
             return self.get_empty_implementation()
 
         context = {
-            "readback_mux": mux_impl,
+            "readback_mux": self._mux_impl.iter_content(),
+            "indent_chunks": indent_chunks,
             "cpuif": self.exp.cpuif,
             "ds": self.ds,
         }
@@ -55,42 +75,194 @@ class Readback:
             "readback/templates/readback_no_rt.sv"
         )
 
-        return template.render(context)
+        return template.generate(context)
+
+
+    @property
+    def partition(self) -> ReadbackPartition:
+        """
+        Partitioning of the retimed readback, based on the addresses of all
+        readable registers. External blocks are read back separately.
+        """
+        if self._partition is None:
+            addresses = [
+                span.lo for span in get_mapped_spans(self.ds.top_node)
+                if isinstance(span.node, RegNode) and span.readable
+            ]
+            self._partition = ReadbackPartition(
+                addresses,
+                self.ds.addr_width,
+                # Address bits below the data width do not contribute to
+                # addressing in the regblock
+                clog2(self.exp.cpuif.data_width_bytes),
+                self.ds.read_fanin_stages,
+                self.ds.max_read_fanin,
+            )
+        return self._partition
+
+    @property
+    def ext_block_strobe_vector(self) -> DecodeStrobeVector:
+        """
+        Bit positions of the external block decode strobes that are held by
+        the retimed readback until the block responds
+        """
+        if self._ext_block_strobe_vector is None:
+            self._ext_block_strobe_vector = DecodeStrobeVector(self.ds.top_node, external_blocks_only=True)
+        return self._ext_block_strobe_vector
+
+    def get_address_groups(self) -> List[int]:
+        """
+        Split the decode into one group of address bits per stage of the
+        readback reduction tree, starting with the low address bits.
+
+        Returns the width of each group
+        """
+        return self.partition.groups
+
+    @property
+    def has_sparse_bins(self) -> bool:
+        """
+        Whether the bins of the first stage are only allocated for those that
+        contain readable registers
+        """
+        return not self.partition.is_dense(self.get_address_groups()[0])
+
+    def get_bin_index_function(self) -> str:
+        """
+        Function that maps an address to the index of its bin in the first
+        stage, if bins are sparse
+        """
+        low_addr_width, high_addr_width = self.get_address_split()
+        lines = [
+            f"function automatic int ad_bin(bit [{self.ds.addr_width-1}:0] addr);",
+            f"    case(addr[{self.ds.addr_width-1}:{low_addr_width}])",
+        ]
+        for i, b in enumerate(self.partition.get_bins(low_addr_width)):
+            lines.append(f"        {SVInt(b, high_addr_width)}: return {i};")
+        lines.extend([
+            "        default: return 0;",
+            "    endcase",
+            "endfunction",
+        ])
+        return "\n".join(lines)
 
+    def _get_sparse_bin_select(self, lhs: str, rt: str, lsb: int, width: int, parent: Optional[int] = None) -> List[str]:
+        """
+        Select between the non-empty bins above lsb of the retiming stage with
+        suffix rt, using the address bits [lsb+width-1:lsb].
+        If parent is set, only its bins are selected from.
 
-    def get_2stage_implementation(self) -> str:
+        Empty bins read as 0.
         """
-        Implements readback that is retimed to 2 stages
+        lines = [
+            f"{lhs} = '0;",
+            f"case(readback_addr{rt}[{lsb+width-1}:{lsb}])",
+        ]
+        for i, b in enumerate(self.partition.get_bins(lsb)):
+            if parent is not None and (b >> width) != parent:
+                continue
+            lines.append(f"    {SVInt(b & ((1 << width) - 1), width)}: {lhs} = readback_data{rt}[{i}];")
+        lines.append("endcase")
+        return lines
+
+    def get_address_split(self) -> Tuple[int, int]:
+        """
+        Split the decode of the first stage into low address bits that select
+        a register, and high address bits that select its bin.
+
+        Returns the widths of the low and high address bits
         """
-        # Split the decode to happen in two stages, using low address bits first
-        # then high address bits.
-        # Split in the middle of the "relevant" address bits - the ones that
-        # actually contribute to addressing in the regblock
-        unused_low_addr_bits = clog2(self.exp.cpuif.data_width_bytes)
-        relevant_addr_width = self.ds.addr_width - unused_low_addr_bits
-        low_addr_width = (relevant_addr_width // 2) + unused_low_addr_bits
+        low_addr_width = self.get_address_groups()[0]
         high_addr_width = self.ds.addr_width - low_addr_width
+        return low_addr_width, high_addr_width
 
-        mux_gen = RetimedReadbackMuxGenerator(self.exp)
-        mux_impl = mux_gen.get_content(self.ds.top_node)
+    def get_reduce_stages(self) -> List[Dict[str, Any]]:
+        """
+        Retiming stages after the first, each of which reduces the readback
+        bins using the next group of address bits
+        """
+        groups = self.get_address_groups()
+        stages = []
+        lsb = groups[0]
+        for n, width in enumerate(groups[1:-1], start=2):
+            prev = "_rt" if n == 2 else f"_rt{n-1}"
+            bins = self.partition.get_bins(lsb + width)
+            select = None
+            if not self.partition.is_dense(lsb):
+                # Only non-empty bins are retimed
+                lines = []
+                for i, parent in enumerate(bins):
+                    lines.extend(self._get_sparse_bin_select(
+                        f"readback_data_rt{n}_c[{i}]", prev, lsb, width, parent
+                    ))
+                select = "\n".join(lines)
+            stages.append({
+                "n": n,
+                "prev": prev,
+                "lsb": lsb,
+                "width": width,
+                "n_bins": len(bins),
+                "select": select,
+            })
+            lsb += width
+        return stages
+
+    def get_2stage_implementation(self) -> Iterator[str]:
+        """
+        Implements readback that is retimed to 2 or more stages
+        """
+        low_addr_width, high_addr_width = self.get_address_split()
+        reduce_stages = self.get_reduce_stages()
+        if reduce_stages:
+            last_rt = f"_rt{reduce_stages[-1]['n']}"
+            last_lsb = reduce_stages[-1]["lsb"] + reduce_stages[-1]["width"]
+        else:
+            last_rt = "_rt"
+            last_lsb = low_addr_width
+
+        if self.partition.is_dense(last_lsb):
+            last_select = None
+        else:
+            # Only non-empty bins are retimed
+            last_select = "\n".join(self._get_sparse_bin_select(
+                "readback_data", last_rt, last_lsb, self.ds.addr_width - last_lsb
+            ))
+
+        if self.has_sparse_bins:
+            bin_index_function = self.get_bin_index_function() # type: Optional[str]
+        else:
+            bin_index_function = None
 
-        if not mux_impl:
+        if self._mux_impl.is_empty and not self.ds.has_external_block:
             # Design has no readable addresses.
             return self.get_empty_implementation()
 
         if self.ds.has_external_block:
-            ext_mux_gen = RetimedExtBlockReadbackMuxGenerator(self.exp)
-            ext_mux_impl = ext_mux_gen.get_content(self.ds.top_node)
+            ext_mux_impl = self._ext_mux_impl.iter_content() # type: Optional[Iterator[str]]
+            ext_strb_impl = self._ext_strb_impl.iter_content() # type: Optional[Iterator[str]]
+            ext_strb_width = self.ext_block_strobe_vector.width
         else:
             ext_mux_impl = None
+            ext_strb_impl = None
+            ext_strb_width = 0
 
         context = {
-            "readback_mux": mux_impl,
+            "readback_mux": self._mux_impl.iter_content(),
+            "has_readback_mux": not self._mux_impl.is_empty,
             "ext_block_readback_mux": ext_mux_impl,
+            "ext_block_strb": ext_strb_impl,
+            "ext_block_strb_width": ext_strb_width,
+            "indent_chunks": indent_chunks,
             "cpuif": self.exp.cpuif,
             "ds": self.ds,
             "low_addr_width": low_addr_width,
             "high_addr_width": high_addr_width,
+            "n_bins": len(self.partition.get_bins(low_addr_width)),
+            "bin_index_function": bin_index_function,
+            "reduce_stages": reduce_stages,
+            "last_select": last_select,
+            "last_rt": last_rt,
+            "last_lsb": last_lsb,
             'get_always_ff_event': self.exp.dereferencer.get_always_ff_event,
             'get_resetsignal': self.exp.dereferencer.get_resetsignal,
         }
@@ -98,4 +270,4 @@ class Readback:
             "readback/templates/readback_with_rt.sv"
         )
 
-        return template.render(context)
+        return template.generate(context)
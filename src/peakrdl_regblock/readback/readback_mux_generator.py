@@ -1,15 +1,26 @@
-from typing import TYPE_CHECKING, List, Sequence, Optional
+import re
+from typing import TYPE_CHECKING, List, Sequence, Optional, Tuple
 
 from systemrdl.node import RegNode, AddressableNode, FieldNode
 from systemrdl.walker import WalkerAction
 
-from ..forloop_generator import RDLForLoopGenerator
-from ..utils import SVInt, do_bitswap, do_slice
+from ..forloop_generator import RDLForLoopGenerator, Body, LoopBody, UniqueCaseBody
+from ..utils import SVInt, do_bitswap, do_slice, clog2, is_pow2
 
 if TYPE_CHECKING:
     from ..exporter import DesignState, RegblockExporter
 
+# Bit slice of the readback data that an assignment drives
+ASSIGNMENT_SLICE_RE = re.compile(r"\[(\d+)(?::(\d+))?\]$")
+
 class ReadbackMuxGenerator(RDLForLoopGenerator):
+    # Whether registers can be selected by a case statement of their address
+    supports_unique_case = True
+
+    # Whether register array elements can be selected by an index decoded from
+    # the address
+    supports_indexed_array = True
+
     def __init__(self, exp: 'RegblockExporter') -> None:
         super().__init__()
 
@@ -18,13 +29,30 @@ class ReadbackMuxGenerator(RDLForLoopGenerator):
         # List of address strides for each dimension
         self._array_stride_stack: List[int] = []
 
+        # Registers that are not within arrays are read back by a single case
+        # statement instead
+        self._case: Optional[UniqueCaseBody] = None
+        if self.ds.unique_case_decode and self.supports_unique_case and not self.ds.and_or_readback:
+            self._case = UniqueCaseBody("rd_mux_addr", self.ds.addr_width)
+
+        # Dimensions of the register array whose elements are read back by
+        # decoding their index from the address, rather than by a loop
+        self._indexed_array_dims: List[int] = []
+
+        # Readback mux inputs are recorded if a cost report is generated
+        self._cost = self.exp.cost_report
+
     @property
     def ds(self) -> 'DesignState':
         return self.exp.ds
 
 
     def enter_AddressableComponent(self, node: AddressableNode) -> Optional[WalkerAction]:
-        super().enter_AddressableComponent(node)
+        if self._is_indexed_array(node):
+            assert node.array_dimensions is not None
+            self._indexed_array_dims = list(node.array_dimensions)
+        else:
+            super().enter_AddressableComponent(node)
 
         if node.array_dimensions:
             assert node.array_stride is not None
@@ -45,6 +73,45 @@ class ReadbackMuxGenerator(RDLForLoopGenerator):
         return WalkerAction.Continue
 
 
+    def _is_indexed_array(self, node: AddressableNode) -> bool:
+        """
+        Whether the elements of a register array can be selected by decoding
+        their index from the address bits
+        """
+        if not (self.ds.indexed_array_readback and self.supports_indexed_array):
+            return False
+        if self.ds.and_or_readback:
+            # Elements are selected by their decode strobes instead
+            return False
+        if not isinstance(node, RegNode) or not node.array_dimensions:
+            return False
+
+        # Each index shall be a contiguous group of address bits
+        assert node.array_stride is not None
+        if not is_pow2(node.array_stride):
+            return False
+        for dim in node.array_dimensions[1:]:
+            if not is_pow2(dim):
+                return False
+
+        # The array shall be aligned to its size, so that the address bits
+        # above the index can be compared directly
+        n_bits = clog2(node.array_stride) + self._get_array_index_width(node.array_dimensions)
+        if n_bits > self.ds.addr_width:
+            return False
+        address = node.raw_absolute_address - self.ds.top_node.raw_absolute_address
+        if address % (1 << n_bits):
+            return False
+        for stride in self._array_stride_stack:
+            if stride % (1 << n_bits):
+                return False
+        return True
+
+    @staticmethod
+    def _get_array_index_width(dims: List[int]) -> int:
+        return sum(clog2(dim) for dim in dims)
+
+
     def process_external_block(self, node: AddressableNode) -> None:
         addr_lo = self._get_address_str(node)
         addr_hi = f"{addr_lo} + {SVInt(node.size - 1, self.exp.ds.addr_width)}"
@@ -52,6 +119,7 @@ class ReadbackMuxGenerator(RDLForLoopGenerator):
         data = self.exp.hwif.get_external_rd_data(node)
         self.add_content(f"    readback_data_var = {data};")
         self.add_content("end")
+        self._add_external_block_cost(node)
 
 
     def enter_Reg(self, node: RegNode) -> WalkerAction:
@@ -64,9 +132,10 @@ class ReadbackMuxGenerator(RDLForLoopGenerator):
             self.process_external_reg(node)
             return WalkerAction.SkipDescendants
 
-        accesswidth = node.get_property('accesswidth')
-        regwidth = node.get_property('regwidth')
-        rbuf = node.get_property('buffer_reads')
+        reg = self.ds.descriptors.get_reg(node)
+        accesswidth = reg.accesswidth
+        regwidth = reg.regwidth
+        rbuf = reg.buffer_reads
 
         if rbuf:
             trigger = node.get_property('rbuffer_trigger')
@@ -87,20 +156,221 @@ class ReadbackMuxGenerator(RDLForLoopGenerator):
         return WalkerAction.SkipDescendants
 
 
-    def _get_address_str(self, node: AddressableNode, subword_offset: int=0) -> str:
-        expr_width = self.ds.addr_width
+    def _get_address_str(self, node: AddressableNode, subword_offset: int=0, lsb: int=0) -> str:
+        """
+        Address of the node's current element, excluding the address bits
+        below lsb.
+
+        Indexes of an indexed register array are not included.
+        """
+        expr_width = self.ds.addr_width - lsb
         a = str(SVInt(
-            node.raw_absolute_address - self.ds.top_node.raw_absolute_address + subword_offset,
+            (node.raw_absolute_address - self.ds.top_node.raw_absolute_address + subword_offset) >> lsb,
             expr_width
         ))
-        for i, stride in enumerate(self._array_stride_stack):
-            a += f" + ({expr_width})'(i{i}) * {SVInt(stride, expr_width)}"
+        n_strides = len(self._array_stride_stack) - len(self._indexed_array_dims)
+        for i, stride in enumerate(self._array_stride_stack[:n_strides]):
+            a += f" + ({expr_width})'(i{i}) * {SVInt(stride >> lsb, expr_width)}"
         return a
 
 
     def get_addr_compare_conditional(self, addr: str) -> str:
         return f"rd_mux_addr == {addr}"
 
+    def get_addr_compare_width(self) -> int:
+        """
+        Number of address bits that are compared by each address conditional
+        """
+        return self.ds.addr_width
+
+    def _get_unrolled_addresses(self, node: AddressableNode, subword_offset: int) -> List[int]:
+        """
+        Addresses of all elements of the current loop body
+        """
+        addresses = [node.raw_absolute_address - self.ds.top_node.raw_absolute_address + subword_offset]
+        dims = [b.dim for b in self._stack if isinstance(b, LoopBody)] + self._indexed_array_dims
+        for dim, stride in zip(dims, self._array_stride_stack):
+            addresses = [a + i * stride for a in addresses for i in range(dim)]
+        return addresses
+
+    def _get_assignment_slice(self, lhs: str) -> Tuple[int, int]:
+        """
+        Get the high and low bit of the readback data that an assignment drives
+        """
+        m = ASSIGNMENT_SLICE_RE.search(lhs)
+        if m is None:
+            return self.exp.cpuif.data_width - 1, 0
+        if m.group(2) is None:
+            return int(m.group(1)), int(m.group(1))
+        return int(m.group(1)), int(m.group(2))
+
+    def _add_readback_cost(self, node: RegNode, subword_offset: int, assignments: List[str], is_indexed: bool) -> None:
+        assert self._cost is not None
+        addresses = self._get_unrolled_addresses(node, subword_offset)
+        for assignment in assignments:
+            high, low = self._get_assignment_slice(assignment.split(" = ")[0])
+            self._cost.add_readback_input(addresses, high, low)
+
+        if is_indexed:
+            # Address bits other than the index are compared once for the
+            # entire array
+            n_elements = 1
+            for dim in self._indexed_array_dims:
+                n_elements *= dim
+            self._cost.readback_comparators.add(
+                self.ds.addr_width - self._get_array_index_width(self._indexed_array_dims),
+                len(addresses) // n_elements
+            )
+            return
+
+        if self._case is not None and not self._array_stride_stack:
+            # Case items are counted once the case statement is complete
+            return
+        if self.ds.and_or_readback and not node.external:
+            # Selected by the existing decode strobes
+            return
+        self._cost.readback_comparators.add(self.get_addr_compare_width(), len(addresses))
+
+    def _add_external_block_cost(self, node: AddressableNode, is_predecoded: bool = False) -> None:
+        if self._cost is None:
+            return
+        addresses = self._get_unrolled_addresses(node, 0)
+        self._cost.add_readback_input(addresses, self.exp.cpuif.data_width - 1, 0)
+        if not is_predecoded:
+            self._cost.readback_comparators.add(self.ds.addr_width, 2 * len(addresses))
+
+    def add_readback_content(self, node: RegNode, subword_offset: int, assignments: List[str]) -> None:
+        """
+        Add the assignments that are done if the read address matches the
+        register's subword
+        """
+        indexed_content = None
+        if self._indexed_array_dims:
+            indexed_content = self._get_indexed_array_content(node, subword_offset, assignments)
+
+        if self._cost is not None:
+            self._add_readback_cost(node, subword_offset, assignments, indexed_content is not None)
+
+        if indexed_content is not None:
+            for s in indexed_content:
+                self.add_content(s)
+            return
+
+        if self._indexed_array_dims:
+            # Fall back to comparing the address of each element
+            dims = self._indexed_array_dims
+            self._indexed_array_dims = []
+            for dim in dims:
+                self.push_loop(dim)
+            self._add_compare_readback_content(node, subword_offset, assignments)
+            for _ in dims:
+                self.pop_loop()
+            self._indexed_array_dims = dims
+            return
+
+        self._add_compare_readback_content(node, subword_offset, assignments)
+
+    def _add_compare_readback_content(self, node: RegNode, subword_offset: int, assignments: List[str]) -> None:
+        if self.ds.and_or_readback:
+            self.add_and_or_readback_content(node, subword_offset, assignments)
+            return
+
+        if self._case is not None and not self._array_stride_stack:
+            address = node.raw_absolute_address - self.ds.top_node.raw_absolute_address + subword_offset
+            for assignment in assignments:
+                self._case.add_item_content(address, assignment)
+            return
+
+        addr = self._get_address_str(node, subword_offset=subword_offset)
+        conditional = self.get_addr_compare_conditional(addr)
+        self.add_content(f"if({conditional}) begin")
+        for assignment in assignments:
+            self.add_content("    " + assignment)
+        self.add_content("end")
+
+    def _get_indexed_array_content(self, node: RegNode, subword_offset: int, assignments: List[str]) -> Optional[List[str]]:
+        """
+        Get the readback content of a register array subword, where the element
+        is selected by the index bits of the read address.
+
+        Returns None if the assignments depend on the element's index other than
+        by selecting the element, since these cannot be indexed.
+        """
+        dims = self._indexed_array_dims
+        first_iterator = len(self._array_stride_stack) - len(dims)
+        lsb = clog2(self._array_stride_stack[-1])
+
+        # Each dimension's index is a group of address bits above the element's
+        # offset. The last dimension varies fastest.
+        indexes = [] # type: List[str]
+        msb = lsb
+        for dim in reversed(dims):
+            width = clog2(dim)
+            if width > 1:
+                indexes.insert(0, f"rd_mux_addr[{msb + width - 1}:{msb}]")
+            elif width == 1:
+                indexes.insert(0, f"rd_mux_addr[{msb}]")
+            else:
+                indexes.insert(0, "0")
+            msb += width
+
+        content = [] # type: List[str]
+        for assignment in assignments:
+            for i, index in enumerate(indexes):
+                assignment = assignment.replace(f"[i{first_iterator + i}]", f"[{index}]")
+            for i in range(len(dims)):
+                if re.search(rf"\bi{first_iterator + i}\b", assignment):
+                    return None
+            content.append(assignment)
+
+        conditions = []
+        if msb < self.ds.addr_width:
+            addr = self._get_address_str(node, lsb=msb)
+            conditions.append(f"(rd_mux_addr[{self.ds.addr_width - 1}:{msb}] == {addr})")
+        if not is_pow2(dims[0]):
+            # Index of the first dimension can exceed its size
+            conditions.append(f"({indexes[0]} < {SVInt(dims[0], clog2(dims[0]))})")
+        if lsb:
+            conditions.append(f"(rd_mux_addr[{lsb - 1}:0] == {SVInt(subword_offset, lsb)})")
+
+        if not conditions:
+            return content
+        return (
+            [f"if({' && '.join(conditions)}) begin"]
+            + ["    " + s for s in content]
+            + ["end"]
+        )
+
+    def add_and_or_readback_content(self, node: RegNode, subword_offset: int, assignments: List[str]) -> None:
+        """
+        Mask the value of each assignment with the register's decode strobe,
+        and OR it into the readback data
+        """
+        if node.external:
+            # External registers respond after their decode strobe, so their
+            # read address is still compared.
+            addr = self._get_address_str(node, subword_offset=subword_offset)
+            strobe = f"({self.get_addr_compare_conditional(addr)})"
+        else:
+            reg = self.ds.descriptors.get_reg(node)
+            subword_index = None
+            if reg.regwidth > reg.accesswidth:
+                subword_index = subword_offset // (reg.accesswidth // 8)
+            strobe = self.exp.dereferencer.get_access_strobe(node, subword_index=subword_index, read_channel=True)
+
+        for assignment in assignments:
+            lhs, rhs = assignment.rstrip(";").split(" = ", 1)
+            high, low = self._get_assignment_slice(lhs)
+            if rhs.startswith("{<<"):
+                # Bit-swapped values are streaming concatenations, which cannot
+                # be an operand. Since decode strobes are mutually exclusive,
+                # assign them only if selected instead.
+                self.add_content(f"if({strobe}) {lhs} = {rhs};")
+            elif high == low:
+                self.add_content(f"{lhs} |= {strobe} & {rhs};")
+            else:
+                self.add_content(f"{lhs} |= {{{high - low + 1}{{{strobe}}}}} & {rhs};")
+
     def get_readback_data_var(self, addr: str) -> str:
         return "readback_data_var"
 
@@ -116,22 +386,17 @@ class ReadbackMuxGenerator(RDLForLoopGenerator):
             n_subwords = regwidth // accesswidth
             subword_stride = accesswidth // 8
             for subword_idx in range(n_subwords):
-                addr = self._get_address_str(node, subword_offset=subword_idx*subword_stride)
-                conditional = self.get_addr_compare_conditional(addr)
+                subword_offset = subword_idx*subword_stride
+                addr = self._get_address_str(node, subword_offset=subword_offset)
                 var = self.get_readback_data_var(addr)
-                self.add_content(f"if({conditional}) begin")
-                self.add_content(f"    {var} = {data};")
-                self.add_content("end")
+                self.add_readback_content(node, subword_offset, [f"{var} = {data};"])
         else:
             addr = self._get_address_str(node)
-            conditional = self.get_addr_compare_conditional(addr)
             var = self.get_readback_data_var(addr)
-            self.add_content(f"if({conditional}) begin")
             if regwidth < self.exp.cpuif.data_width:
-                self.add_content(f"    {var}[{regwidth-1}:0] = {data};")
+                self.add_readback_content(node, 0, [f"{var}[{regwidth-1}:0] = {data};"])
             else:
-                self.add_content(f"    {var} = {data};")
-            self.add_content("end")
+                self.add_readback_content(node, 0, [f"{var} = {data};"])
 
 
     def process_reg(self, node: RegNode, fields: Sequence[FieldNode]) -> None:
@@ -139,22 +404,48 @@ class ReadbackMuxGenerator(RDLForLoopGenerator):
         Process a regular register
         """
         addr = self._get_address_str(node)
-        conditional = self.get_addr_compare_conditional(addr)
         var = self.get_readback_data_var(addr)
-        self.add_content(f"if({conditional}) begin")
-
+        assignments = []
+        constant = 0
+        constant_mask = 0
         for field in fields:
             value = self.exp.dereferencer.get_value(field)
             if field.msb < field.lsb:
                 # Field gets bitswapped since it is in [low:high] orientation
                 value = do_bitswap(value)
 
-            if field.width == 1:
-                self.add_content(f"    {var}[{field.low}] = {value};")
+            if isinstance(value, SVInt):
+                constant |= value.value << field.low
+                constant_mask |= ((1 << field.width) - 1) << field.low
+            elif field.width == 1:
+                assignments.append(f"{var}[{field.low}] = {value};")
             else:
-                self.add_content(f"    {var}[{field.high}:{field.low}] = {value};")
+                assignments.append(f"{var}[{field.high}:{field.low}] = {value};")
 
-        self.add_content("end")
+        self.insert_constant_assignment(assignments, var, constant, constant_mask)
+        if assignments:
+            self.add_readback_content(node, 0, assignments)
+
+
+    def insert_constant_assignment(self, assignments: List[str], var: str, constant: int, mask: int) -> None:
+        """
+        Merge the constant bits of a register subword, as selected by mask, into
+        a single literal.
+
+        The literal is assigned first, so that the subword's other assignments
+        override any of its bits that are not constant. If all constant bits
+        are 0, they are already covered by the readback data's default, so
+        nothing is assigned.
+        """
+        if not constant:
+            return
+        low = (mask & -mask).bit_length() - 1
+        high = mask.bit_length() - 1
+        value = SVInt(constant >> low, high - low + 1)
+        if high == low:
+            assignments.insert(0, f"{var}[{low}] = {value};")
+        else:
+            assignments.insert(0, f"{var}[{high}:{low}] = {value};")
 
 
     def process_buffered_reg(self, node: RegNode, regwidth: int, accesswidth: int) -> None:
@@ -168,21 +459,16 @@ class ReadbackMuxGenerator(RDLForLoopGenerator):
             n_subwords = regwidth // accesswidth
             subword_stride = accesswidth // 8
             for subword_idx in range(n_subwords):
-                addr = self._get_address_str(node, subword_offset=subword_idx*subword_stride)
-                conditional = self.get_addr_compare_conditional(addr)
+                subword_offset = subword_idx*subword_stride
+                addr = self._get_address_str(node, subword_offset=subword_offset)
                 var = self.get_readback_data_var(addr)
                 bslice = f"[{(subword_idx + 1) * accesswidth - 1}:{subword_idx*accesswidth}]"
-                self.add_content(f"if({conditional}) begin")
-                self.add_content(f"    {var} = {rbuf}{bslice};")
-                self.add_content("end")
+                self.add_readback_content(node, subword_offset, [f"{var} = {rbuf}{bslice};"])
         else:
             # Is regular reg
             addr = self._get_address_str(node)
-            conditional = self.get_addr_compare_conditional(addr)
             var = self.get_readback_data_var(addr)
-            self.add_content(f"if({conditional}) begin")
-            self.add_content(f"    {var}[{regwidth-1}:0] = {rbuf};")
-            self.add_content("end")
+            self.add_readback_content(node, 0, [f"{var}[{regwidth-1}:0] = {rbuf};"])
 
 
     def process_wide_buffered_reg_with_bypass(self, node: RegNode, fields: Sequence[FieldNode], regwidth: int, accesswidth: int) -> None:
@@ -197,25 +483,18 @@ class ReadbackMuxGenerator(RDLForLoopGenerator):
         # Generate assignments for first sub-word
         subword_assignments = self.get_wide_reg_subword_assignments(node, fields, regwidth, accesswidth)
         if subword_assignments[0]:
-            addr = self._get_address_str(node, subword_offset=0)
-            conditional = self.get_addr_compare_conditional(addr)
-            self.add_content(f"if({conditional}) begin")
-            for assignment in subword_assignments[0]:
-                self.add_content("    " + assignment)
-            self.add_content("end")
+            self.add_readback_content(node, 0, subword_assignments[0])
 
         # Assign remainder of subwords from read buffer
         n_subwords = regwidth // accesswidth
         subword_stride = accesswidth // 8
         rbuf = self.exp.read_buffering.get_rbuf_data(node)
         for subword_idx in range(1, n_subwords):
-            addr = self._get_address_str(node, subword_offset=subword_idx*subword_stride)
+            subword_offset = subword_idx*subword_stride
+            addr = self._get_address_str(node, subword_offset=subword_offset)
             bslice = f"[{(subword_idx + 1) * accesswidth - 1}:{subword_idx*accesswidth}]"
-            conditional = self.get_addr_compare_conditional(addr)
             var = self.get_readback_data_var(addr)
-            self.add_content(f"if({conditional}) begin")
-            self.add_content(f"    {var} = {rbuf}{bslice};")
-            self.add_content("end")
+            self.add_readback_content(node, subword_offset, [f"{var} = {rbuf}{bslice};"])
 
 
     def get_wide_reg_subword_assignments(self, node: RegNode, fields: Sequence[FieldNode], regwidth: int, accesswidth: int) -> List[List[str]]:
@@ -228,6 +507,8 @@ class ReadbackMuxGenerator(RDLForLoopGenerator):
         n_subwords = regwidth // accesswidth
         subword_stride = accesswidth // 8
         subword_assignments: List[List[str]] = [[] for _ in range(n_subwords)]
+        subword_constants = [0] * n_subwords
+        subword_constant_masks = [0] * n_subwords
 
         # Fields are sorted by ascending low bit
         for field in fields:
@@ -243,9 +524,13 @@ class ReadbackMuxGenerator(RDLForLoopGenerator):
                     # Field gets bitswapped since it is in [low:high] orientation
                     value = do_bitswap(value)
 
-                addr = self._get_address_str(node, subword_offset=subword_idx*subword_stride)
-                var = self.get_readback_data_var(addr)
-                subword_assignments[subword_idx].append(f"{var}[{high}:{low}] = {value};")
+                if isinstance(value, SVInt):
+                    subword_constants[subword_idx] |= value.value << low
+                    subword_constant_masks[subword_idx] |= ((1 << field.width) - 1) << low
+                else:
+                    addr = self._get_address_str(node, subword_offset=subword_idx*subword_stride)
+                    var = self.get_readback_data_var(addr)
+                    subword_assignments[subword_idx].append(f"{var}[{high}:{low}] = {value};")
 
             else:
                 # Field spans multiple sub-words
@@ -278,13 +563,24 @@ class ReadbackMuxGenerator(RDLForLoopGenerator):
                     else:
                         value = do_slice(self.exp.dereferencer.get_value(field), f_high, f_low)
 
-                    addr = self._get_address_str(node, subword_offset=subword_idx*subword_stride)
-                    var = self.get_readback_data_var(addr)
-                    subword_assignments[subword_idx].append(f"{var}[{r_high}:{r_low}] = {value};")
+                    if isinstance(value, SVInt):
+                        subword_constants[subword_idx] |= value.value << r_low
+                        subword_constant_masks[subword_idx] |= ((1 << (r_high - r_low + 1)) - 1) << r_low
+                    else:
+                        addr = self._get_address_str(node, subword_offset=subword_idx*subword_stride)
+                        var = self.get_readback_data_var(addr)
+                        subword_assignments[subword_idx].append(f"{var}[{r_high}:{r_low}] = {value};")
 
                     # advance to the next subword
                     subword_idx += 1
 
+        for subword_idx, constant in enumerate(subword_constants):
+            addr = self._get_address_str(node, subword_offset=subword_idx*subword_stride)
+            var = self.get_readback_data_var(addr)
+            self.insert_constant_assignment(
+                subword_assignments[subword_idx], var, constant, subword_constant_masks[subword_idx]
+            )
+
         return subword_assignments
 
 
@@ -299,16 +595,14 @@ class ReadbackMuxGenerator(RDLForLoopGenerator):
         for subword_idx, assignments in enumerate(subword_assignments):
             if not assignments:
                 continue
-            addr = self._get_address_str(node, subword_offset=subword_idx*subword_stride)
-            conditional = self.get_addr_compare_conditional(addr)
-            self.add_content(f"if({conditional}) begin")
-            for assignment in assignments:
-                self.add_content("    " + assignment)
-            self.add_content("end")
+            self.add_readback_content(node, subword_idx*subword_stride, assignments)
 
 
     def exit_AddressableComponent(self, node: AddressableNode) -> None:
-        super().exit_AddressableComponent(node)
+        if isinstance(node, RegNode) and self._indexed_array_dims:
+            self._indexed_array_dims = []
+        else:
+            super().exit_AddressableComponent(node)
 
         if not node.array_dimensions:
             return
@@ -316,11 +610,21 @@ class ReadbackMuxGenerator(RDLForLoopGenerator):
         for _ in node.array_dimensions:
             self._array_stride_stack.pop()
 
+    def detach(self) -> Optional[Body]:
+        if self._case is not None and self._case.items:
+            if self._cost is not None:
+                self._cost.readback_comparators.add(self._case.width, len(self._case.items))
+            self._stack[0].children.insert(0, self._case)
+        return super().detach()
+
 
 class RetimedReadbackMuxGenerator(ReadbackMuxGenerator):
     """
     Alternate variant that is dedicated to building the 1st decode stage
     """
+    # Registers are assigned to bins by their high address bits
+    supports_unique_case = False
+    supports_indexed_array = False
 
     def process_external_block(self, node: AddressableNode) -> None:
         # Do nothing. External blocks are handled in a completely separate readback mux
@@ -330,8 +634,14 @@ class RetimedReadbackMuxGenerator(ReadbackMuxGenerator):
         # In the pipelined variant, compare the low-bits of both sides
         return f"ad_low(rd_mux_addr) == ad_low({addr})"
 
+    def get_addr_compare_width(self) -> int:
+        low_addr_width, _ = self.exp.readback.get_address_split()
+        return low_addr_width
+
     def get_readback_data_var(self, addr: str) -> str:
         # In the pipelined variant, assign to the bin indexed by the high bits of addr
+        if self.exp.readback.has_sparse_bins:
+            return f"readback_data_var[ad_bin({addr})]"
         return f"readback_data_var[ad_hi({addr})]"
 
 
@@ -344,18 +654,34 @@ class RetimedExtBlockReadbackMuxGenerator(ReadbackMuxGenerator):
     addresses does not work cleanly for address ranges. (not possible to cleanly
     map readback of a range to high-address data bins)
 
-    Since the non-retimed mux generator already implements external ranges,
-    re-use it and suppress generation of register logic.
+    Instead, the range of each block is already compared by the address decoder.
+    Its decode strobe is held until the block responds, so that the block's read
+    data only needs to be selected by a one-hot AND-OR mux.
     """
 
     def enter_Reg(self, node: RegNode) -> WalkerAction:
         return WalkerAction.SkipDescendants
 
     def process_external_block(self, node: AddressableNode) -> None:
-        addr_lo = self._get_address_str(node)
-        addr_hi = f"{addr_lo} + {SVInt(node.size - 1, self.exp.ds.addr_width)}"
-        self.add_content(f"if((rd_mux_addr >= {addr_lo}) && (rd_mux_addr <= {addr_hi})) begin")
+        idx = self.exp.readback.ext_block_strobe_vector.get_index(node)
+        strb = f"readback_ext_block_strb[{idx}]"
         data = self.exp.hwif.get_external_rd_data(node)
-        self.add_content(f"    readback_data_var = {data};")
-        self.add_content("    is_external_block_var = 1'b1;")
-        self.add_content("end")
+        self.add_content(f"readback_data_var |= {{{self.exp.cpuif.data_width}{{{strb}}}}} & {data};")
+        self.add_content(f"is_external_block_var |= {strb};")
+        self._add_external_block_cost(node, is_predecoded=True)
+
+
+class ExtBlockStrobeGenerator(RetimedExtBlockReadbackMuxGenerator):
+    """
+    Gathers the decode strobes of all external blocks into a dedicated vector,
+    so that only these need to be held until the block responds
+    """
+    def __init__(self, exp: 'RegblockExporter') -> None:
+        super().__init__(exp)
+        # Readback mux inputs were already recorded by the mux generator
+        self._cost = None
+
+    def process_external_block(self, node: AddressableNode) -> None:
+        idx = self.exp.readback.ext_block_strobe_vector.get_index(node)
+        strb = self.exp.address_decode.get_external_block_access_strobe(node)
+        self.add_content(f"readback_ext_block_strb_c[{idx}] = {strb};")
@@ -1,7 +1,13 @@
+{% if ds.has_external_addressable -%}
+assign readback_done = decoded_req & ~decoded_req_is_wr & ~decoded_req_is_external;
+{%- elif ds.dual_issue -%}
+assign readback_done = decoded_rd_req;
+{%- else -%}
 assign readback_done = decoded_req & ~decoded_req_is_wr;
+{%- endif %}
 assign readback_data = '0;
 {%- if ds.err_if_bad_addr or ds.err_if_bad_rw %}
-assign readback_err = decoded_err;
+assign readback_err = {{"decoded_rd_err" if ds.dual_issue else "decoded_err"}};
 {%- else %}
 assign readback_err = '0;
 {%- endif %}
@@ -1,16 +1,18 @@
 always_comb begin
     automatic logic [{{cpuif.data_width-1}}:0] readback_data_var;
     readback_data_var = '0;
-    {{readback_mux|indent}}
+    {% for chunk in indent_chunks(readback_mux) %}{{chunk}}{% endfor %}
     readback_data = readback_data_var;
 
     {%- if ds.has_external_addressable %}
     readback_done = decoded_req & ~decoded_req_is_wr & ~decoded_req_is_external;
+    {%- elif ds.dual_issue %}
+    readback_done = decoded_rd_req;
     {%- else %}
     readback_done = decoded_req & ~decoded_req_is_wr;
     {%- endif %}
     {%- if ds.err_if_bad_addr or ds.err_if_bad_rw %}
-    readback_err = decoded_err;
+    readback_err = {{"decoded_rd_err" if ds.dual_issue else "decoded_err"}};
     {%- else %}
     readback_err = '0;
     {%- endif %}
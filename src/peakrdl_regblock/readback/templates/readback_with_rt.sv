@@ -4,31 +4,42 @@ endfunction
 function automatic bit [{{high_addr_width-1}}:0] ad_hi(bit [{{ds.addr_width-1}}:0] addr);
     return addr[{{ds.addr_width-1}}:{{low_addr_width}}];
 endfunction
+{%- if bin_index_function %}
+{{bin_index_function}}
+{%- endif %}
 
 // readback stage 1
-logic [{{cpuif.data_width-1}}:0] readback_data_rt_c[{{2 ** high_addr_width}}];
+{%- if has_readback_mux %}
+logic [{{cpuif.data_width-1}}:0] readback_data_rt_c[{{n_bins}}];
 always_comb begin
-    automatic logic [{{cpuif.data_width-1}}:0] readback_data_var[{{2 ** high_addr_width}}];
-    for(int i=0; i<{{2 ** high_addr_width}}; i++) readback_data_var[i] = '0;
-    {{readback_mux|indent}}
+    automatic logic [{{cpuif.data_width-1}}:0] readback_data_var[{{n_bins}}];
+    for(int i=0; i<{{n_bins}}; i++) readback_data_var[i] = '0;
+    {% for chunk in indent_chunks(readback_mux) %}{{chunk}}{% endfor %}
     readback_data_rt_c = readback_data_var;
 end
 
-logic [{{cpuif.data_width-1}}:0] readback_data_rt[{{2 ** high_addr_width}}];
+logic [{{cpuif.data_width-1}}:0] readback_data_rt[{{n_bins}}];
+{%- endif %}
 logic readback_done_rt;
 logic readback_err_rt;
 logic [{{ds.addr_width-1}}:0] readback_addr_rt;
 always_ff {{get_always_ff_event(cpuif.reset)}} begin
     if({{get_resetsignal(cpuif.reset)}}) begin
-        for(int i=0; i<{{2 ** high_addr_width}}; i++) readback_data_rt[i] <= '0;
+        {%- if has_readback_mux %}
+        for(int i=0; i<{{n_bins}}; i++) readback_data_rt[i] <= '0;
+        {%- endif %}
         readback_done_rt <= '0;
         readback_err_rt <= '0;
         readback_addr_rt <= '0;
     end else begin
+        {%- if has_readback_mux %}
         readback_data_rt <= readback_data_rt_c;
-        readback_err_rt <= decoded_err;
+        {%- endif %}
+        readback_err_rt <= {{"decoded_rd_err" if ds.dual_issue else "decoded_err"}};
         {%- if ds.has_external_addressable %}
         readback_done_rt <= decoded_req & ~decoded_req_is_wr & ~decoded_req_is_external;
+        {%- elif ds.dual_issue %}
+        readback_done_rt <= decoded_rd_req;
         {%- else %}
         readback_done_rt <= decoded_req & ~decoded_req_is_wr;
         {%- endif %}
@@ -37,6 +48,25 @@ always_ff {{get_always_ff_event(cpuif.reset)}} begin
 end
 
 {% if ds.has_external_block %}
+// External blocks are selected by their decode strobes, which are held until
+// the block responds
+logic [{{ext_block_strb_width-1}}:0] readback_ext_block_strb_c;
+always_comb begin
+    readback_ext_block_strb_c = '0;
+    {% for chunk in indent_chunks(ext_block_strb) %}{{chunk}}{% endfor %}
+end
+
+logic [{{ext_block_strb_width-1}}:0] readback_ext_block_strb_held;
+logic [{{ext_block_strb_width-1}}:0] readback_ext_block_strb;
+always_ff {{get_always_ff_event(cpuif.reset)}} begin
+    if({{get_resetsignal(cpuif.reset)}}) begin
+        readback_ext_block_strb_held <= '0;
+    end else begin
+        if(decoded_req) readback_ext_block_strb_held <= readback_ext_block_strb_c;
+    end
+end
+assign readback_ext_block_strb = decoded_req ? readback_ext_block_strb_c : readback_ext_block_strb_held;
+
 logic [{{cpuif.data_width-1}}:0] readback_ext_block_data_rt_c;
 logic readback_is_ext_block_c;
 always_comb begin
@@ -44,7 +74,7 @@ always_comb begin
     automatic logic is_external_block_var;
     readback_data_var = '0;
     is_external_block_var = '0;
-    {{ext_block_readback_mux|indent}}
+    {% for chunk in indent_chunks(ext_block_readback_mux) %}{{chunk}}{% endfor %}
     readback_ext_block_data_rt_c = readback_data_var;
     readback_is_ext_block_c = is_external_block_var;
 end
@@ -61,21 +91,79 @@ always_ff {{get_always_ff_event(cpuif.reset)}} begin
     end
 end
 {% endif %}
+{%- for stage in reduce_stages %}
 
-// readback stage 2
+// readback stage {{stage.n}}
+{%- if has_readback_mux %}
+logic [{{cpuif.data_width-1}}:0] readback_data_rt{{stage.n}}_c[{{stage.n_bins}}];
+always_comb begin
+    {%- if stage.select %}
+    {{stage.select|indent}}
+    {%- else %}
+    for(int i=0; i<{{stage.n_bins}}; i++) begin
+        readback_data_rt{{stage.n}}_c[i] = readback_data{{stage.prev}}[i * {{2 ** stage.width}} + readback_addr{{stage.prev}}[{{stage.lsb + stage.width - 1}}:{{stage.lsb}}]];
+    end
+    {%- endif %}
+end
+
+logic [{{cpuif.data_width-1}}:0] readback_data_rt{{stage.n}}[{{stage.n_bins}}];
+{%- endif %}
+logic readback_done_rt{{stage.n}};
+logic readback_err_rt{{stage.n}};
+logic [{{ds.addr_width-1}}:0] readback_addr_rt{{stage.n}};
+{%- if ds.has_external_block %}
+logic [{{cpuif.data_width-1}}:0] readback_ext_block_data_rt{{stage.n}};
+logic readback_is_ext_block_rt{{stage.n}};
+{%- endif %}
+always_ff {{get_always_ff_event(cpuif.reset)}} begin
+    if({{get_resetsignal(cpuif.reset)}}) begin
+        {%- if has_readback_mux %}
+        for(int i=0; i<{{stage.n_bins}}; i++) readback_data_rt{{stage.n}}[i] <= '0;
+        {%- endif %}
+        readback_done_rt{{stage.n}} <= '0;
+        readback_err_rt{{stage.n}} <= '0;
+        readback_addr_rt{{stage.n}} <= '0;
+        {%- if ds.has_external_block %}
+        readback_ext_block_data_rt{{stage.n}} <= '0;
+        readback_is_ext_block_rt{{stage.n}} <= '0;
+        {%- endif %}
+    end else begin
+        {%- if has_readback_mux %}
+        readback_data_rt{{stage.n}} <= readback_data_rt{{stage.n}}_c;
+        {%- endif %}
+        readback_done_rt{{stage.n}} <= readback_done{{stage.prev}};
+        readback_err_rt{{stage.n}} <= readback_err{{stage.prev}};
+        readback_addr_rt{{stage.n}} <= readback_addr{{stage.prev}};
+        {%- if ds.has_external_block %}
+        readback_ext_block_data_rt{{stage.n}} <= readback_ext_block_data{{stage.prev}};
+        readback_is_ext_block_rt{{stage.n}} <= readback_is_ext_block{{stage.prev if stage.n > 2 else ""}};
+        {%- endif %}
+    end
+end
+{%- endfor %}
+
+// readback stage {{reduce_stages|length + 2}}
 always_comb begin
     {%- if ds.has_external_block %}
-    if(readback_is_ext_block) begin
-        readback_data = readback_ext_block_data_rt;
+    if(readback_is_ext_block{{last_rt if reduce_stages else ""}}) begin
+        readback_data = readback_ext_block_data{{last_rt}};
     end else begin
-        readback_data = readback_data_rt[readback_addr_rt[{{ds.addr_width-1}}:{{low_addr_width}}]];
+        {%- if not has_readback_mux %}
+        readback_data = '0;
+        {%- elif last_select %}
+        {{last_select|indent(8)}}
+        {%- else %}
+        readback_data = readback_data{{last_rt}}[readback_addr{{last_rt}}[{{ds.addr_width-1}}:{{last_lsb}}]];
+        {%- endif %}
     end
+    {%- elif last_select %}
+    {{last_select|indent}}
     {%- else %}
-    readback_data = readback_data_rt[readback_addr_rt[{{ds.addr_width-1}}:{{low_addr_width}}]];
+    readback_data = readback_data{{last_rt}}[readback_addr{{last_rt}}[{{ds.addr_width-1}}:{{last_lsb}}]];
     {%- endif %}
-    readback_done = readback_done_rt;
+    readback_done = readback_done{{last_rt}};
     {%- if ds.err_if_bad_addr or ds.err_if_bad_rw %}
-    readback_err = readback_err_rt;
+    readback_err = readback_err{{last_rt}};
     {%- else %}
     readback_err = '0;
     {%- endif %}
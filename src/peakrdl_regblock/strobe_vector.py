@@ -0,0 +1,145 @@
+from typing import TYPE_CHECKING, Dict, List, Tuple, Any, Optional
+
+from systemrdl.node import RegNode, AddressableNode
+
+if TYPE_CHECKING:
+    from systemrdl.node import AddrmapNode, Node
+
+
+class StrobeVectorEntry:
+    def __init__(self, node: AddressableNode, base: int, n_subwords: int, array_dimensions: List[int]) -> None:
+        self.node = node
+
+        # Bit position of the first strobe
+        self.base = base
+
+        # Number of strobes per element. Wide registers have one per subword
+        self.n_subwords = n_subwords
+
+        # Dimensions of all arrays that the node is within, including its own
+        self.array_dimensions = array_dimensions
+
+        self.n_elements = 1
+        for dim in array_dimensions:
+            self.n_elements *= dim
+
+    @property
+    def width(self) -> int:
+        return self.n_elements * self.n_subwords
+
+
+class DecodeStrobeVector:
+    """
+    Map of each register's and external block's decode strobes onto the bits of
+    a single packed vector.
+
+    Entries are allocated in hierarchical order. Within an entry, the strobes of
+    all unrolled elements are allocated consecutively in row-major order, with
+    the subword index varying fastest.
+
+    If external_blocks_only is set, registers are not allocated any strobes.
+    """
+    def __init__(self, top_node: 'AddrmapNode', external_blocks_only: bool = False) -> None:
+        self.top_node = top_node
+        self.external_blocks_only = external_blocks_only
+        self.width = 0
+        self.entries = [] # type: List[StrobeVectorEntry]
+
+        # Entries keyed by the node's lineage of component instances
+        self._entries = {} # type: Dict[Tuple[Any, ...], StrobeVectorEntry]
+
+        self._scan(top_node, [])
+
+    def _scan(self, node: AddressableNode, array_dimensions: List[int]) -> None:
+        for child in node.children():
+            if not isinstance(child, AddressableNode):
+                continue
+
+            child_dimensions = array_dimensions + (child.array_dimensions or [])
+            if isinstance(child, RegNode):
+                if self.external_blocks_only:
+                    continue
+                n_subwords = child.get_property("regwidth") // child.get_property("accesswidth")
+                self._add_entry(child, n_subwords, child_dimensions)
+            elif child.external:
+                self._add_entry(child, 1, child_dimensions)
+            else:
+                self._scan(child, child_dimensions)
+
+    def _add_entry(self, node: AddressableNode, n_subwords: int, array_dimensions: List[int]) -> None:
+        entry = StrobeVectorEntry(node, self.width, n_subwords, array_dimensions)
+        self.width += entry.width
+        self.entries.append(entry)
+        self._entries[self._get_key(node)] = entry
+
+    def _get_key(self, node: 'Node') -> Tuple[Any, ...]:
+        key = []
+        current_node = node # type: Optional[Node]
+        while current_node is not None and current_node.inst is not self.top_node.inst:
+            key.append(current_node.inst)
+            current_node = current_node.parent
+        return tuple(key)
+
+    def get_entry(self, node: AddressableNode) -> StrobeVectorEntry:
+        return self._entries[self._get_key(node)]
+
+    def get_index(self, node: AddressableNode, subword_index: int = 0) -> str:
+        """
+        Index expression of the node's strobe within the vector.
+
+        Array indexes that are not known are represented by the loop iterators
+        i0, i1, ..., numbered the same way as in indexed paths.
+        """
+        entry = self.get_entry(node)
+
+        # Collect the index of each array dimension, top-down
+        indexes = [] # type: List[Optional[int]]
+        lineage = []
+        current_node = node # type: Optional[Node]
+        while current_node is not None and current_node.inst is not self.top_node.inst:
+            lineage.append(current_node)
+            current_node = current_node.parent
+        for n in reversed(lineage):
+            if not isinstance(n, AddressableNode) or not n.array_dimensions:
+                continue
+            if n.current_idx is None:
+                indexes.extend([None] * len(n.array_dimensions))
+            else:
+                indexes.extend(n.current_idx)
+
+        offset = entry.base + subword_index
+        terms = []
+        weight = entry.width
+        n_iterators = 0
+        for idx, dim in zip(indexes, entry.array_dimensions):
+            weight //= dim
+            if idx is not None:
+                offset += idx * weight
+                continue
+            if weight == 1:
+                terms.append(f"i{n_iterators}")
+            else:
+                terms.append(f"i{n_iterators}*{weight}")
+            n_iterators += 1
+
+        if offset or not terms:
+            terms.insert(0, str(offset))
+        return " + ".join(terms)
+
+    def get_typedef(self, type_name: str) -> str:
+        lines = [
+            f"// Bit positions of the decode strobes within {type_name}.",
+            "// Array elements are allocated consecutively in row-major order, and each",
+            "// element has one strobe per register subword.",
+        ]
+        for entry in self.entries:
+            if entry.width == 1:
+                position = f"[{entry.base}]"
+            else:
+                position = f"[{entry.base} +: {entry.width}]"
+            path = entry.node.get_rel_path(self.top_node, empty_array_suffix="[{dim:d}]")
+            if entry.n_subwords > 1:
+                path += f" ({entry.n_subwords} subwords)"
+            lines.append(f"//   {position:<16} {path}")
+        lines.append(f"typedef logic [{self.width-1}:0] {type_name};")
+        return "\n".join(lines)
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Optional, List
+from typing import TYPE_CHECKING, Optional, List, Iterator
 import textwrap
 from collections import OrderedDict
 
@@ -12,13 +12,39 @@ if TYPE_CHECKING:
     from systemrdl.node import AddrmapNode, RegfileNode, RegNode, FieldNode, Node, MemNode
 
 
+def _get_n_elements(array_dimensions: Optional[List[int]]) -> int:
+    n = 1
+    for dim in array_dimensions or []:
+        n *= dim
+    return n
+
+
 class _StructBase:
     def __init__(self) -> None:
         self.children = [] # type: List[Union[str, _StructBase]]
+        self.array_dimensions = None # type: Optional[List[int]]
+
+        # Total number of bits of all members
+        self.n_bits = 0
+
+    def iter_members(self, prefix: str) -> Iterator[str]:
+        member_prefix = prefix + "    "
+        for i, child in enumerate(self.children):
+            if i:
+                yield "\n"
+            if isinstance(child, _StructBase):
+                yield from child.iter_chunks(member_prefix)
+            else:
+                yield textwrap.indent(child, member_prefix)
+
+    def iter_chunks(self, prefix: str = "") -> Iterator[str]:
+        """
+        Yield the struct's text in chunks, with all lines indented by ``prefix``
+        """
+        yield from self.iter_members(prefix)
 
     def __str__(self) -> str:
-        s = '\n'.join((str(x) for x in self.children))
-        return textwrap.indent(s, "    ")
+        return "".join(self.iter_chunks())
 
 
 class _AnonymousStruct(_StructBase):
@@ -27,17 +53,15 @@ class _AnonymousStruct(_StructBase):
         self.inst_name = inst_name
         self.array_dimensions = array_dimensions
 
-    def __str__(self) -> str:
+    def iter_chunks(self, prefix: str = "") -> Iterator[str]:
         if self.array_dimensions:
             suffix = "[" + "][".join((str(n) for n in self.array_dimensions)) + "]"
         else:
             suffix = ""
 
-        return (
-            "struct {\n"
-            + super().__str__()
-            + f"\n}} {self.inst_name}{suffix};"
-        )
+        yield f"{prefix}struct {{\n"
+        yield from self.iter_members(prefix)
+        yield f"\n{prefix}}} {self.inst_name}{suffix};"
 
 
 class _TypedefStruct(_StructBase):
@@ -48,19 +72,13 @@ class _TypedefStruct(_StructBase):
         self.array_dimensions = array_dimensions
         self.packed = packed
 
-    def __str__(self) -> str:
+    def iter_chunks(self, prefix: str = "") -> Iterator[str]:
         if self.packed:
-            return (
-                "typedef struct packed {\n"
-                + super().__str__()
-                + f"\n}} {self.type_name};"
-            )
+            yield f"{prefix}typedef struct packed {{\n"
         else:
-            return (
-                "typedef struct {\n"
-                + super().__str__()
-                + f"\n}} {self.type_name};"
-            )
+            yield f"{prefix}typedef struct {{\n"
+        yield from self.iter_members(prefix)
+        yield f"\n{prefix}}} {self.type_name};"
 
     @property
     def instantiation(self) -> str:
@@ -71,6 +89,22 @@ class _TypedefStruct(_StructBase):
 
         return f"{self.type_name} {self.inst_name}{suffix};"
 
+
+class _TypedefList(_StructBase):
+    """
+    Sequence of struct typedefs, separated by blank lines
+    """
+    def __init__(self, typedefs: List[_TypedefStruct]) -> None:
+        super().__init__()
+        self.children.extend(typedefs)
+
+    def iter_chunks(self, prefix: str = "") -> Iterator[str]:
+        for i, child in enumerate(self.children):
+            if i:
+                yield "\n\n"
+            assert isinstance(child, _TypedefStruct)
+            yield from child.iter_chunks(prefix)
+
 #-------------------------------------------------------------------------------
 
 class StructGenerator:
@@ -113,6 +147,7 @@ class StructGenerator:
         else:
             m = f"logic {sign}[{lsb+width-1}:{lsb}] {name}{suffix};"
         self.current_struct.children.append(m)
+        self.current_struct.n_bits += width * _get_n_elements(array_dimensions)
 
 
     def pop_struct(self) -> None:
@@ -121,6 +156,7 @@ class StructGenerator:
         if s.children:
             # struct is not empty. Attach it to the parent
             self.current_struct.children.append(s)
+            self.current_struct.n_bits += s.n_bits * _get_n_elements(s.array_dimensions)
 
 
     def start(self, type_name: str) -> None:
@@ -128,12 +164,21 @@ class StructGenerator:
         s = _TypedefStruct(type_name)
         self._struct_stack.append(s)
 
-    def finish(self) -> Optional[str]:
+    def detach(self) -> Optional[_StructBase]:
+        """
+        Complete the struct without rendering it to a string
+        """
         s = self._struct_stack.pop()
         assert not self._struct_stack
 
         if not s.children:
             return None
+        return s
+
+    def finish(self) -> Optional[str]:
+        s = self.detach()
+        if s is None:
+            return None
         return str(s)
 
 
@@ -209,12 +254,13 @@ class FlatStructGenerator(StructGenerator):
         if s.children:
             # struct is not empty. Attach it to the parent
             self.current_struct.children.append(s.instantiation)
+            self.current_struct.n_bits += s.n_bits * _get_n_elements(s.array_dimensions)
 
             # Add to collection of struct definitions
             if s.type_name not in self.typedefs:
                 self.typedefs[s.type_name] = s
 
-    def finish(self) -> Optional[str]:
+    def detach(self) -> Optional[_StructBase]:
         s = self._struct_stack.pop()
         assert isinstance(s, _TypedefStruct)
         assert not self._struct_stack
@@ -227,9 +273,7 @@ class FlatStructGenerator(StructGenerator):
         if s.type_name not in self.typedefs:
             self.typedefs[s.type_name] = s
 
-        all_structs = [str(s) for s in self.typedefs.values()]
-
-        return "\n\n".join(all_structs)
+        return _TypedefList(list(self.typedefs.values()))
 
 
 class RDLFlatStructGenerator(FlatStructGenerator, RDLListener):
@@ -0,0 +1,42 @@
+import os
+from typing import Dict, Tuple, Optional
+
+import jinja2 as jj
+
+# Process-wide collection of Jinja environments
+_ENVIRONMENTS = {} # type: Dict[Tuple[str, Optional[str]], jj.Environment]
+
+def get_jinja_env(search_path: str, bytecode_cache_dir: Optional[str] = None) -> jj.Environment:
+    """
+    Get the shared Jinja environment that loads templates from ``search_path``.
+
+    Environments are created once per process so that templates are only
+    parsed and compiled once, regardless of how many exports are run.
+    Templates that are part of this package are also available using the
+    ``base:`` prefix.
+
+    If ``bytecode_cache_dir`` is set, compiled templates are also cached to
+    disk so that they can be re-used by subsequent processes.
+    """
+    key = (search_path, bytecode_cache_dir)
+    env = _ENVIRONMENTS.get(key)
+    if env is None:
+        loader = jj.ChoiceLoader([
+            jj.FileSystemLoader(search_path),
+            jj.PrefixLoader({
+                'base': jj.FileSystemLoader(os.path.dirname(__file__)),
+            }, delimiter=":")
+        ])
+
+        bytecode_cache = None # type: Optional[jj.BytecodeCache]
+        if bytecode_cache_dir is not None:
+            os.makedirs(bytecode_cache_dir, exist_ok=True)
+            bytecode_cache = jj.FileSystemBytecodeCache(bytecode_cache_dir)
+
+        env = jj.Environment(
+            loader=loader,
+            undefined=jj.StrictUndefined,
+            bytecode_cache=bytecode_cache,
+        )
+        _ENVIRONMENTS[key] = env
+    return env
@@ -1,8 +1,8 @@
 import re
-from typing import Match, Union, Optional
+from typing import Match, Union, Optional, Dict, Tuple, Any, List, Iterable, Iterator
 
 from systemrdl.rdltypes.references import PropertyReference
-from systemrdl.node import Node, AddrmapNode
+from systemrdl.node import Node, AddrmapNode, AddressableNode
 
 from .identifier_filter import kw_filter as kwf
 from .sv_int import SVInt
@@ -30,6 +30,97 @@ def get_indexed_path(top_node: Node, target_node: Node) -> str:
 
     return path
 
+
+class IndexedPathCache:
+    """
+    Memoized lookup of get_indexed_path() results for a single export.
+
+    The same node's path gets requested many times over by the various
+    generators, so compute it only once.
+    Nodes are not hashable, and node objects are re-created as the tree is
+    walked, so entries are keyed on the node's lineage of component instances.
+    Each entry stores the path with a placeholder for every array index, so
+    that all elements of an array share one entry. The node's known indexes,
+    or loop iterators for unknown ones, are filled in on each lookup.
+    """
+    def __init__(self, top_node: Node) -> None:
+        self.top_node = top_node
+        self._paths = {} # type: Dict[Tuple[Any, ...], str]
+
+        # Lookup statistics
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _get_key(node: Node) -> Tuple[Any, ...]:
+        key = []
+        current_node = node # type: Optional[Node]
+        while current_node is not None:
+            key.append(current_node.inst)
+            current_node = current_node.parent
+        return tuple(key)
+
+    def _get_indexes(self, node: Node) -> List[Optional[int]]:
+        """
+        Array indexes of the node's lineage below the top node, from top to
+        bottom. Unknown indexes are None
+        """
+        indexes = [] # type: List[Optional[int]]
+        current_node = node # type: Optional[Node]
+        while current_node is not None and current_node.inst is not self.top_node.inst:
+            if isinstance(current_node, AddressableNode) and current_node.array_dimensions:
+                current_idx = current_node.current_idx
+                if current_idx is None:
+                    indexes.extend([None] * len(current_node.array_dimensions))
+                else:
+                    indexes.extend(reversed(current_idx))
+            current_node = current_node.parent
+        indexes.reverse()
+        return indexes
+
+    def get_indexed_path(self, node: Node) -> str:
+        key = self._get_key(node)
+        path = self._paths.get(key)
+        if path is None:
+            self.misses += 1
+            # Replace known indexes with placeholders, same as unknown ones
+            path = re.sub(r'\[i?\d+\]', '[!]', get_indexed_path(self.top_node, node))
+            self._paths[key] = path
+        else:
+            self.hits += 1
+
+        indexes = iter(self._get_indexes(node))
+        n_unknown = 0
+        def repl(m: Match) -> str:
+            nonlocal n_unknown
+            idx = next(indexes)
+            if idx is None:
+                s = f'i{n_unknown}'
+                n_unknown += 1
+                return s
+            return str(idx)
+        return re.sub(r'!', repl, path)
+
+
+def indent_chunks(chunks: Iterable[str], width: int = 4) -> Iterator[str]:
+    """
+    Streaming equivalent of Jinja's ``indent`` filter.
+
+    Indents all lines except the first by ``width`` spaces as the chunks are
+    passed through. Empty lines are not indented.
+    """
+    prefix = " " * width
+    pending_newline = False
+    for chunk in chunks:
+        if not chunk:
+            continue
+        if pending_newline and chunk[0] != "\n":
+            chunk = prefix + chunk
+        chunk = re.sub(r'\n(?=[^\n])', "\n" + prefix, chunk)
+        pending_newline = chunk.endswith("\n")
+        yield chunk
+
+
 def clog2(n: int) -> int:
     return (n-1).bit_length()
 
@@ -39,6 +130,24 @@ def is_pow2(x: int) -> bool:
 def roundup_pow2(x: int) -> int:
     return 1<<(x-1).bit_length()
 
+def get_bit_runs(mask: int) -> List[Tuple[int, int]]:
+    """
+    Split a bit mask into its runs of contiguous set bits.
+    Returns a list of (high, low) bit positions, from LSB to MSB
+    """
+    runs = []
+    lo = 0
+    while mask >> lo:
+        if not (mask >> lo) & 1:
+            lo += 1
+            continue
+        hi = lo
+        while (mask >> (hi + 1)) & 1:
+            hi += 1
+        runs.append((hi, lo))
+        lo = hi + 1
+    return runs
+
 def ref_is_internal(top_node: AddrmapNode, ref: Union[Node, PropertyReference]) -> bool:
     """
     Determine whether the reference is internal to the top node.
@@ -0,0 +1,187 @@
+from typing import TYPE_CHECKING, Optional, List, Tuple, Dict, Type, Union, Set, Iterator
+
+from systemrdl.walker import RDLListener, WalkerAction
+from systemrdl.node import RootNode, AddressableNode, VectorNode
+from systemrdl.node import FieldNode, RegNode, RegfileNode, AddrmapNode, MemNode, SignalNode
+
+if TYPE_CHECKING:
+    from systemrdl.node import Node
+    from .forloop_generator import RDLForLoopGenerator, Body
+    from .struct_generator import RDLStructGenerator, RDLFlatStructGenerator, _StructBase
+    from .profiler import ExportProfiler
+
+# Type-specific callback name suffixes, checked in order
+_TYPE_CALLBACKS = (
+    (FieldNode, "Field"),
+    (RegNode, "Reg"),
+    (RegfileNode, "Regfile"),
+    (AddrmapNode, "Addrmap"),
+    (MemNode, "Mem"),
+    (SignalNode, "Signal"),
+)
+
+class RDLMultiWalker:
+    """
+    Walker that drives multiple listeners in a single traversal of the design.
+
+    Unlike RDLWalker, a WalkerAction returned by a listener only steers that
+    listener. A node's descendants are visited only if at least one of the
+    listeners did not request to skip them.
+    """
+    def __init__(self, unroll: bool=False, skip_not_present: bool=True):
+        self.unroll = unroll
+        self.skip_not_present = skip_not_present
+
+        self._callback_names = {} # type: Dict[Type[Node], Tuple[List[str], List[str]]]
+        self._stopped = set() # type: Set[int]
+
+    def walk(self, node: 'Node', *listeners: RDLListener, skip_top: bool=False) -> None:
+        self._stopped = set()
+        if skip_top or isinstance(node, RootNode):
+            for child in node.children(unroll=self.unroll, skip_not_present=self.skip_not_present):
+                self._walk(child, listeners)
+        else:
+            self._walk(node, listeners)
+
+    def _get_callback_names(self, node: 'Node') -> Tuple[List[str], List[str]]:
+        node_cls = type(node)
+        if node_cls not in self._callback_names:
+            names = ["Component"]
+            if isinstance(node, AddressableNode):
+                names.append("AddressableComponent")
+            elif isinstance(node, VectorNode):
+                names.append("VectorComponent")
+            for cls, name in _TYPE_CALLBACKS:
+                if isinstance(node, cls):
+                    names.append(name)
+                    break
+            self._callback_names[node_cls] = (
+                ["enter_" + name for name in names],
+                ["exit_" + name for name in reversed(names)],
+            )
+        return self._callback_names[node_cls]
+
+    @staticmethod
+    def _do_callbacks(node: 'Node', listener: RDLListener, cb_names: List[str]) -> WalkerAction:
+        action = WalkerAction.Continue
+        for cb_name in cb_names:
+            new_action = getattr(listener, cb_name)(node) or WalkerAction.Continue
+            action = max(action, new_action)
+            if action == WalkerAction.StopNow:
+                break
+        return action
+
+    def _walk(self, node: 'Node', listeners: Tuple[RDLListener, ...]) -> None:
+        enter_names, exit_names = self._get_callback_names(node)
+
+        entered = []
+        descend = []
+        for listener in listeners:
+            if id(listener) in self._stopped:
+                continue
+            action = self._do_callbacks(node, listener, enter_names)
+            if action == WalkerAction.StopNow:
+                self._stopped.add(id(listener))
+                continue
+            entered.append(listener)
+            if action != WalkerAction.SkipDescendants:
+                descend.append(listener)
+
+        if descend:
+            children_listeners = tuple(descend)
+            for child in node.children(unroll=self.unroll, skip_not_present=self.skip_not_present):
+                self._walk(child, children_listeners)
+
+        for listener in entered:
+            if id(listener) in self._stopped:
+                continue
+            action = self._do_callbacks(node, listener, exit_names)
+            if action == WalkerAction.StopNow:
+                self._stopped.add(id(listener))
+
+
+class GeneratorResult:
+    """
+    Content produced by a generator once its GeneratorPass has been run
+
+    The generated content is kept in its structured form and is only rendered
+    to text as it is written to the output, one chunk at a time. The full text
+    of a block is never held in memory unless it is requested as a string.
+    """
+    def __init__(self, name: str, profiler: Optional['ExportProfiler'] = None) -> None:
+        self.name = name
+        self.profiler = profiler
+        self.tree = None # type: Optional[Union[Body, _StructBase]]
+
+    @property
+    def is_empty(self) -> bool:
+        return self.tree is None
+
+    def iter_content(self) -> Iterator[str]:
+        """
+        Yield the generated text in chunks
+        """
+        if self.tree is None:
+            return iter(())
+        chunks = self.tree.iter_chunks()
+        if self.profiler is not None:
+            return self.profiler.record_section(self.name, chunks)
+        return chunks
+
+    @property
+    def content(self) -> Optional[str]:
+        if self.tree is None:
+            return None
+        return "".join(self.iter_content())
+
+    @property
+    def n_bits(self) -> int:
+        """
+        Total width of the generated struct, or 0 if no struct was generated
+        """
+        return getattr(self.tree, "n_bits", 0)
+
+
+class GeneratorPass:
+    """
+    Collects content generators so that all of them are run using a single
+    traversal of the design.
+    """
+    def __init__(self, top_node: 'AddrmapNode', profiler: Optional['ExportProfiler'] = None) -> None:
+        self.top_node = top_node
+        self.profiler = profiler
+        self._jobs = [] # type: List[Tuple[Union[RDLForLoopGenerator, RDLStructGenerator, RDLFlatStructGenerator], GeneratorResult]]
+
+    def _new_result(self, gen: RDLListener) -> GeneratorResult:
+        # Name results after their generator, so that they can be identified
+        # when profiling
+        name = type(gen).__name__
+        n_same = sum(1 for _, result in self._jobs if result.name.split("#")[0] == name)
+        if n_same:
+            name += f"#{n_same + 1}"
+        return GeneratorResult(name, self.profiler)
+
+    def add_content(self, gen: 'RDLForLoopGenerator') -> GeneratorResult:
+        gen.start()
+        result = self._new_result(gen)
+        self._jobs.append((gen, result))
+        return result
+
+    def add_struct(self, gen: Union['RDLStructGenerator', 'RDLFlatStructGenerator'], type_name: str) -> GeneratorResult:
+        gen.start(type_name)
+        result = self._new_result(gen)
+        self._jobs.append((gen, result))
+        return result
+
+    def run(self) -> None:
+        listeners = [] # type: List[RDLListener]
+        for gen, result in self._jobs:
+            if self.profiler is not None:
+                listeners.append(self.profiler.wrap_listener(gen, result.name))
+            else:
+                listeners.append(gen)
+        RDLMultiWalker().walk(self.top_node, *listeners, skip_top=True)
+
+        for gen, result in self._jobs:
+            result.tree = gen.detach()
+        self._jobs = []
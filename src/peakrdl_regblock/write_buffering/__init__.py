@@ -1,17 +1,20 @@
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Union, Iterator
 
 from systemrdl.node import AddrmapNode, RegNode, FieldNode, SignalNode
 
 from .storage_generator import WBufStorageStructGenerator
 from .implementation_generator import WBufLogicGenerator
-from ..utils import get_indexed_path
 from ..sv_int import SVInt
 
 if TYPE_CHECKING:
     from ..exporter import RegblockExporter
+    from ..walker import GeneratorPass, GeneratorResult
 
 
 class WriteBuffering:
+    _storage_struct: 'GeneratorResult'
+    _implementation: 'GeneratorResult'
+
     def __init__(self, exp:'RegblockExporter'):
         self.exp = exp
 
@@ -20,23 +23,30 @@ class WriteBuffering:
         return self.exp.ds.top_node
 
 
-    def get_storage_struct(self) -> str:
-        struct_gen = WBufStorageStructGenerator(self)
-        s = struct_gen.get_struct(self.top_node, "wbuf_storage_t")
-        assert s is not None
-        return s + "\nwbuf_storage_t wbuf_storage;"
+    def add_generators(self, gen_pass: 'GeneratorPass') -> None:
+        self._storage_struct = gen_pass.add_struct(WBufStorageStructGenerator(self), "wbuf_storage_t")
+        self._implementation = gen_pass.add_content(WBufLogicGenerator(self))
+
+    def get_storage_struct(self) -> Iterator[str]:
+        assert not self._storage_struct.is_empty
+        yield from self._storage_struct.iter_content()
+        yield "\nwbuf_storage_t wbuf_storage;"
+
+    def get_storage_n_bits(self) -> int:
+        """
+        Number of flops of the storage struct
+        """
+        return self._storage_struct.n_bits
 
 
-    def get_implementation(self) -> str:
-        gen = WBufLogicGenerator(self)
-        s = gen.get_content(self.top_node)
-        assert s is not None
-        return s
+    def get_implementation(self) -> Iterator[str]:
+        assert not self._implementation.is_empty
+        return self._implementation.iter_content()
 
     def get_wbuf_prefix(self, node: Union[RegNode, FieldNode]) -> str:
         if isinstance(node, FieldNode):
             node = node.parent
-        wbuf_prefix = "wbuf_storage." + get_indexed_path(self.top_node, node)
+        wbuf_prefix = "wbuf_storage." + self.exp.ds.indexed_paths.get_indexed_path(node)
         return wbuf_prefix
 
     def get_write_strobe(self, node: Union[RegNode, FieldNode]) -> str:
@@ -51,13 +61,10 @@ class WriteBuffering:
             # trigger when uppermost address of the register is written
             regwidth = trigger.get_property('regwidth')
             accesswidth = trigger.get_property('accesswidth')
-            strb_prefix = self.exp.dereferencer.get_access_strobe(trigger, reduce_substrobes=False)
-
             if accesswidth < regwidth:
                 n_subwords = regwidth // accesswidth
-                return f"{strb_prefix}[{n_subwords-1}] && decoded_req_is_wr"
-            else:
-                return f"{strb_prefix} && decoded_req_is_wr"
+                return self.exp.dereferencer.get_write_strobe(trigger, subword_index=n_subwords-1)
+            return self.exp.dereferencer.get_write_strobe(trigger)
         elif isinstance(trigger, SignalNode):
             s = self.exp.dereferencer.get_value(trigger)
             if trigger.get_property('activehigh'):
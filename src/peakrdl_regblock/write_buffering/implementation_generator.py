@@ -32,20 +32,19 @@ class WBufLogicGenerator(RDLForLoopGenerator):
 
         regwidth = node.get_property('regwidth')
         accesswidth = node.get_property('accesswidth')
-        strb_prefix = self.exp.dereferencer.get_access_strobe(node, reduce_substrobes=False)
         Segment = namedtuple("Segment", ["strobe", "bslice"])
         segments = []
         if accesswidth < regwidth:
             n_subwords = regwidth // accesswidth
             for i in range(n_subwords):
-                strobe = strb_prefix + f"[{i}]"
+                strobe = self.exp.dereferencer.get_write_strobe(node, subword_index=i)
                 if node.is_msb0_order:
                     bslice = f"[{regwidth - (accesswidth * i) - 1}: {regwidth - (accesswidth * (i+1))}]"
                 else:
                     bslice = f"[{(accesswidth * (i + 1)) - 1}:{accesswidth * i}]"
                 segments.append(Segment(strobe, bslice))
         else:
-            segments.append(Segment(strb_prefix, ""))
+            segments.append(Segment(self.exp.dereferencer.get_write_strobe(node), ""))
 
         trigger = node.get_property('wbuffer_trigger')
         is_own_trigger = (isinstance(trigger, RegNode) and trigger == node)
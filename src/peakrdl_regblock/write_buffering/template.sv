@@ -13,7 +13,7 @@ always_ff {{get_always_ff_event(cpuif.reset)}} begin
             {{wbuf_prefix}}.biten <= '0;
         end
         {%- for segment in segments %}
-        if({{segment.strobe}} && decoded_req_is_wr) begin
+        if({{segment.strobe}}) begin
             {{wbuf_prefix}}.pending <= '1;
             {%- if node.is_msb0_order %}
             {{wbuf_prefix}}.data{{segment.bslice}} <= ({{wbuf_prefix}}.data{{segment.bslice}} & ~decoded_wr_biten_bswap) | (decoded_wr_data_bswap & decoded_wr_biten_bswap);
@@ -0,0 +1,118 @@
+"""
+Generators of synthetic SystemRDL designs that are used to measure how the
+exporter scales with the size and shape of a design.
+
+Each generator returns the RDL source text of a single top-level addrmap named
+``top``.
+"""
+from typing import List
+
+
+def flat_regs(n_regs: int) -> str:
+    """
+    Many registers in a single flat address space
+    """
+    lines = ["addrmap top {"]
+    for i in range(n_regs):
+        lines.append(
+            f"    reg {{ field {{sw=rw; hw=r;}} a[16] = {i & 0xFFFF}; "
+            f"field {{sw=r; hw=w;}} b[16]; }} r{i};"
+        )
+    lines.append("};")
+    return "\n".join(lines) + "\n"
+
+
+def nested_regfile_arrays(depth: int, dim: int, n_regs: int) -> str:
+    """
+    Deeply nested regfile arrays, each level being an array of ``dim`` elements
+    """
+    lines = []
+    lines.append("regfile rf0_t {")
+    for i in range(n_regs):
+        lines.append(
+            f"    reg {{ field {{sw=rw; hw=r;}} a[8] = 0; field {{sw=rw; hw=rw; we;}} b[8] = 0; }} r{i};"
+        )
+    lines.append("};")
+    for level in range(1, depth):
+        lines.append(f"regfile rf{level}_t {{ rf{level-1}_t sub[{dim}]; }};")
+    lines.append(f"addrmap top {{ rf{depth-1}_t sub[{dim}]; }};")
+    return "\n".join(lines) + "\n"
+
+
+def wide_regs(n_regs: int, regwidth: int, accesswidth: int) -> str:
+    """
+    Registers that are wider than the CPU interface's data bus
+    """
+    n_fields = regwidth // 16
+    lines = ["addrmap top {"]
+    for i in range(n_regs):
+        fields = [] # type: List[str]
+        for j in range(n_fields):
+            if j % 2:
+                fields.append(f"field {{sw=rw; hw=r;}} f{j}[16] = 0;")
+            else:
+                fields.append(f"field {{sw=r; hw=w;}} f{j}[16];")
+        lines.append(
+            f"    reg {{ regwidth = {regwidth}; accesswidth = {accesswidth}; "
+            + " ".join(fields)
+            + f" }} r{i};"
+        )
+    lines.append("};")
+    return "\n".join(lines) + "\n"
+
+
+def external_blocks(n_blocks: int) -> str:
+    """
+    Many external regfiles, mems and registers
+    """
+    lines = ["addrmap top {"]
+    lines.append("    reg ext_reg_t { field {sw=rw; hw=r;} x[32] = 0; };")
+    lines.append("    regfile ext_rf_t { ext_reg_t a; ext_reg_t b; ext_reg_t c[2]; };")
+    lines.append("    mem ext_mem_t { mementries = 64; memwidth = 32; };")
+    for i in range(n_blocks):
+        lines.append(f"    external ext_rf_t rf{i};")
+        lines.append(f"    external ext_mem_t mem{i};")
+        lines.append(f"    external ext_reg_t reg{i};")
+    lines.append("};")
+    return "\n".join(lines) + "\n"
+
+
+def counters_and_interrupts(n_regs: int) -> str:
+    """
+    Counters with thresholds and saturation, and sticky interrupts with
+    enables
+    """
+    lines = ["addrmap top {"]
+    for i in range(n_regs):
+        lines.append(
+            f"    reg {{ field {{sw=r; hw=na; counter; incrthreshold = 100; incrsaturate = 200;}} count_up[8] = 0; "
+            f"field {{sw=r; hw=na; counter; decrvalue = 2; decrsaturate = 4;}} count_down[8] = 0xFF; }} cnt{i};"
+        )
+        lines.append(
+            f"    reg {{ field {{sw=rw; hw=r;}} en[8] = 0; }} intr_en{i};"
+        )
+        lines.append(
+            f"    reg {{ field {{sw=rw; hw=w; intr; woclr;}} status[8] = 0; }} intr{i};"
+        )
+        lines.append(f"    intr{i}.status->enable = intr_en{i}.en;")
+        lines.append(f"    cnt{i}.count_up->incr = intr{i}->intr;")
+    lines.append("};")
+    return "\n".join(lines) + "\n"
+
+
+def buffered_regs(n_regs: int) -> str:
+    """
+    Wide registers that use write and read buffering
+    """
+    lines = ["addrmap top {"]
+    for i in range(n_regs):
+        lines.append(
+            f"    reg {{ regwidth = 64; accesswidth = 32; buffer_writes; "
+            f"field {{sw=rw; hw=r;}} a[64] = 0; }} wbuf{i};"
+        )
+        lines.append(
+            f"    reg {{ regwidth = 64; accesswidth = 32; buffer_reads; "
+            f"field {{sw=r; hw=w;}} a[64]; }} rbuf{i};"
+        )
+    lines.append("};")
+    return "\n".join(lines) + "\n"
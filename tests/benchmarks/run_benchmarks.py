@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Measures the time, memory and output size of exporting several synthetic
+designs, and compares the results against a stored baseline.
+
+Exits with a non-zero status if any benchmark regressed past the baseline by
+more than the allowed tolerance. Only the metrics that do not depend on the
+host are compared by default. Export time is also compared with --check-time,
+which is only meaningful against a baseline recorded on the same machine.
+"""
+from typing import Callable, Dict, Any, List
+import os
+import sys
+import gc
+import json
+import time
+import argparse
+import tempfile
+import tracemalloc
+
+from systemrdl import RDLCompiler
+from systemrdl.node import RootNode
+
+from peakrdl_regblock import RegblockExporter
+from peakrdl_regblock.udps import ALL_UDPS
+
+import rdl_generators
+
+THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(THIS_DIR, "baseline.json")
+UDP_FILE = os.path.join(THIS_DIR, "../../hdl-src/regblock_udps.rdl")
+
+BENCHMARKS = {
+    "flat_regs": lambda: rdl_generators.flat_regs(1000),
+    "nested_regfile_arrays": lambda: rdl_generators.nested_regfile_arrays(depth=5, dim=4, n_regs=8),
+    "wide_regs": lambda: rdl_generators.wide_regs(128, regwidth=256, accesswidth=32),
+    "external_blocks": lambda: rdl_generators.external_blocks(100),
+    "counters_and_interrupts": lambda: rdl_generators.counters_and_interrupts(100),
+    "buffered_regs": lambda: rdl_generators.buffered_regs(100),
+} # type: Dict[str, Callable[[], str]]
+
+# Metrics that are compared against the baseline
+METRICS = ("peak_memory", "output_bytes", "output_lines")
+
+# Metrics that depend on the host, and are only compared if requested
+TIMING_METRICS = ("export_time",)
+
+
+def compile_rdl(rdl_src: str, work_dir: str) -> RootNode:
+    path = os.path.join(work_dir, "top.rdl")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(rdl_src)
+
+    rdlc = RDLCompiler()
+    for udp in ALL_UDPS:
+        rdlc.register_udp(udp)
+    rdlc.compile_file(UDP_FILE)
+    rdlc.compile_file(path)
+    return rdlc.elaborate()
+
+
+def get_output_size(output_dir: str) -> Dict[str, int]:
+    n_bytes = 0
+    n_lines = 0
+    for filename in os.listdir(output_dir):
+        with open(os.path.join(output_dir, filename), "rb") as f:
+            contents = f.read()
+        n_bytes += len(contents)
+        n_lines += contents.count(b"\n")
+    return {"output_bytes": n_bytes, "output_lines": n_lines}
+
+
+def run_benchmark(name: str, repeat: int) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as work_dir:
+        root = compile_rdl(BENCHMARKS[name](), work_dir)
+        output_dir = os.path.join(work_dir, "out")
+
+        # Time is the best of several runs to reduce noise
+        times = []
+        for _ in range(repeat):
+            gc.collect()
+            t_start = time.perf_counter()
+            RegblockExporter().export(root, output_dir)
+            times.append(time.perf_counter() - t_start)
+
+        # Memory is measured in a separate run since tracing slows it down
+        gc.collect()
+        tracemalloc.start()
+        RegblockExporter().export(root, output_dir)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+        result = {
+            "export_time": min(times),
+            "peak_memory": peak_memory,
+        }
+        result.update(get_output_size(output_dir))
+    return result
+
+
+def compare(name: str, result: Dict[str, Any], baseline: Dict[str, Any], tolerance: float, check_time: bool = False) -> List[str]:
+    """
+    Returns a list of regressions of this benchmark compared to its baseline
+    """
+    metrics = METRICS + TIMING_METRICS if check_time else METRICS
+    regressions = []
+    for metric in metrics:
+        if metric not in baseline:
+            continue
+        limit = baseline[metric] * (1 + tolerance)
+        if result[metric] > limit:
+            regressions.append(
+                f"{name}: {metric} regressed from {baseline[metric]:.6g} to {result[metric]:.6g}"
+                f" (limit: {limit:.6g})"
+            )
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "benchmarks", nargs="*", metavar="NAME",
+        help="Benchmarks to run. Runs all if unspecified. Choose from: " + ", ".join(BENCHMARKS.keys())
+    )
+    parser.add_argument(
+        "--baseline", default=DEFAULT_BASELINE,
+        help="Path to the baseline results file [%(default)s]"
+    )
+    parser.add_argument(
+        "--update-baseline", action="store_true", default=False,
+        help="Store the results as the new baseline instead of comparing against it"
+    )
+    parser.add_argument(
+        "--tolerance", type=float, default=0.5,
+        help="Allowed fractional increase of each metric over its baseline [%(default)s]"
+    )
+    parser.add_argument(
+        "--check-time", action="store_true", default=False,
+        help="Also compare the export time against the baseline. Only use this if the baseline was recorded on the same machine"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3,
+        help="Number of timed exports per benchmark [%(default)s]"
+    )
+    parser.add_argument(
+        "--json", metavar="PATH", default=None,
+        help="Also write the results to a JSON file"
+    )
+    args = parser.parse_args()
+
+    names = args.benchmarks or list(BENCHMARKS.keys())
+    for name in names:
+        if name not in BENCHMARKS:
+            parser.error(f"unknown benchmark '{name}'")
+
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    else:
+        baseline = {}
+
+    results = {}
+    regressions = []
+    print(f"{'Benchmark':<28} {'Time (s)':>10} {'Peak (MiB)':>12} {'Bytes':>12} {'Lines':>10}")
+    for name in names:
+        result = run_benchmark(name, args.repeat)
+        results[name] = result
+        print(
+            f"{name:<28} {result['export_time']:>10.3f} {result['peak_memory'] / (1024 * 1024):>12.1f}"
+            f" {result['output_bytes']:>12} {result['output_lines']:>10}"
+        )
+        if name in baseline and not args.update_baseline:
+            regressions.extend(compare(name, result, baseline[name], args.tolerance, args.check_time))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+            f.write("\n")
+
+    if args.update_baseline:
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=4, sort_keys=True)
+            f.write("\n")
+        print(f"Updated baseline: {args.baseline}")
+        return 0
+
+    if regressions:
+        print()
+        print("Regressions:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -34,13 +34,23 @@ class BaseTestCase(unittest.TestCase):
 
     # Other exporter args:
     retime_read_fanin = False
+    read_fanin_stages = None # type: Optional[int]
+    max_read_fanin = None # type: Optional[int]
     retime_read_response = False
+    retime_decode = False
     reuse_hwif_typedefs = True
     retime_external = False
     default_reset_activelow = False
     default_reset_async = False
     err_if_bad_addr = False
     err_if_bad_rw = False
+    hier_addr_decode = False
+    minimize_addr_decode = False
+    packed_decode_strobes = False
+    unique_case_decode = False
+    and_or_readback = False
+    indexed_array_readback = False
+    dual_issue = False
 
     #: this gets auto-loaded via the _load_request autouse fixture
     request = None # type: pytest.FixtureRequest
@@ -112,7 +122,10 @@ class BaseTestCase(unittest.TestCase):
             package_name="regblock_pkg",
             cpuif_cls=self.cpuif.cpuif_cls,
             retime_read_fanin=self.retime_read_fanin,
+            read_fanin_stages=self.read_fanin_stages,
+            max_read_fanin=self.max_read_fanin,
             retime_read_response=self.retime_read_response,
+            retime_decode=self.retime_decode,
             reuse_hwif_typedefs=self.reuse_hwif_typedefs,
             retime_external_reg=self.retime_external,
             retime_external_regfile=self.retime_external,
@@ -122,6 +135,13 @@ class BaseTestCase(unittest.TestCase):
             default_reset_async=self.default_reset_async,
             err_if_bad_addr=self.err_if_bad_addr,
             err_if_bad_rw=self.err_if_bad_rw,
+            hier_addr_decode=self.hier_addr_decode,
+            minimize_addr_decode=self.minimize_addr_decode,
+            packed_decode_strobes=self.packed_decode_strobes,
+            unique_case_decode=self.unique_case_decode,
+            and_or_readback=self.and_or_readback,
+            indexed_array_readback=self.indexed_array_readback,
+            dual_issue=self.dual_issue,
         )
 
     def delete_run_dir(self) -> None:
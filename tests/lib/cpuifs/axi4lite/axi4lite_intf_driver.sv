@@ -77,6 +77,10 @@ interface axi4lite_intf_driver #(
         input RRESP;
     endclocking
 
+    // Randomly delay AW/W transfers and deassert RREADY/BREADY.
+    // Can be cleared by testbenches that check the exact timing of transfers
+    bit randomize_delays = 1'b1;
+
     task automatic reset();
         cb.AWVALID <= '0;
         cb.AWADDR <= '0;
@@ -90,8 +94,8 @@ interface axi4lite_intf_driver #(
     endtask
 
     initial forever begin
-        cb.RREADY <= $urandom_range(1, 0);
-        cb.BREADY <= $urandom_range(1, 0);
+        cb.RREADY <= randomize_delays ? $urandom_range(1, 0) : 1'b1;
+        cb.BREADY <= randomize_delays ? $urandom_range(1, 0) : 1'b1;
         @cb;
     end
 
@@ -119,7 +123,7 @@ interface axi4lite_intf_driver #(
         write_request_t req;
         aw_mbx.get(req);
         ##0;
-        repeat($urandom_range(2,0)) @cb;
+        if(randomize_delays) repeat($urandom_range(2,0)) @cb;
         cb.AWVALID <= '1;
         cb.AWADDR <= req.addr;
         cb.AWPROT <= '0;
@@ -133,7 +137,7 @@ interface axi4lite_intf_driver #(
         write_request_t req;
         w_mbx.get(req);
         ##0;
-        repeat($urandom_range(2,0)) @cb;
+        if(randomize_delays) repeat($urandom_range(2,0)) @cb;
         cb.WVALID <= '1;
         cb.WDATA <= req.data;
         cb.WSTRB <= req.strb;
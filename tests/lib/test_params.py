@@ -18,3 +18,15 @@ def get_permutation_class_name(cls, num: int, params: dict) -> str:
         class_name += f"_{val_str}"
 
     return class_name
+
+
+def get_option_class_name(cls, num: int, params: dict) -> str:
+    class_name = cls.__name__
+
+    for key, val in params.items():
+        if val is True:
+            class_name += f"_{key}"
+        else:
+            class_name += f"_{key}_{val}"
+
+    return class_name
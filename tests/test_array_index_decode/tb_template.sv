@@ -0,0 +1,75 @@
+{% extends "lib/tb_base.sv" %}
+
+{% block seq %}
+    {% sv_line_anchor %}
+    logic bad_addr_err;
+    logic [31:0] unmapped[$];
+
+{%- if testcase.err_if_bad_addr %}
+    bad_addr_err = 1'b1;
+{%- else %}
+    bad_addr_err = 1'b0;
+{%- endif %}
+
+    // Addresses past the end of an array or between its elements
+    unmapped = '{'h14, 'h18, 'h1C, 'h44, 'h48, 'h4C, 'h70, 'h98, 'h9C, 'h130, 'h13C, 'h21C};
+
+    ##1;
+    cb.rst <= '0;
+    ##1;
+
+    // Fill every element with a distinct value
+    for(int i=0; i<5; i++) cpuif.write('h0 + i*4, 'hA000 + i);
+    cpuif.write('h20, 'hA0FF);
+    for(int i=0; i<3; i++) cpuif.write('h40 + i*'h10, 'hB000 + i);
+    for(int i=0; i<2; i++) begin
+        for(int j=0; j<3; j++) cpuif.write('h80 + (i*3 + j)*4, 'hC000 + i*'h10 + j);
+    end
+    for(int i=0; i<3; i++) begin
+        for(int j=0; j<3; j++) cpuif.write('h100 + i*'h10 + j*4, 'hD000 + i*'h10 + j);
+        cpuif.write('h100 + i*'h10 + 'hC, 'hD0F0 + i);
+    end
+    for(int i=0; i<3; i++) begin
+        cpuif.write('h200 + i*8, 'hE000 + i);
+        cpuif.write('h200 + i*8 + 4, 'hE100 + i);
+    end
+    cpuif.write('h218, 'hE0FF);
+
+    // Out-of-range accesses must not alias onto any element
+    foreach(unmapped[k]) cpuif.write(unmapped[k], 'hFFFF_FFFF, .expects_err(bad_addr_err));
+    foreach(unmapped[k]) cpuif.assert_read(unmapped[k], 0, .expects_err(bad_addr_err));
+
+    @cb;
+    for(int i=0; i<5; i++) assert(cb.hwif_out.arr_a[i].f.value == 'hA000 + i);
+    assert(cb.hwif_out.after_a.f.value == 'hA0FF);
+    for(int i=0; i<3; i++) assert(cb.hwif_out.arr_b[i].f.value == 'hB000 + i);
+    for(int i=0; i<2; i++) begin
+        for(int j=0; j<3; j++) assert(cb.hwif_out.arr_c[i][j].f.value == 'hC000 + i*'h10 + j);
+    end
+    for(int i=0; i<3; i++) begin
+        for(int j=0; j<3; j++) assert(cb.hwif_out.rf[i].x[j].f.value == 'hD000 + i*'h10 + j);
+        assert(cb.hwif_out.rf[i].y.f.value == 'hD0F0 + i);
+    end
+    for(int i=0; i<3; i++) begin
+        assert(cb.hwif_out.arr_w[i].lo.value == 'hE000 + i);
+        assert(cb.hwif_out.arr_w[i].hi.value == 'hE100 + i);
+    end
+    assert(cb.hwif_out.after_w.f.value == 'hE0FF);
+
+    // Read back through the decoder
+    for(int i=0; i<5; i++) cpuif.assert_read('h0 + i*4, 'hA000 + i);
+    cpuif.assert_read('h20, 'hA0FF);
+    for(int i=0; i<3; i++) cpuif.assert_read('h40 + i*'h10, 'hB000 + i);
+    for(int i=0; i<2; i++) begin
+        for(int j=0; j<3; j++) cpuif.assert_read('h80 + (i*3 + j)*4, 'hC000 + i*'h10 + j);
+    end
+    for(int i=0; i<3; i++) begin
+        for(int j=0; j<3; j++) cpuif.assert_read('h100 + i*'h10 + j*4, 'hD000 + i*'h10 + j);
+        cpuif.assert_read('h100 + i*'h10 + 'hC, 'hD0F0 + i);
+    end
+    for(int i=0; i<3; i++) begin
+        cpuif.assert_read('h200 + i*8, 'hE000 + i);
+        cpuif.assert_read('h200 + i*8 + 4, 'hE100 + i);
+    end
+    cpuif.assert_read('h218, 'hE0FF);
+{% endblock %}
@@ -0,0 +1,16 @@
+from parameterized import parameterized_class
+
+from ..lib.sim_testcase import SimTestCase
+from ..lib.test_params import get_permutation_class_name, get_permutations
+
+
+@parameterized_class(
+    get_permutations({
+        "err_if_bad_addr": [True, False],
+        "hier_addr_decode": [True, False],
+    }),
+    class_name_func=get_permutation_class_name
+)
+class Test(SimTestCase):
+    def test_dut(self):
+        self.run_test()
@@ -0,0 +1,144 @@
+import os
+import sys
+import shutil
+import unittest
+import subprocess
+import multiprocessing
+from typing import List
+
+from systemrdl import RDLCompiler
+
+from peakrdl_regblock import RegblockExporter, RegblockBatchExporter, ExportJob, BatchExportError
+from peakrdl_regblock.cpuif.apb4 import APB4_Cpuif
+from peakrdl_regblock.cpuif.axi4lite import AXI4Lite_Cpuif
+from peakrdl_regblock.udps import ALL_UDPS
+
+from ..lib.base_testcase import BaseTestCase
+
+class CrashingCpuif(APB4_Cpuif):
+    """
+    Kills the worker process that tries to use it
+    """
+    def __init__(self, exp) -> None: # pylint: disable=super-init-not-called
+        os._exit(1)
+
+class TestBatchExport(BaseTestCase):
+    def setUp(self) -> None:
+        # Stub usual pre-test setup
+        pass
+
+    def elaborate(self, top_names: List[str]) -> list:
+        rdlc = RDLCompiler()
+        for udp in ALL_UDPS:
+            rdlc.register_udp(udp)
+        rdlc.compile_file(os.path.join(self.get_testcase_dir(), "regblock.rdl"))
+        return [rdlc.elaborate(name).top for name in top_names]
+
+    def read(self, path: str) -> str:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read()
+
+    def test_matches_single_export(self) -> None:
+        block_a, block_b = self.elaborate(["block_a", "block_b"])
+        run_dir = self.get_run_dir()
+        jobs = [
+            ExportJob(block_a, os.path.join(run_dir, "batch", "a")),
+            ExportJob(block_a, os.path.join(run_dir, "batch", "a_axi"), cpuif_cls=AXI4Lite_Cpuif),
+            ExportJob(block_b, os.path.join(run_dir, "batch", "b")),
+        ]
+        RegblockBatchExporter(max_workers=2).export(jobs)
+
+        for job in jobs:
+            ref_dir = os.path.join(run_dir, "ref", os.path.basename(job.output_dir))
+            RegblockExporter().export(job.node, ref_dir, **job.kwargs)
+            for filename in sorted(os.listdir(ref_dir)):
+                self.assertEqual(
+                    self.read(os.path.join(job.output_dir, filename)),
+                    self.read(os.path.join(ref_dir, filename)),
+                )
+
+    def test_aggregated_errors(self) -> None:
+        block_a, block_b = self.elaborate(["block_a", "block_b"])
+        run_dir = os.path.join(self.get_run_dir(), "errors")
+        jobs = [
+            ExportJob(block_a, os.path.join(run_dir, "a"), not_an_option=1),
+            ExportJob(block_b, os.path.join(run_dir, "b")),
+            ExportJob(block_b, os.path.join(run_dir, "b2"), address_width="bad"),
+        ]
+        for max_workers in (1, 2):
+            shutil.rmtree(run_dir, ignore_errors=True)
+            with self.assertRaises(BatchExportError) as cm:
+                RegblockBatchExporter(max_workers=max_workers).export(jobs)
+
+            # Other jobs still completed
+            self.assertTrue(os.path.exists(os.path.join(run_dir, "b", "block_b.sv")))
+
+            # Failures are reported in job order
+            failed = [job for job, _ in cm.exception.failures]
+            self.assertEqual(failed, [jobs[0], jobs[2]])
+            self.assertIn("not_an_option", cm.exception.failures[0][1])
+
+    @unittest.skipUnless("fork" in multiprocessing.get_all_start_methods(), "Requires forked worker processes")
+    def test_worker_crash(self) -> None:
+        block_a, block_b = self.elaborate(["block_a", "block_b"])
+        run_dir = os.path.join(self.get_run_dir(), "crash")
+        jobs = [
+            ExportJob(block_a, os.path.join(run_dir, "a"), cpuif_cls=CrashingCpuif),
+            ExportJob(block_b, os.path.join(run_dir, "b")),
+            ExportJob(block_a, os.path.join(run_dir, "a_axi"), cpuif_cls=AXI4Lite_Cpuif),
+        ]
+        with self.assertRaises(BatchExportError) as cm:
+            RegblockBatchExporter(max_workers=2).export(jobs)
+
+        # Only the job that killed its worker failed
+        failed = [job for job, _ in cm.exception.failures]
+        self.assertEqual(failed, [jobs[0]])
+        self.assertTrue(os.path.exists(os.path.join(run_dir, "b", "block_b.sv")))
+        self.assertTrue(os.path.exists(os.path.join(run_dir, "a_axi", "block_a.sv")))
+
+    def test_duplicate_outputs(self) -> None:
+        block_a, = self.elaborate(["block_a"])
+        run_dir = self.get_run_dir()
+        jobs = [
+            ExportJob(block_a, os.path.join(run_dir, "dup")),
+            ExportJob(block_a, os.path.join(run_dir, "dup"), cpuif_cls=AXI4Lite_Cpuif),
+        ]
+        with self.assertRaises(ValueError):
+            RegblockBatchExporter().export(jobs)
+
+        # Different modules that share a package
+        jobs = [
+            ExportJob(block_a, os.path.join(run_dir, "dup"), module_name="x", package_name="common_pkg"),
+            ExportJob(block_a, os.path.join(run_dir, "dup"), module_name="y", package_name="common_pkg"),
+        ]
+        with self.assertRaises(ValueError):
+            RegblockBatchExporter().export(jobs)
+
+    def test_cli(self) -> None:
+        try:
+            import peakrdl # pylint: disable=import-outside-toplevel,unused-import
+        except ImportError:
+            self.skipTest("Requires peakrdl-cli")
+
+        run_dir = os.path.join(self.get_run_dir(), "cli")
+        os.makedirs(run_dir, exist_ok=True)
+        batch_file = os.path.join(run_dir, "jobs.txt")
+        with open(batch_file, "w", encoding="utf-8") as f:
+            f.write("# path output options\n")
+            f.write("soc.a a --cpuif axi4-lite\n")
+            f.write("soc.b0 b0 --module-name b0_regs\n")
+            f.write("soc.b1 b1\n")
+        subprocess.run(
+            [
+                sys.executable, "-m", "peakrdl", "regblock",
+                os.path.join(self.get_testcase_dir(), "regblock.rdl"),
+                "--top", "soc",
+                "-o", run_dir,
+                "--batch", batch_file,
+                "--cpuif", "apb4",
+            ],
+            check=True,
+        )
+        self.assertIn("axi4lite", self.read(os.path.join(run_dir, "a", "a.sv")))
+        self.assertIn("apb4", self.read(os.path.join(run_dir, "b0", "b0_regs.sv")))
+        self.assertIn("apb4", self.read(os.path.join(run_dir, "b1", "b1.sv")))
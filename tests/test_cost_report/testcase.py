@@ -0,0 +1,101 @@
+import os
+import json
+from unittest import mock
+
+from systemrdl import RDLCompiler
+
+from peakrdl_regblock import RegblockExporter
+from peakrdl_regblock.cpuif.axi4lite import AXI4Lite_Cpuif
+from peakrdl_regblock.udps import ALL_UDPS
+
+from ..lib.base_testcase import BaseTestCase
+
+class TestCostReport(BaseTestCase):
+    def setUp(self) -> None:
+        # Start with an empty run dir
+        self.delete_run_dir()
+
+    def export(self, rdl_file: str, **kwargs) -> dict:
+        rdlc = RDLCompiler()
+        for udp in ALL_UDPS:
+            rdlc.register_udp(udp)
+        rdlc.compile_file(os.path.join(self.get_testcase_dir(), "../../hdl-src/regblock_udps.rdl"))
+        rdlc.compile_file(os.path.join(self.get_testcase_dir(), rdl_file))
+        root = rdlc.elaborate()
+        RegblockExporter().export(
+            root, self.get_run_dir(),
+            module_name="regblock",
+            generate_cost_report=True,
+            **kwargs
+        )
+        with open(os.path.join(self.get_run_dir(), "regblock_cost.json"), "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def test_external(self) -> None:
+        report = self.export("../test_external/regblock.rdl")
+        self.assertEqual(report["module_name"], "regblock")
+        self.assertEqual(report["data_width"], 32)
+        self.assertGreater(report["decode"]["n_strobes"], 0)
+        self.assertGreater(report["decode"]["comparators"]["count"], 0)
+        self.assertEqual(report["external_blocks"], 3)
+        self.assertGreater(report["external_regs"], 0)
+        self.assertEqual(len(report["readback"]["inputs_per_bit"]), 32)
+        self.assertEqual(len(report["readback"]["stages"]), 1)
+
+    def test_large_fanin(self) -> None:
+        report = self.export("regblock.rdl")
+        self.assertEqual(report["readback"]["n_inputs"], 128)
+        self.assertEqual(report["readback"]["inputs_per_bit"][:9], [128] * 8 + [0])
+        self.assertEqual(report["readback"]["or_tree_depth"], 7)
+        self.assertEqual(report["flops"]["field_storage"], 128 * 8)
+        self.assertEqual(report["flops"]["total"], 128 * 8)
+        options = [r["option"] for r in report["recommendations"]]
+        self.assertIn("retime_read_fanin", options)
+
+    def test_retimed_fanin(self) -> None:
+        report = self.export("regblock.rdl", retime_read_fanin=True)
+        stages = report["readback"]["stages"]
+        self.assertEqual([stage["name"] for stage in stages], ["fanin", "bin_select"])
+        self.assertLess(stages[0]["max_inputs_per_bit"], 128)
+        options = [r["option"] for r in report["recommendations"]]
+        self.assertNotIn("retime_read_fanin", options)
+
+    def test_multi_stage_fanin(self) -> None:
+        report = self.export("regblock.rdl", read_fanin_stages=2)
+        self.assertEqual(report["options"]["read_fanin_stages"], 2)
+        stages = report["readback"]["stages"]
+        self.assertEqual([stage["name"] for stage in stages], ["fanin", "bin_reduce", "bin_select"])
+
+    def test_indexed_array_readback(self) -> None:
+        report = self.export("regblock.rdl")
+        self.assertEqual(report["readback"]["comparators"]["count"], 128)
+        report = self.export("regblock.rdl", indexed_array_readback=True)
+        self.assertEqual(report["options"]["indexed_array_readback"], True)
+        self.assertEqual(report["readback"]["comparators"]["count"], 1)
+        self.assertEqual(report["readback"]["n_inputs"], 128)
+
+    def test_indexed_array_readback_ignored(self) -> None:
+        for option in ("retime_read_fanin", "and_or_readback"):
+            with self.subTest(option), mock.patch("systemrdl.messages.MessageHandler.warning") as warning:
+                self.export("regblock.rdl", indexed_array_readback=True, **{option: True})
+            messages = [call.args[0] for call in warning.call_args_list]
+            self.assertIn(
+                f"Option indexed_array_readback has no effect when combined with {option}.",
+                messages
+            )
+
+    def test_retimed_external_blocks(self) -> None:
+        report = self.export("../test_external/regblock.rdl")
+        self.assertIn(str(report["addr_width"]), report["readback"]["comparators"]["by_width"])
+        # Blocks are selected by their held decode strobes instead of comparing
+        # their address range
+        report = self.export("../test_external/regblock.rdl", retime_read_fanin=True)
+        self.assertNotIn(str(report["addr_width"]), report["readback"]["comparators"]["by_width"])
+
+    def test_dual_issue(self) -> None:
+        report = self.export("regblock.rdl", cpuif_cls=AXI4Lite_Cpuif)
+        n_comparators = report["decode"]["comparators"]["count"]
+        # Read and write channels each decode their own address
+        report = self.export("regblock.rdl", cpuif_cls=AXI4Lite_Cpuif, dual_issue=True)
+        self.assertEqual(report["options"]["dual_issue"], True)
+        self.assertEqual(report["decode"]["comparators"]["count"], 2 * n_comparators)
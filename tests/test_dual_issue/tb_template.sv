@@ -0,0 +1,95 @@
+{% extends "lib/tb_base.sv" %}
+
+{%- block declarations %}
+    {% sv_line_anchor %}
+    logic rd_req;
+    logic wr_req;
+    time rd_issue_time;
+    time wr_issue_time;
+{%- endblock %}
+
+{%- block clocking_dirs %}
+    input rd_req;
+    input wr_req;
+{%- endblock %}
+
+{%- block dut_support %}
+    {% sv_line_anchor %}
+    assign rd_req = dut.cpuif_rd_req;
+    assign wr_req = dut.cpuif_wr_req;
+
+    // Time at which each channel last issued a transfer to the regblock
+    initial forever begin
+        @cb;
+        if(cb.rd_req) rd_issue_time = $time;
+        if(cb.wr_req) wr_issue_time = $time;
+    end
+{%- endblock %}
+
+{% block seq %}
+    {% sv_line_anchor %}
+    time start;
+    time t_rd;
+    time t_wr;
+    time t_both;
+
+    // Transfers are issued without random delays so their timing is exact
+    cpuif.randomize_delays = 1'b0;
+
+    ##1;
+    cb.rst <= '0;
+    ##1;
+
+    // Latency of each channel on its own
+    start = $time;
+    cpuif.write('h0, 'h11);
+    t_wr = $time - start;
+    start = $time;
+    cpuif.assert_read('h0, 'h11);
+    t_rd = $time - start;
+
+    // Overlapping read and write to different registers are issued together
+    start = $time;
+    fork
+        cpuif.write('h4, 'h22);
+        cpuif.assert_read('h0, 'h11);
+    join
+    t_both = $time - start;
+    assert(rd_issue_time == wr_issue_time) else $error("Read issued at %0t and write at %0t", rd_issue_time, wr_issue_time);
+    assert(t_both == ((t_rd > t_wr) ? t_rd : t_wr)) else $error("Overlapping transfers took %0t. Expected %0t", t_both, (t_rd > t_wr) ? t_rd : t_wr);
+
+    // Overlapping bursts on both channels
+    fork
+        for(int i=0; i<8; i++) cpuif.write(i*4, 'h100 + i);
+        for(int i=0; i<8; i++) cpuif.assert_read('h20, 'h0);
+    join
+
+    // A read and a write to the same register take turns, so that a clear on
+    // read does not override the write.
+    // Last transfer issued alone was a write, so the read goes first
+    cpuif.write('h20, 'hAAAA);
+    fork
+        cpuif.write('h20, 'h5555);
+        cpuif.assert_read('h20, 'hAAAA);
+    join
+    assert(rd_issue_time < wr_issue_time) else $error("Expected the read to be issued before the write");
+    @cb;
+    assert(cb.hwif_out.clr.x.value == 'h5555);
+
+    // Last transfer issued alone was a read, so the write goes first
+    cpuif.assert_read('h4, 'h101);
+    fork
+        cpuif.write('h20, 'h7777);
+        cpuif.assert_read('h20, 'h7777);
+    join
+    assert(wr_issue_time < rd_issue_time) else $error("Expected the write to be issued before the read");
+    @cb;
+    assert(cb.hwif_out.clr.x.value == 'h0);
+
+    // Final register values
+    for(int i=0; i<8; i++) begin
+        assert(cb.hwif_out.data[i].x.value == 'h100 + i);
+        cpuif.assert_read(i*4, 'h100 + i);
+    end
+    cpuif.assert_read('h20, 'h0);
+{% endblock %}
@@ -0,0 +1,17 @@
+from parameterized import parameterized_class
+
+from ..lib.cpuifs.axi4lite import AXI4Lite, FlatAXI4Lite
+from ..lib.sim_testcase import SimTestCase
+from ..lib.test_params import get_permutation_class_name, get_permutations
+
+
+@parameterized_class(get_permutations({
+    "cpuif": [AXI4Lite(), FlatAXI4Lite()],
+    "retime_read_fanin": [True, False],
+    "retime_decode": [True, False],
+}), class_name_func=get_permutation_class_name)
+class Test(SimTestCase):
+    dual_issue = True
+
+    def test_dut(self):
+        self.run_test()
@@ -0,0 +1,54 @@
+import os
+import json
+
+from systemrdl import RDLCompiler
+
+from peakrdl_regblock import RegblockExporter
+from peakrdl_regblock.udps import ALL_UDPS
+
+from ..lib.base_testcase import BaseTestCase
+
+class TestExportProfile(BaseTestCase):
+    def setUp(self) -> None:
+        # Start with an empty run dir
+        self.delete_run_dir()
+
+    def export(self, profile: str) -> None:
+        rdlc = RDLCompiler()
+        for udp in ALL_UDPS:
+            rdlc.register_udp(udp)
+        rdlc.compile_file(os.path.join(self.get_testcase_dir(), "../../hdl-src/regblock_udps.rdl"))
+        rdlc.compile_file(os.path.join(self.get_testcase_dir(), "../test_external/regblock.rdl"))
+        root = rdlc.elaborate(None, "regblock")
+        RegblockExporter().export(root, self.get_run_dir(), profile=profile)
+
+    def test_json_report(self) -> None:
+        self.export("json")
+        with open(os.path.join(self.get_run_dir(), "regblock_profile.json"), "r", encoding="utf-8") as f:
+            report = json.load(f)
+
+        stages = [stage["name"] for stage in report["stages"]]
+        self.assertEqual(stages, [
+            "DesignState", "DesignValidator", "generators",
+            "readback", "render package", "render module",
+        ])
+        self.assertIn("FieldLogicGenerator", report["generators"])
+        self.assertIn("DecodeLogicGenerator", report["generators"])
+
+        sections = {section["name"]: section for section in report["sections"]}
+        self.assertGreater(sections["FieldLogicGenerator"]["lines"], 0)
+        self.assertGreater(sections["FieldLogicGenerator"]["bytes"], 0)
+
+        self.assertEqual(report["node_counts"]["AddrmapNode"], 2)
+        self.assertGreater(report["node_counts"]["unrolled RegNode"], report["node_counts"]["RegNode"])
+
+    def test_text_report(self) -> None:
+        self.export("text")
+        with open(os.path.join(self.get_run_dir(), "regblock_profile.txt"), "r", encoding="utf-8") as f:
+            report = f.read()
+        self.assertIn("render module", report)
+        self.assertIn("Peak RSS", report)
+
+    def test_bad_format(self) -> None:
+        with self.assertRaises(ValueError):
+            self.export("xml")
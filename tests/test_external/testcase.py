@@ -4,7 +4,17 @@ from ..lib.cpuifs.apb4 import APB4
 from ..lib.cpuifs.axi4lite import AXI4Lite
 from ..lib.cpuifs.passthrough import Passthrough
 from ..lib.sim_testcase import SimTestCase
-from ..lib.test_params import get_permutation_class_name, get_permutations
+from ..lib.test_params import get_option_class_name, get_permutation_class_name, get_permutations
+
+
+class ExternalTestCase(SimTestCase):
+    extra_tb_files = [
+        "../lib/external_reg.sv",
+        "../lib/external_block.sv",
+    ]
+    init_hwif_in = False
+    clocking_hwif_in = False
+    timeout_clk_cycles = 30000
 
 
 @parameterized_class(get_permutations({
@@ -15,16 +25,34 @@ from ..lib.test_params import get_permutation_class_name, get_permutations
     ],
     "retime_read_fanin": [True, False],
     "retime_read_response": [True, False],
+    "retime_decode": [True, False],
     "retime_external": [True, False],
 }), class_name_func=get_permutation_class_name)
-class Test(SimTestCase):
-    extra_tb_files = [
-        "../lib/external_reg.sv",
-        "../lib/external_block.sv",
-    ]
-    init_hwif_in = False
-    clocking_hwif_in = False
-    timeout_clk_cycles = 30000
+class Test(ExternalTestCase):
+    def test_dut(self):
+        self.run_test()
+
 
+@parameterized_class(
+    get_permutations({"minimize_addr_decode": [True]})
+    + get_permutations({"packed_decode_strobes": [True]})
+    + get_permutations({
+        "retime_read_fanin": [True],
+        "packed_decode_strobes": [True, False],
+        "hier_addr_decode": [True, False],
+    })
+    + get_permutations({"unique_case_decode": [True]})
+    + get_permutations({
+        "and_or_readback": [True],
+        "retime_read_fanin": [True, False],
+    })
+    + get_permutations({
+        "read_fanin_stages": [2, 3],
+        "retime_read_response": [True, False],
+    })
+    + get_permutations({"indexed_array_readback": [True]}),
+    class_name_func=get_option_class_name
+)
+class TestOptions(ExternalTestCase):
     def test_dut(self):
         self.run_test()
@@ -0,0 +1,70 @@
+import os
+
+from peakrdl_regblock.field_logic.generators import FieldLogicGenerator
+
+from ..lib.base_testcase import BaseTestCase
+
+class TestFieldStorageEmitter(BaseTestCase):
+    """
+    The fast-path field storage emitter shall produce output that is identical
+    to the field_storage.sv template it replaces
+    """
+    run_subdir = ""
+
+    def setUp(self) -> None:
+        # Stub usual pre-test setup
+        pass
+
+    def get_run_dir(self) -> str:
+        return os.path.join(super().get_run_dir(), self.run_subdir)
+
+    def export_both(self, rdl_file: str) -> None:
+        self.rdl_file = rdl_file
+        self.run_subdir = os.path.basename(os.path.dirname(rdl_file))
+        self.export_regblock()
+        fast_path = os.path.join(self.get_run_dir(), "regblock.sv")
+
+        self.run_subdir += "_template"
+        FieldLogicGenerator.use_fast_path = False
+        try:
+            self.export_regblock()
+        finally:
+            FieldLogicGenerator.use_fast_path = True
+        template_path = os.path.join(self.get_run_dir(), "regblock.sv")
+
+        with open(fast_path, "r", encoding="utf-8") as f:
+            fast_sv = f.read()
+        with open(template_path, "r", encoding="utf-8") as f:
+            template_sv = f.read()
+        self.assertEqual(fast_sv, template_sv)
+
+    def test_field_types(self) -> None:
+        self.export_both("../test_field_types/regblock.rdl")
+
+    def test_onread_onwrite(self) -> None:
+        self.export_both("../test_onread_onwrite/regblock.rdl")
+
+    def test_hw_access(self) -> None:
+        self.export_both("../test_hw_access/regblock.rdl")
+
+    def test_interrupts(self) -> None:
+        self.export_both("../test_interrupts/regblock.rdl")
+
+    def test_parity(self) -> None:
+        self.export_both("../test_parity/regblock.rdl")
+
+    def test_precedence(self) -> None:
+        self.export_both("../test_precedence/regblock.rdl")
+
+    def test_reset_signals(self) -> None:
+        self.export_both("../test_reset_signals/regblock.rdl")
+
+    def test_singlepulse(self) -> None:
+        self.export_both("../test_singlepulse/regblock.rdl")
+
+    def test_swwe(self) -> None:
+        self.export_both("../test_swwe/regblock.rdl")
+
+    def test_counters(self) -> None:
+        # Counters always use the template. Included to cover mixing of both
+        self.export_both("../test_counter_basics/regblock.rdl")
@@ -0,0 +1,123 @@
+import os
+import json
+import inspect
+import shutil
+from typing import Any
+
+from systemrdl import RDLCompiler
+
+from peakrdl_regblock import RegblockExporter
+from peakrdl_regblock.cpuif.apb4 import APB4_Cpuif
+from peakrdl_regblock.cpuif.axi4lite import AXI4Lite_Cpuif
+from peakrdl_regblock.udps import ALL_UDPS
+
+from ..lib.base_testcase import BaseTestCase
+
+# Arbitrary modification time to detect whether a file was re-written
+OLD_MTIME = 1000000000
+
+class UserTemplate_Cpuif(APB4_Cpuif):
+    template_path = "run.out/user_templates/apb4_tmpl.sv"
+
+class TestIncrementalExport(BaseTestCase):
+    def setUp(self) -> None:
+        # Start with an empty run dir
+        self.delete_run_dir()
+
+    def export(self, rdl_file: str = "regblock.rdl", **kwargs: Any) -> None:
+        rdlc = RDLCompiler()
+        for udp in ALL_UDPS:
+            rdlc.register_udp(udp)
+        rdlc.compile_file(os.path.join(self.get_testcase_dir(), rdl_file))
+        root = rdlc.elaborate("top", "regblock")
+        RegblockExporter().export(
+            root, self.get_run_dir(),
+            incremental=True,
+            generate_hwif_report=True,
+            **kwargs
+        )
+
+    def age_outputs(self) -> None:
+        for filename in os.listdir(self.get_run_dir()):
+            os.utime(os.path.join(self.get_run_dir(), filename), (OLD_MTIME, OLD_MTIME))
+
+    def was_written(self, filename: str) -> bool:
+        return os.path.getmtime(os.path.join(self.get_run_dir(), filename)) != OLD_MTIME
+
+    def test_incremental(self) -> None:
+        self.export()
+        self.assertEqual(
+            sorted(os.listdir(self.get_run_dir())),
+            ["regblock.fingerprint", "regblock.sv", "regblock_hwif.rpt", "regblock_pkg.sv"]
+        )
+
+        # Nothing changed. Generation is skipped
+        self.age_outputs()
+        self.export()
+        self.assertFalse(self.was_written("regblock.fingerprint"))
+        self.assertFalse(self.was_written("regblock.sv"))
+        self.assertFalse(self.was_written("regblock_pkg.sv"))
+        self.assertFalse(self.was_written("regblock_hwif.rpt"))
+
+        # Option change only affects the module
+        self.age_outputs()
+        self.export(cpuif_cls=AXI4Lite_Cpuif)
+        self.assertTrue(self.was_written("regblock.fingerprint"))
+        self.assertTrue(self.was_written("regblock.sv"))
+        self.assertFalse(self.was_written("regblock_pkg.sv"))
+        self.assertFalse(self.was_written("regblock_hwif.rpt"))
+
+        # Design change only affects the module
+        self.age_outputs()
+        self.export(rdl_file="regblock_modified.rdl", cpuif_cls=AXI4Lite_Cpuif)
+        self.assertTrue(self.was_written("regblock.fingerprint"))
+        self.assertTrue(self.was_written("regblock.sv"))
+        self.assertFalse(self.was_written("regblock_pkg.sv"))
+        with open(os.path.join(self.get_run_dir(), "regblock.sv"), "r", encoding="utf-8") as f:
+            self.assertIn("8'h42", f.read())
+
+        # Missing outputs are regenerated
+        os.remove(os.path.join(self.get_run_dir(), "regblock_pkg.sv"))
+        self.age_outputs()
+        self.export(rdl_file="regblock_modified.rdl", cpuif_cls=AXI4Lite_Cpuif)
+        self.assertTrue(self.was_written("regblock_pkg.sv"))
+        self.assertFalse(self.was_written("regblock.sv"))
+
+        # No temporary files are left behind
+        self.assertEqual(
+            sorted(os.listdir(self.get_run_dir())),
+            ["regblock.fingerprint", "regblock.sv", "regblock_hwif.rpt", "regblock_pkg.sv"]
+        )
+
+    def test_profile_up_to_date(self) -> None:
+        self.export(profile="json")
+        os.remove(os.path.join(self.get_run_dir(), "regblock_profile.json"))
+
+        # Report is still written if generation is skipped
+        self.age_outputs()
+        self.export(profile="json")
+        self.assertFalse(self.was_written("regblock.sv"))
+        with open(os.path.join(self.get_run_dir(), "regblock_profile.json"), "r", encoding="utf-8") as f:
+            report = json.load(f)
+        stages = [stage["name"] for stage in report["stages"]]
+        self.assertEqual(stages, ["fingerprint", "DesignState"])
+
+    def test_user_template(self) -> None:
+        template_dir = os.path.join(self.get_testcase_dir(), "run.out/user_templates")
+        os.makedirs(template_dir, exist_ok=True)
+        template_path = os.path.join(template_dir, "apb4_tmpl.sv")
+        shutil.copyfile(
+            os.path.join(os.path.dirname(inspect.getfile(APB4_Cpuif)), "apb4_tmpl.sv"),
+            template_path
+        )
+        self.export(cpuif_cls=UserTemplate_Cpuif)
+
+        # Changing the template regenerates the module
+        self.age_outputs()
+        with open(template_path, "a", encoding="utf-8") as f:
+            f.write("\n// modified template\n")
+        self.export(cpuif_cls=UserTemplate_Cpuif)
+        self.assertTrue(self.was_written("regblock.sv"))
+        self.assertFalse(self.was_written("regblock_pkg.sv"))
+        with open(os.path.join(self.get_run_dir(), "regblock.sv"), "r", encoding="utf-8") as f:
+            self.assertIn("// modified template", f.read())
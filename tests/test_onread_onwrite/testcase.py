@@ -1,5 +1,13 @@
+from ..lib.cpuifs.axi4lite import AXI4Lite
 from ..lib.sim_testcase import SimTestCase
 
 class Test(SimTestCase):
     def test_dut(self):
         self.run_test()
+
+class TestDualIssue(SimTestCase):
+    cpuif = AXI4Lite()
+    dual_issue = True
+
+    def test_dut(self):
+        self.run_test()
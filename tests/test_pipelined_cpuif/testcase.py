@@ -1,6 +1,7 @@
 from parameterized import parameterized_class
 
 from ..lib.cpuifs import ALL_CPUIF
+from ..lib.cpuifs.axi4lite import AXI4Lite, FlatAXI4Lite
 from ..lib.sim_testcase import SimTestCase
 from ..lib.test_params import get_permutation_class_name, get_permutations
 
@@ -9,7 +10,30 @@ from ..lib.test_params import get_permutation_class_name, get_permutations
     "cpuif": ALL_CPUIF,
     "retime_read_fanin": [True, False],
     "retime_read_response": [True, False],
+    "retime_decode": [True, False],
 }), class_name_func=get_permutation_class_name)
 class Test(SimTestCase):
     def test_dut(self):
         self.run_test()
+
+
+@parameterized_class(get_permutations({
+    "cpuif": ALL_CPUIF,
+    "read_fanin_stages": [2, 3],
+}), class_name_func=get_permutation_class_name)
+class TestMultiStageFanin(SimTestCase):
+    def test_dut(self):
+        self.run_test()
+
+
+@parameterized_class(get_permutations({
+    "cpuif": [AXI4Lite(), FlatAXI4Lite()],
+    "retime_read_fanin": [True, False],
+    "retime_read_response": [True, False],
+    "retime_decode": [True, False],
+}), class_name_func=get_permutation_class_name)
+class TestDualIssue(SimTestCase):
+    dual_issue = True
+
+    def test_dut(self):
+        self.run_test()
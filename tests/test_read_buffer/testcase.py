@@ -3,3 +3,17 @@ from ..lib.sim_testcase import SimTestCase
 class Test(SimTestCase):
     def test_dut(self):
         self.run_test()
+
+
+class TestUniqueCaseDecode(SimTestCase):
+    unique_case_decode = True
+
+    def test_dut(self):
+        self.run_test()
+
+
+class TestAndOrReadback(SimTestCase):
+    and_or_readback = True
+
+    def test_dut(self):
+        self.run_test()
@@ -3,7 +3,11 @@
 {%- block declarations %}
     {% sv_line_anchor %}
     localparam REGWIDTH = {{testcase.regwidth}};
+    {%- if testcase.reg_stride %}
+    localparam STRIDE = {{testcase.reg_stride}};
+    {%- else %}
     localparam STRIDE = REGWIDTH/8;
+    {%- endif %}
     localparam N_REGS = {{testcase.n_regs}};
 {%- endblock %}
 
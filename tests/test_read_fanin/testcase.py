@@ -13,12 +13,14 @@ class TestFanin(SimTestCase):
     retime_read_fanin = False
     n_regs = 20
     regwidth = 32
+    reg_stride = 0
 
     @classmethod
     def setUpClass(cls):
         cls.rdl_elab_params = {
             "N_REGS": cls.n_regs,
             "REGWIDTH": cls.regwidth,
+            "REG_STRIDE": cls.reg_stride,
         }
         super().setUpClass()
 
@@ -36,3 +38,37 @@ class TestRetimedFanin(TestFanin):
 
     def test_dut(self):
         self.run_test()
+
+
+PARAMS = get_permutations({
+    "n_regs" : [2, 9, 33],
+    "regwidth" : [8, 32],
+    "read_fanin_stages" : [2, 3],
+})
+@parameterized_class(PARAMS, class_name_func=get_permutation_class_name)
+class TestMultiStageFanin(TestFanin):
+    def test_dut(self):
+        self.run_test()
+
+
+PARAMS = get_permutations({
+    "n_regs" : [9, 33],
+    "max_read_fanin" : [2, 4],
+})
+@parameterized_class(PARAMS, class_name_func=get_permutation_class_name)
+class TestMaxFanin(TestFanin):
+    regwidth = 8
+
+    def test_dut(self):
+        self.run_test()
+
+
+PARAMS = get_permutations({
+    "n_regs" : [3, 9],
+    "reg_stride" : [0x40, 0x104],
+    "read_fanin_stages" : [1, 2],
+})
+@parameterized_class(PARAMS, class_name_func=get_permutation_class_name)
+class TestSparseFanin(TestFanin):
+    def test_dut(self):
+        self.run_test()
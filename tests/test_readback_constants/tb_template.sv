@@ -0,0 +1,42 @@
+{% extends "lib/tb_base.sv" %}
+
+{% block seq %}
+    {% sv_line_anchor %}
+    ##1;
+    cb.rst <= '0;
+    ##1;
+
+    // Constant fields are merged into a single literal
+    cpuif.assert_read('h0, 'h0205_0000);
+
+    // Registers that are all zero are not part of the readback mux
+    cpuif.assert_read('h4, 'h0000_0000);
+
+    // Constant fields mixed with storage
+    cpuif.assert_read('h8, 'h0000_342A);
+    cpuif.write('h8, 'hFFFF_FFFF);
+    cpuif.assert_read('h8, 'h0000_3FFA);
+    assert(cb.hwif_out.mixed.v.value == 'hFF);
+
+    // Bit-swapped constant fields
+    cpuif.assert_read('hC, 'hC8);
+    cpuif.write('hC, 'h10);
+    cpuif.assert_read('hC, 'h18);
+
+    // Constant fields that span subwords of a wide register
+    cpuif.assert_read('h10, 'h3456_7811);
+    cpuif.assert_read('h14, 'h8000_0012);
+    cpuif.write('h10, 'h22);
+    cpuif.assert_read('h10, 'h3456_7822);
+    cpuif.assert_read('h14, 'h8000_0012);
+
+    // Wide register that is all zero
+    cpuif.assert_read('h18, 'h0000_0000);
+    cpuif.assert_read('h1C, 'h0000_0000);
+
+    // Register array that is all zero
+    for(int i=0; i<4; i++) begin
+        cpuif.assert_read('h20 + i*4, 'h0000_0000);
+    end
+
+{% endblock %}
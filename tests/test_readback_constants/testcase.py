@@ -0,0 +1,36 @@
+from parameterized import parameterized_class
+
+from ..lib.sim_testcase import SimTestCase
+from ..lib.test_params import get_permutation_class_name, get_permutations
+
+@parameterized_class(get_permutations({
+    "retime_read_fanin": [True, False],
+    "unique_case_decode": [True, False],
+    "and_or_readback": [True, False],
+}), class_name_func=get_permutation_class_name)
+class Test(SimTestCase):
+    rdl_file = "regblock.rdl"
+
+    def test_dut(self):
+        self.run_test()
+
+
+@parameterized_class(get_permutations({
+    "retime_read_fanin": [True, False],
+}), class_name_func=get_permutation_class_name)
+class TestExternalBlocks(SimTestCase):
+    """
+    All internal registers read back as zero, so only the external block is
+    part of the readback mux
+    """
+    rdl_file = "external_blocks.rdl"
+    tb_template_file = "tb_external_blocks.sv"
+    extra_tb_files = [
+        "../lib/external_block.sv",
+    ]
+    init_hwif_in = False
+    clocking_hwif_in = False
+
+    def test_dut(self):
+        self.run_test()
+
@@ -3,6 +3,7 @@ import os
 from parameterized import parameterized_class
 
 from ..lib.cpuifs import ALL_CPUIF
+from ..lib.cpuifs.axi4lite import AXI4Lite, FlatAXI4Lite
 from ..lib.sim_testcase import SimTestCase
 from ..lib.synth_testcase import SynthTestCase
 from ..lib.test_params import get_permutation_class_name, get_permutations
@@ -37,6 +38,81 @@ class TestDefaultResets(SimTestCase):
 
 
 
+class TestHierAddrDecode(SimTestCase):
+    hier_addr_decode = True
+
+    def test_dut(self):
+        self.run_test()
+
+
+
+@parameterized_class(get_permutations({
+    "hier_addr_decode": [True, False],
+}), class_name_func=get_permutation_class_name)
+class TestMinimizeAddrDecode(SimTestCase):
+    minimize_addr_decode = True
+
+    def test_dut(self):
+        self.run_test()
+
+
+
+@parameterized_class(get_permutations({
+    "retime_decode": [True, False],
+}), class_name_func=get_permutation_class_name)
+class TestPackedDecodeStrobes(SimTestCase):
+    packed_decode_strobes = True
+
+    def test_dut(self):
+        self.run_test()
+
+
+
+@parameterized_class(get_permutations({
+    "retime_read_fanin": [True, False],
+    "packed_decode_strobes": [True, False],
+}), class_name_func=get_permutation_class_name)
+class TestUniqueCaseDecode(SimTestCase):
+    unique_case_decode = True
+
+    def test_dut(self):
+        self.run_test()
+
+
+
+@parameterized_class(get_permutations({
+    "retime_read_fanin": [True, False],
+    "packed_decode_strobes": [True, False],
+}), class_name_func=get_permutation_class_name)
+class TestAndOrReadback(SimTestCase):
+    and_or_readback = True
+
+    def test_dut(self):
+        self.run_test()
+
+
+
+class TestIndexedArrayReadback(SimTestCase):
+    indexed_array_readback = True
+
+    def test_dut(self):
+        self.run_test()
+
+
+
+@parameterized_class(get_permutations({
+    "cpuif": [AXI4Lite(), FlatAXI4Lite()],
+    "retime_decode": [True, False],
+    "packed_decode_strobes": [True, False],
+}), class_name_func=get_permutation_class_name)
+class TestDualIssue(SimTestCase):
+    dual_issue = True
+
+    def test_dut(self):
+        self.run_test()
+
+
+
 @parameterized_class(get_permutations({
     "cpuif": ALL_CPUIF,
     "retime_read_fanin": [True, False],
@@ -115,3 +115,17 @@ class TestValidationErrors(BaseTestCase):
             "signed_enum.rdl",
             "The property is_signed=true is not supported for fields encoded as an enum."
         )
+
+    def test_dual_issue_external(self) -> None:
+        self.dual_issue = True
+        self.assert_validate_error(
+            "dual_issue_external.rdl",
+            "Option dual_issue is not supported in designs that contain external components.",
+        )
+
+    def test_dual_issue_unsupported_cpuif(self) -> None:
+        self.dual_issue = True
+        self.assert_validate_error(
+            "../test_pipelined_cpuif/regblock.rdl",
+            "CPU interface 'APB4_Cpuif' does not support dual_issue.",
+        )
@@ -6,3 +6,11 @@ class Test(SimTestCase):
 
     def test_dut(self):
         self.run_test()
+
+
+class TestPackedDecodeStrobes(SimTestCase):
+    cpuif = Passthrough() # test with bit strobes
+    packed_decode_strobes = True
+
+    def test_dut(self):
+        self.run_test()